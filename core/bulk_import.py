@@ -0,0 +1,158 @@
+"""
+일괄 가져오기
+붙여넣은 텍스트/파일의 VOD·채널 URL을 다운로드 작업 목록으로 변환
+"""
+import re
+from concurrent.futures import ThreadPoolExecutor
+from core.downloader import DownloadTask
+from core.rate_limiter import RateLimitedError
+from utils.logger import get_logger
+from utils.validators import normalize_chzzk_url
+
+
+logger = get_logger(__name__)
+
+
+class ImportResult:
+    """일괄 가져오기 결과"""
+
+    def __init__(self):
+        self.tasks = []  # DownloadTask 목록 (입력 순서, 중복 제거)
+        self.invalid = []  # 치지직 URL이 아닌 항목
+        self.duplicates = 0  # 입력 안의 중복 또는 이미 대기 중인 항목 수
+        self.failed_channels = {}  # 채널 ID -> 오류 메시지
+
+    def summary(self):
+        """결과 요약 문자열"""
+        text = f"추가 {len(self.tasks)}개, 중복 {self.duplicates}개, 잘못된 항목 {len(self.invalid)}개"
+        if self.failed_channels:
+            text += f", 채널 조회 실패 {len(self.failed_channels)}개"
+        return text
+
+
+class BulkImporter:
+    """일괄 가져오기 클래스"""
+
+    def __init__(self, api, max_workers=4):
+        """
+        Args:
+            api: ChzzkAPI 인스턴스
+            max_workers: 동시에 펼칠 채널 수
+        """
+        self.api = api
+        self.max_workers = max_workers
+
+    def parse(self, text):
+        """
+        텍스트에서 URL 추출 및 정규화 (한 번 훑기)
+
+        줄바꿈/공백/쉼표로 구분하며, '#'으로 시작하는 줄은 주석으로 무시한다.
+
+        Returns:
+            tuple: (항목 목록 [(종류, ID, URL)], 잘못된 항목 목록, 중복 수)
+        """
+        items = []
+        invalid = []
+        seen = set()
+        duplicates = 0
+
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            for token in re.split(r'[\s,]+', line):
+                if not token:
+                    continue
+                normalized = normalize_chzzk_url(token)
+                if normalized is None:
+                    invalid.append(token)
+                    continue
+                if normalized[2] in seen:
+                    duplicates += 1
+                    continue
+                seen.add(normalized[2])
+                items.append(normalized)
+
+        return items, invalid, duplicates
+
+    def expand_channels(self, channel_ids):
+        """
+        채널의 전체 VOD 목록 조회 (여러 채널 동시에)
+
+        Returns:
+            tuple: ({채널 ID: VOD 목록}, {채널 ID: 오류 메시지})
+        """
+        expanded = {}
+        failed = {}
+        if not channel_ids:
+            return expanded, failed
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(channel_ids)),
+            thread_name_prefix="BulkImport"
+        ) as executor:
+            futures = {
+                channel_id: executor.submit(self.api.get_channel_vods, channel_id)
+                for channel_id in channel_ids
+            }
+            for channel_id, future in futures.items():
+                try:
+                    expanded[channel_id] = future.result()
+                except RateLimitedError as e:
+                    logger.warning(f"채널 VOD 조회 제한: {channel_id} - {e}")
+                    failed[channel_id] = str(e)
+                except Exception as e:
+                    logger.error(f"채널 VOD 조회 실패: {channel_id} - {e}")
+                    failed[channel_id] = str(e)
+
+        return expanded, failed
+
+    def build_tasks(self, text, quality='best', output_path='downloads', skip_urls=()):
+        """
+        텍스트를 다운로드 작업 목록으로 변환
+
+        Args:
+            text: URL이 담긴 텍스트
+            quality: 화질
+            output_path: 저장 경로
+            skip_urls: 이미 대기/진행 중이라 건너뛸 VOD URL
+
+        Returns:
+            ImportResult: 결과
+        """
+        result = ImportResult()
+        items, result.invalid, result.duplicates = self.parse(text)
+
+        channel_ids = [item_id for kind, item_id, _ in items if kind == 'channel']
+        expanded, result.failed_channels = self.expand_channels(channel_ids)
+
+        # 직접 입력한 VOD는 인덱스에 있는 제목 사용
+        video_ids = [item_id for kind, item_id, _ in items if kind == 'video']
+        titles = self.api.get_vod_titles(video_ids)
+
+        seen = set(skip_urls)
+        for kind, item_id, url in items:
+            if kind == 'video':
+                entries = [(url, titles.get(int(item_id)) if item_id.isdigit() else None, item_id)]
+            else:
+                # 채널은 오래된 VOD부터 받도록 역순
+                entries = [
+                    (f"https://chzzk.naver.com/video/{vod.get('videoNo')}",
+                     vod.get('videoTitle'), vod.get('videoNo'))
+                    for vod in reversed(expanded.get(item_id, []))
+                ]
+
+            for vod_url, title, video_no in entries:
+                if vod_url in seen:
+                    result.duplicates += 1
+                    continue
+                seen.add(vod_url)
+                result.tasks.append(DownloadTask(
+                    vod_url=vod_url,
+                    title=title or f"치지직 VOD {video_no}",
+                    quality=quality,
+                    output_path=output_path
+                ))
+
+        logger.info(f"일괄 가져오기: {result.summary()}")
+        return result
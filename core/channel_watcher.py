@@ -0,0 +1,229 @@
+"""
+채널 감시
+여러 채널을 주기적으로 확인하여 새 VOD를 다운로드 큐에 추가
+"""
+import heapq
+import random
+import threading
+import time
+from collections import OrderedDict
+from core.downloader import DownloadTask
+from core.rate_limiter import RateLimitedError, TokenBucket
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# 중복 추가를 막기 위해 기억할 최근 추가 VOD 수
+ENQUEUED_HISTORY = 1000
+
+
+class ChannelWatcher:
+    """채널 감시 클래스
+
+    스레드 하나가 채널별 다음 확인 시각을 힙으로 관리하므로
+    채널 수와 관계없이 스레드 수가 늘지 않는다.
+    """
+
+    def __init__(self, api, downloader, quality='best', output_path='downloads',
+                 interval=600, jitter=0.2, requests_per_minute=30, auto_enqueue=True,
+                 on_enqueue=None, clock=time.monotonic, sleep=time.sleep, rng=None):
+        """
+        Args:
+            api: ChzzkAPI 인스턴스
+            downloader: 새 VOD를 추가할 Downloader
+            quality: 다운로드 화질
+            output_path: 다운로드 경로
+            interval: 채널별 확인 주기 (초)
+            jitter: 주기에 더할 무작위 비율 (0.2 = ±20%)
+            requests_per_minute: 모든 채널이 공유하는 분당 API 요청 수
+            auto_enqueue: False면 새 VOD를 인덱스에만 반영
+            on_enqueue: 작업 추가 후 호출할 콜백 (task)
+            clock: 시간 함수 (테스트용으로 교체 가능)
+            sleep: 대기 함수
+            rng: random.Random 인스턴스
+        """
+        self.api = api
+        self.downloader = downloader
+        self.quality = quality
+        self.output_path = output_path
+        self.interval = interval
+        self.jitter = jitter
+        self.auto_enqueue = auto_enqueue
+        self.on_enqueue = on_enqueue
+        self.clock = clock
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+        self.budget = TokenBucket(requests_per_minute / 60.0, requests_per_minute, clock)
+
+        self._schedule = []  # (다음 확인 시각, 순번, 채널 ID)
+        self._channels = set()
+        self._enqueued = OrderedDict()  # 최근 추가한 videoNo (ENQUEUED_HISTORY개까지)
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self.is_running = False
+
+    def add_channel(self, channel_id, delay=None):
+        """
+        감시할 채널 추가
+
+        Args:
+            channel_id: 채널 ID
+            delay: 첫 확인까지의 시간 (None이면 주기 내 무작위)
+        """
+        with self._lock:
+            if channel_id in self._channels:
+                return
+            self._channels.add(channel_id)
+            if delay is None:
+                # 시작 시 모든 채널이 한꺼번에 확인되지 않도록 분산
+                delay = self.rng.uniform(0, self.interval)
+            self._push(channel_id, self.clock() + delay)
+        self._wake.set()
+        logger.info(f"감시 채널 추가: {channel_id}")
+
+    def remove_channel(self, channel_id):
+        """감시 채널 제거 (힙의 항목은 꺼낼 때 무시)"""
+        with self._lock:
+            self._channels.discard(channel_id)
+        logger.info(f"감시 채널 제거: {channel_id}")
+
+    def get_channels(self):
+        """감시 중인 채널 목록"""
+        with self._lock:
+            return sorted(self._channels)
+
+    def start(self):
+        """감시 스레드 시작"""
+        if self.is_running:
+            return
+        self.is_running = True
+        self._thread = threading.Thread(target=self._run, name="ChannelWatcher", daemon=True)
+        self._thread.start()
+        logger.info(f"채널 감시 시작: {len(self._channels)}개 채널")
+
+    def stop(self):
+        """감시 스레드 중지"""
+        self.is_running = False
+        self._wake.set()
+        logger.info("채널 감시 중지")
+
+    def run_pending(self):
+        """
+        확인 시각이 된 채널을 요청 예산 안에서 처리
+
+        Returns:
+            float: 다음 처리까지 기다릴 시간 (초), 채널이 없으면 None
+        """
+        while True:
+            with self._lock:
+                if not self._schedule:
+                    return None
+                due, _, channel_id = self._schedule[0]
+                if channel_id not in self._channels:
+                    heapq.heappop(self._schedule)
+                    continue
+                wait = due - self.clock()
+                if wait > 0:
+                    return wait
+                if not self.budget.try_acquire():
+                    return self.budget.time_until_available()
+                heapq.heappop(self._schedule)
+
+            self._poll(channel_id)
+
+            with self._lock:
+                if channel_id in self._channels:
+                    self._push(channel_id, self.clock() + self._next_interval())
+
+    def _run(self):
+        """감시 루프"""
+        while self.is_running:
+            try:
+                wait = self.run_pending()
+            except Exception as e:
+                logger.error(f"채널 감시 오류: {e}")
+                wait = self.interval
+            self._wake.wait(timeout=wait)
+            self._wake.clear()
+
+    def _poll(self, channel_id):
+        """
+        채널 하나 확인 (첫 페이지 요청은 run_pending에서 예산을 차감)
+
+        sync_channel의 반환값은 목록 로드/검색 등 다른 호출이 먼저 동기화하면 비어 있으므로,
+        새 VOD는 인덱스에서 감시 전용 기준점(watch_state) 이후의 VOD로 판단한다.
+        """
+        index = self.api.vod_index
+        try:
+            if not self.api.has_sync_baseline(channel_id):
+                # 처음 확인한 채널은 첫 페이지만 받음 (전체 수집은 하지 않음)
+                self.api.sync_channel(channel_id, max_pages=1)
+            else:
+                self.api.sync_channel(channel_id, before_request=self._charge_request)
+        except RateLimitedError as e:
+            logger.warning(f"채널 확인 보류: {channel_id} - {e}")
+            return
+        except Exception as e:
+            logger.error(f"채널 확인 실패: {channel_id} - {e}")
+            return
+
+        cursor = index.get_watch_cursor(channel_id)
+        if cursor is None:
+            # 처음 감시하는 채널은 현재 최신 VOD를 기준점으로만 저장
+            newest = index.search(channel_id, limit=1)
+            if newest:
+                index.set_watch_cursor(channel_id, newest[0]['videoNo'], newest[0].get('publishDate', ''))
+            return
+
+        new_vods = index.newer_than(channel_id, *cursor)
+        if not new_vods:
+            return
+        index.set_watch_cursor(channel_id, new_vods[0]['videoNo'], new_vods[0].get('publishDate', ''))
+
+        logger.info(f"새 VOD 발견: {channel_id} ({len(new_vods)}개)")
+        if not self.auto_enqueue:
+            return
+
+        # 오래된 것부터 추가
+        for vod in reversed(new_vods):
+            video_no = vod.get('videoNo')
+            if video_no in self._enqueued:
+                continue
+            self._enqueued[video_no] = True
+            if len(self._enqueued) > ENQUEUED_HISTORY:
+                self._enqueued.popitem(last=False)
+
+            task = DownloadTask(
+                vod_url=f"https://chzzk.naver.com/video/{video_no}",
+                title=vod.get('videoTitle', 'Unknown'),
+                quality=self.quality,
+                output_path=self.output_path
+            )
+            self.downloader.add_download(task)
+            if self.on_enqueue:
+                try:
+                    self.on_enqueue(task)
+                except Exception as e:
+                    logger.error(f"감시 콜백 오류: {e}")
+
+    def _charge_request(self, page):
+        """두 번째 페이지부터 요청마다 예산 차감 (부족하면 보충될 때까지 대기)"""
+        if page == 0:
+            return
+        with self._lock:
+            wait = self.budget.reserve()
+        if wait > 0:
+            self.sleep(wait)
+
+    def _push(self, channel_id, due):
+        """힙에 항목 추가 (락 안에서 호출)"""
+        self._seq += 1
+        heapq.heappush(self._schedule, (due, self._seq, channel_id))
+
+    def _next_interval(self):
+        """지터가 적용된 다음 주기"""
+        spread = self.interval * self.jitter
+        return self.interval + self.rng.uniform(-spread, spread)
@@ -2,21 +2,48 @@
 치지직 API 래퍼
 yt-dlp를 사용하여 치지직 VOD 정보 추출
 """
-import yt_dlp
+import os
+import threading
 import requests
-from utils.logger import logger
+from core.http_cache import HTTPCache
+from core.rate_limiter import RateLimitedError
+from core.singleflight import SingleFlight
+from core.vod_index import VODIndex
+from utils.logger import get_logger
+from utils.tracing import traced
 from utils.validators import extract_channel_id, extract_video_id
 
 
+logger = get_logger(__name__)
+
+DEFAULT_BASE_URL = "https://api.chzzk.naver.com/service/v1"
+
+
 class ChzzkAPI:
     """치지직 API 클래스"""
 
-    def __init__(self):
-        self.base_url = "https://api.chzzk.naver.com/service/v1"
+    def __init__(self, cache_dir='cache', cache_ttl=300, base_url=None):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+            cache_ttl: API 응답 캐시 유지 시간 (초)
+            base_url: API 주소 (None이면 CHZZK_API_BASE_URL 환경 변수 또는 실제 API)
+        """
+        self.base_url = (base_url or os.environ.get('CHZZK_API_BASE_URL') or DEFAULT_BASE_URL).rstrip('/')
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        self.http_cache = HTTPCache(
+            self.session,
+            cache_dir=os.path.join(cache_dir, 'http'),
+            ttl=cache_ttl
+        )
+        self.vod_index = VODIndex(os.path.join(cache_dir, 'vod_index.db'))
+        # 동시에 들어온 같은 요청은 한 번만 실행
+        self._flight = SingleFlight()
+        self._crawl_threads = {}  # 채널 ID -> 백그라운드 수집 스레드
+        self._crawl_lock = threading.Lock()
 
     def get_channel_info(self, channel_url):
         """
@@ -25,15 +52,20 @@ class ChzzkAPI:
         Returns:
             dict: 채널 정보 (이름, ID, 프로필 이미지 등)
         """
-        try:
-            channel_id = extract_channel_id(channel_url)
-            if not channel_id:
-                logger.error("채널 ID 추출 실패")
-                return None
+        channel_id = extract_channel_id(channel_url)
+        if not channel_id:
+            logger.error("채널 ID 추출 실패")
+            return None
 
+        return self._flight.do(('channel_info', channel_id), self._fetch_channel_info, channel_id)
+
+    @traced('api.channel_info', cat='api')
+    def _fetch_channel_info(self, channel_id):
+        """채널 정보 요청"""
+        try:
             # 치지직 API 엔드포인트
             url = f"{self.base_url}/channels/{channel_id}"
-            response = self.session.get(url)
+            response = self.http_cache.get(url)
 
             if response.status_code == 200:
                 data = response.json()
@@ -43,11 +75,13 @@ class ChzzkAPI:
                 logger.error(f"채널 정보 조회 실패: {response.status_code}")
                 return None
 
+        except RateLimitedError:
+            raise
         except Exception as e:
             logger.error(f"채널 정보 조회 오류: {e}")
             return None
 
-    def get_vod_list(self, channel_id, page=0, size=30):
+    def get_vod_list(self, channel_id, page=0, size=30, fresh=False):
         """
         VOD 목록 가져오기
 
@@ -55,10 +89,19 @@ class ChzzkAPI:
             channel_id: 채널 ID
             page: 페이지 번호
             size: 페이지당 항목 수
+            fresh: True면 캐시를 그대로 쓰지 않고 항상 서버에 확인 (304일 때만 캐시 사용)
 
         Returns:
             list: VOD 목록
         """
+        return self._flight.do(
+            ('vod_list', channel_id, page, size, fresh),
+            self._fetch_vod_list, channel_id, page, size, fresh
+        )
+
+    @traced('api.vod_list', cat='api')
+    def _fetch_vod_list(self, channel_id, page, size, fresh=False):
+        """VOD 목록 요청"""
         try:
             url = f"{self.base_url}/channels/{channel_id}/videos"
             params = {
@@ -67,21 +110,36 @@ class ChzzkAPI:
                 'sortType': 'LATEST'
             }
 
-            response = self.session.get(url, params=params)
+            if fresh:
+                response = self.http_cache.get(url, params=params, ttl=0, allow_stale=False)
+            else:
+                response = self.http_cache.get(url, params=params)
 
             if response.status_code == 200:
                 data = response.json()
                 vod_list = data.get('content', {}).get('data', [])
+                self.vod_index.add_vods(channel_id, vod_list)
                 logger.info(f"VOD 목록 조회 성공: {len(vod_list)}개")
                 return vod_list
             else:
                 logger.error(f"VOD 목록 조회 실패: {response.status_code}")
                 return []
 
+        except RateLimitedError:
+            raise
         except Exception as e:
             logger.error(f"VOD 목록 조회 오류: {e}")
             return []
 
+    def get_cache_stats(self):
+        """
+        응답 캐시 통계
+
+        Returns:
+            dict: hit, miss, revalidated, stale 횟수
+        """
+        return self.http_cache.get_stats()
+
     def get_vod_info_with_ytdlp(self, vod_url):
         """
         yt-dlp를 사용하여 VOD 정보 가져오기
@@ -92,6 +150,14 @@ class ChzzkAPI:
         Returns:
             dict: VOD 정보 (제목, 스트림 URL, 포맷 등)
         """
+        return self._flight.do(('vod_info', vod_url), self._extract_vod_info, vod_url)
+
+    @traced('api.extract_vod_info', cat='api')
+    def _extract_vod_info(self, vod_url):
+        """yt-dlp 정보 추출"""
+        # yt-dlp는 import가 무거우므로 처음 사용할 때 로드
+        import yt_dlp
+
         try:
             ydl_opts = {
                 'quiet': True,
@@ -149,32 +215,295 @@ class ChzzkAPI:
             logger.error(f"포맷 조회 오류: {e}")
             return []
 
-    def search_vods(self, channel_id, keyword, page=0, size=30):
+    def get_vod_page(self, channel_id, page=0, size=50):
+        """
+        VOD 목록 한 페이지 (전체 수집된 채널은 인덱스, 아니면 API)
+
+        Args:
+            channel_id: 채널 ID
+            page: 페이지 번호
+            size: 페이지당 항목 수
+
+        Returns:
+            list: VOD 목록
+        """
+        if self.is_channel_synced(channel_id):
+            return self.get_stored_vods(channel_id, page=page, size=size)
+        return self.get_vod_list(channel_id, page=page, size=size)
+
+    @traced('api.crawl_channel', cat='api')
+    def crawl_channel(self, channel_id, size=50, max_pages=None, start_page=0, fresh=False,
+                      before_request=None):
+        """
+        채널의 전체 VOD를 페이지 단위로 수집하여 인덱스에 저장
+
+        끝 페이지까지 받으면 채널을 전체 수집 완료로 표시한다.
+
+        Args:
+            channel_id: 채널 ID
+            size: 페이지당 항목 수
+            max_pages: 최대 페이지 수 (None이면 끝까지)
+            start_page: 시작 페이지 (0이 아니면 최신 VOD 기준점은 바꾸지 않음)
+            fresh: True면 캐시를 그대로 쓰지 않고 서버에 확인
+            before_request: 페이지 요청 전에 페이지 번호로 호출할 함수
+
+        Returns:
+            int: 수집한 VOD 수
+        """
+        total = 0
+        page = start_page
+        newest = None
+        reached_end = False
+        while max_pages is None or page - start_page < max_pages:
+            if before_request:
+                before_request(page)
+            vod_list = self.get_vod_list(channel_id, page=page, size=size, fresh=fresh)
+            if page == 0 and vod_list:
+                newest = vod_list[0]
+            total += len(vod_list)
+            if len(vod_list) < size:
+                reached_end = True
+                break
+            page += 1
+
+        if newest:
+            self.vod_index.set_sync_state(
+                channel_id, newest.get('videoNo'), newest.get('publishDate', ''),
+                complete=reached_end
+            )
+        elif reached_end:
+            self.vod_index.mark_sync_complete(channel_id)
+
+        logger.info(f"채널 수집 {'완료' if reached_end else '중단'}: {channel_id} ({total}개)")
+        return total
+
+    def resume_crawl(self, channel_id, size=50):
+        """
+        전체 수집이 끝나지 않은 채널을 이어서 수집
+
+        새 VOD를 먼저 동기화한 뒤 인덱스에 저장된 개수 다음 페이지부터 끝까지 받는다.
+        VOD는 최신순으로 앞에서부터 쌓이므로 저장된 개수가 곧 이어 받을 위치다.
+
+        Args:
+            channel_id: 채널 ID
+            size: 페이지당 항목 수
+
+        Returns:
+            int: 수집한 VOD 수 (이미 전체 수집된 채널은 0)
+        """
+        return self._flight.do(('resume_crawl', channel_id, size), self._resume_crawl, channel_id, size)
+
+    def _resume_crawl(self, channel_id, size):
+        """이어서 수집 실행"""
+        if self.is_channel_synced(channel_id):
+            return 0
+        # 캐시된 앞 페이지와 새로 받은 뒤 페이지 사이에 새 VOD가 끼면 경계의 VOD를 놓치므로 항상 서버에 확인
+        if not self.has_sync_baseline(channel_id):
+            return self.crawl_channel(channel_id, size=size, fresh=True)
+
+        self.sync_channel(channel_id, size=size)
+        start_page = self.vod_index.count(channel_id) // size
+        logger.info(f"채널 수집 재개: {channel_id} ({start_page}페이지부터)")
+        return self.crawl_channel(channel_id, size=size, start_page=start_page, fresh=True)
+
+    def crawl_in_background(self, channel_id, size=50):
+        """
+        resume_crawl을 백그라운드 스레드에서 실행 (같은 채널이 이미 수집 중이면 그 스레드 반환)
+
+        Returns:
+            threading.Thread: 수집 스레드
+        """
+        with self._crawl_lock:
+            thread = self._crawl_threads.get(channel_id)
+            if thread is None or not thread.is_alive():
+                thread = threading.Thread(
+                    target=self._crawl_worker, args=(channel_id, size),
+                    name=f"ChannelCrawl-{channel_id}", daemon=True
+                )
+                self._crawl_threads[channel_id] = thread
+                thread.start()
+        return thread
+
+    def _crawl_worker(self, channel_id, size):
+        """백그라운드 수집 실행"""
+        try:
+            self.resume_crawl(channel_id, size=size)
+        except Exception as e:
+            logger.warning(f"백그라운드 채널 수집 실패: {channel_id} - {e}")
+        finally:
+            with self._crawl_lock:
+                if self._crawl_threads.get(channel_id) is threading.current_thread():
+                    del self._crawl_threads[channel_id]
+
+    def sync_channel(self, channel_id, size=30, max_pages=None, before_request=None):
+        """
+        마지막으로 본 VOD 이후의 새 VOD만 가져오기
+
+        최신순으로 페이지를 넘기다가 이미 알고 있는 VOD를 만나면 멈춘다.
+        처음 동기화하는 채널은 max_pages까지 수집한다.
+        캐시에 있는 목록은 서버가 304로 확인해 준 경우에만 사용한다.
+
+        Args:
+            channel_id: 채널 ID
+            size: 페이지당 항목 수
+            max_pages: 최대 페이지 수 (None이면 제한 없음)
+            before_request: 페이지 요청 전에 페이지 번호로 호출할 함수 (호출자의 요청 예산 차감용)
+
+        Returns:
+            list: 새로 발견한 VOD 목록 (최신순)
+        """
+        return self._flight.do(
+            ('sync', channel_id, size, max_pages),
+            self._sync_channel, channel_id, size, max_pages, before_request
+        )
+
+    @traced('api.sync_channel', cat='api')
+    def _sync_channel(self, channel_id, size, max_pages, before_request=None):
+        """채널 동기화 실행"""
+        state = self.vod_index.get_sync_state(channel_id)
+        if not state:
+            self.crawl_channel(
+                channel_id, size=size, max_pages=max_pages, fresh=True, before_request=before_request
+            )
+            return self.vod_index.search(channel_id)
+
+        known_video_no = state['newest_video_no']
+        known_date = state['newest_publish_date']
+
+        new_vods = []
+        page = 0
+        reached_known = False
+        while max_pages is None or page < max_pages:
+            if before_request:
+                before_request(page)
+            vod_list = self.get_vod_list(channel_id, page=page, size=size, fresh=True)
+            for vod in vod_list:
+                publish_date = vod.get('publishDate', '')
+                # 마지막 VOD가 삭제되었을 수 있으므로 날짜로도 판단
+                if vod.get('videoNo') == known_video_no or (known_date and publish_date <= known_date):
+                    reached_known = True
+                    break
+                new_vods.append(vod)
+
+            if reached_known or len(vod_list) < size:
+                break
+            page += 1
+
+        if new_vods:
+            newest = new_vods[0]
+            self.vod_index.set_sync_state(
+                channel_id, newest.get('videoNo'), newest.get('publishDate', '')
+            )
+        else:
+            self.vod_index.set_sync_state(channel_id, known_video_no, known_date)
+
+        logger.info(f"채널 동기화 완료: {channel_id} (새 VOD {len(new_vods)}개, 요청 {page + 1}회)")
+        return new_vods
+
+    def has_sync_baseline(self, channel_id):
+        """새 VOD를 판단할 기준점(마지막으로 본 최신 VOD)이 있는지 여부"""
+        return self.vod_index.get_sync_state(channel_id) is not None
+
+    def is_channel_synced(self, channel_id):
+        """채널 전체를 인덱스에 수집했는지 여부"""
+        state = self.vod_index.get_sync_state(channel_id)
+        return bool(state and state['complete'])
+
+    def get_stored_vods(self, channel_id, page=0, size=50):
         """
-        VOD 검색
+        인덱스에 저장된 VOD 목록 (최신순)
+
+        Args:
+            channel_id: 채널 ID
+            page: 페이지 번호
+            size: 페이지당 항목 수
+
+        Returns:
+            list: VOD 목록
+        """
+        return self.vod_index.search(channel_id, limit=size, offset=page * size)
+
+    def get_channel_vods(self, channel_id):
+        """
+        채널의 전체 VOD 목록 (동기화 후 인덱스에서 조회, 최신순)
+
+        전체 수집이 끝나지 않은 채널은 (중단된 곳부터) 끝까지 수집한다.
+
+        Args:
+            channel_id: 채널 ID
+
+        Returns:
+            list: VOD 목록
+        """
+        if self.is_channel_synced(channel_id):
+            self.sync_channel(channel_id)
+        else:
+            # 새 VOD 동기화도 함께 함
+            self.resume_crawl(channel_id)
+        return self.vod_index.search(channel_id)
+
+    def get_vod_titles(self, video_nos):
+        """
+        인덱스에 저장된 VOD 제목 조회
+
+        Returns:
+            dict: videoNo -> 제목
+        """
+        return self.vod_index.get_titles(video_nos)
+
+    @traced('api.search_vods', cat='api')
+    def search_vods(self, channel_id, keyword, page=0, size=30, sort='date',
+                    descending=True, min_duration=None, max_duration=None, downloaded=None):
+        """
+        VOD 검색 (로컬 인덱스)
+
+        전체 수집이 끝나지 않은 채널은 지금까지 인덱스에 있는 VOD에서 찾아 바로 반환하고
+        (인덱스가 비어 있으면 첫 페이지만 먼저 받음), 나머지는 백그라운드에서 수집한다.
+        수집이 끝났는지는 is_channel_synced()로 확인한다.
 
         Args:
             channel_id: 채널 ID
             keyword: 검색 키워드
             page: 페이지 번호
             size: 페이지당 항목 수
+            sort: 정렬 기준 ('date', 'duration', 'title')
+            descending: 내림차순 여부
+            min_duration: 최소 길이 (초)
+            max_duration: 최대 길이 (초)
+            downloaded: 다운로드 여부 필터 (None이면 전체)
 
         Returns:
             list: 검색 결과
         """
         try:
-            # 전체 VOD 목록 가져오기
-            all_vods = self.get_vod_list(channel_id, page, size)
-
-            # 키워드로 필터링
-            filtered_vods = [
-                vod for vod in all_vods
-                if keyword.lower() in vod.get('videoTitle', '').lower()
-            ]
+            if not self.is_channel_synced(channel_id):
+                if self.vod_index.count(channel_id) == 0:
+                    self.get_vod_list(channel_id, page=0, size=50)
+                self.crawl_in_background(channel_id)
+
+            filtered_vods = self.vod_index.search(
+                channel_id, keyword,
+                sort=sort,
+                descending=descending,
+                min_duration=min_duration,
+                max_duration=max_duration,
+                downloaded=downloaded,
+                limit=size,
+                offset=page * size
+            )
 
             logger.info(f"검색 결과: {len(filtered_vods)}개")
             return filtered_vods
 
+        except RateLimitedError:
+            raise
         except Exception as e:
             logger.error(f"VOD 검색 오류: {e}")
             return []
+
+    def mark_downloaded(self, video_no):
+        """다운로드 완료된 VOD 표시"""
+        try:
+            self.vod_index.mark_downloaded(video_no)
+        except Exception as e:
+            logger.error(f"다운로드 표시 오류: {e}")
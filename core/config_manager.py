@@ -3,16 +3,38 @@
 """
 import json
 import os
-from utils.logger import logger
+import threading
+import time
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# 마지막 변경 후 저장까지 기다리는 시간 (초)
+SAVE_DELAY = 0.5
 
 
 class ConfigManager:
     """설정 파일 관리 클래스"""
 
-    def __init__(self, config_file='config.json'):
+    def __init__(self, config_file='config.json', save_delay=SAVE_DELAY):
+        """
+        Args:
+            config_file: 설정 파일 경로
+            save_delay: 변경을 모아 저장할 때까지 기다리는 시간 (초)
+        """
         self.config_file = config_file
+        self.save_delay = save_delay
         self.config = self.load_config()
 
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # 저장 순서 보장
+        self._save_cond = threading.Condition(self._lock)
+        self._save_deadline = None  # 저장 예정 시각 (None이면 저장할 변경 없음)
+        self._writer = None
+        self._closed = False
+        self._listeners = []  # (callback, keys)
+
     def load_config(self):
         """설정 파일 로드"""
         try:
@@ -29,14 +51,34 @@ class ConfigManager:
             return self.get_default_config()
 
     def save_config(self):
-        """설정 파일 저장"""
+        """
+        설정 파일 즉시 저장
+
+        임시 파일에 쓴 뒤 교체하므로 저장 중에 종료되어도 기존 파일이 유지된다.
+        """
+        with self._write_lock:
+            with self._lock:
+                self._save_deadline = None
+                data = json.dumps(self.config, indent=4, ensure_ascii=False)
+            return self._write_file(data)
+
+    def _write_file(self, data):
+        """임시 파일에 쓴 뒤 설정 파일과 교체"""
+        tmp_path = f'{self.config_file}.{threading.get_ident()}.tmp'
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_file)
             logger.info(f"설정 파일 저장 성공: {self.config_file}")
             return True
         except Exception as e:
             logger.error(f"설정 파일 저장 실패: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             return False
 
     def get(self, key, default=None):
@@ -44,9 +86,102 @@ class ConfigManager:
         return self.config.get(key, default)
 
     def set(self, key, value):
-        """설정 값 설정"""
-        self.config[key] = value
-        self.save_config()
+        """설정 값 설정 (파일 저장은 백그라운드에서)"""
+        self.update({key: value})
+
+    def update(self, values):
+        """
+        여러 설정 값을 한 번에 변경
+
+        바뀐 값이 있으면 리스너에 알리고, save_delay 동안 추가 변경을 모아
+        백그라운드 스레드에서 한 번만 저장한다.
+
+        Args:
+            values: {키: 값} 딕셔너리
+        """
+        with self._lock:
+            changed = {
+                key: value for key, value in values.items()
+                if key not in self.config or self.config[key] != value
+            }
+            if not changed:
+                return
+            self.config.update(changed)
+            self._schedule_save()
+            listeners = list(self._listeners)
+
+        for callback, keys in listeners:
+            relevant = changed if keys is None else {
+                key: value for key, value in changed.items() if key in keys
+            }
+            if not relevant:
+                continue
+            try:
+                callback(relevant)
+            except Exception as e:
+                logger.error(f"설정 변경 알림 오류: {e}")
+
+    def add_listener(self, callback, keys=None):
+        """
+        설정 변경 리스너 등록
+
+        Args:
+            callback: 바뀐 값의 {키: 값} 딕셔너리를 받을 함수 (변경한 스레드에서 호출)
+            keys: 관심 있는 키 목록 (None이면 모든 키)
+        """
+        with self._lock:
+            self._listeners.append((callback, set(keys) if keys is not None else None))
+
+    def remove_listener(self, callback):
+        """설정 변경 리스너 제거"""
+        with self._lock:
+            self._listeners = [
+                (cb, keys) for cb, keys in self._listeners if cb is not callback
+            ]
+
+    def flush(self):
+        """저장 대기 중인 변경이 있으면 즉시 저장"""
+        with self._lock:
+            pending = self._save_deadline is not None
+        if pending:
+            self.save_config()
+
+    def close(self):
+        """대기 중인 변경 저장 후 저장 스레드 종료"""
+        with self._lock:
+            self._closed = True
+            self._save_cond.notify_all()
+        self.flush()
+
+    def _schedule_save(self):
+        """저장 예약 (self._lock을 잡은 상태에서 호출)"""
+        self._save_deadline = time.monotonic() + self.save_delay
+        if self._closed:
+            return
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._writer_loop,
+                name="ConfigWriter",
+                daemon=True
+            )
+            self._writer.start()
+        self._save_cond.notify_all()
+
+    def _writer_loop(self):
+        """저장 스레드 (마지막 변경 후 save_delay가 지나면 저장)"""
+        while True:
+            with self._lock:
+                while not self._closed:
+                    if self._save_deadline is None:
+                        self._save_cond.wait()
+                        continue
+                    remaining = self._save_deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._save_cond.wait(remaining)
+                if self._closed:
+                    return
+            self.save_config()
 
     def get_default_config(self):
         """기본 설정 반환"""
@@ -54,11 +189,18 @@ class ConfigManager:
             "channel_url": "https://chzzk.naver.com/23d5909c6b808d80ee28a9a2d509fecc",
             "download_path": "downloads",
             "max_concurrent_downloads": 3,
+            "download_history_limit": 500,
+            "download_rate_limit": 0,
+            "daemon_port": 47651,
             "default_quality": "best",
             "theme": "dark",
             "language": "ko",
             "auto_start_download": False,
-            "notification_enabled": True
+            "watched_channels": [],
+            "watch_interval_seconds": 600,
+            "watch_requests_per_minute": 30,
+            "notification_enabled": True,
+            "log_levels": {}
         }
 
     def ensure_download_path(self):
@@ -0,0 +1,583 @@
+"""
+다운로드 데몬
+하나의 Downloader를 로컬 HTTP API로 공유하여 여러 GUI/스크립트가
+같은 대기열, 동시 다운로드 수, 속도 제한을 쓰도록 함
+
+API (127.0.0.1 전용, 요청/응답 본문은 JSON, Host는 127.0.0.1:<포트> 또는 localhost:<포트>만 허용):
+    GET  /tasks          작업 목록
+    POST /tasks          작업 추가 {"tasks": [{"vod_url", "title", "quality", "output_path"}]}
+                         (치지직 VOD URL만, output_path는 데몬의 다운로드 경로 안쪽만)
+    POST /tasks/cancel   작업 중지 {"vod_url"}
+    POST /tasks/remove   작업 제거 {"vod_url"}
+    POST /history/clear  끝난 작업 기록 삭제
+    GET  /settings       설정 조회
+    POST /settings       설정 변경 {"max_concurrent", "rate_limit"}
+    GET  /events         진행 상황 스트림 (Server-Sent Events)
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+import requests
+from core.downloader import DownloadTask
+from utils.logger import get_logger
+from utils.validators import normalize_chzzk_url
+
+
+logger = get_logger(__name__)
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 47651
+# 끝난 작업을 목록에 남겨 둘 개수
+FINISHED_TASK_LIMIT = 500
+# 이벤트가 없을 때 연결 확인용 주석을 보내는 간격 (초)
+KEEPALIVE_INTERVAL = 15
+# 클라이언트의 이벤트 스트림 재연결 대기 시간 (초)
+RECONNECT_DELAY = 2
+
+FINISHED_STATUSES = ('completed', 'failed', 'cancelled')
+# 설정으로 바꿀 수 있는 최대 동시 다운로드 수
+MAX_CONCURRENT_LIMIT = 16
+
+
+def default_url(port=DEFAULT_PORT):
+    """기본 데몬 주소"""
+    return f'http://{DEFAULT_HOST}:{port}'
+
+
+class EventChannel:
+    """
+    클라이언트 하나의 이벤트 대기열
+
+    작업별로 마지막 상태만 보관하므로 느린 클라이언트가 있어도
+    대기열이 작업 수보다 커지지 않는다.
+    """
+
+    def __init__(self):
+        self._pending = OrderedDict()  # vod_url -> 작업 dict
+        self._cond = threading.Condition()
+        self.closed = False
+
+    def publish(self, payload):
+        with self._cond:
+            self._pending.pop(payload['vod_url'], None)
+            self._pending[payload['vod_url']] = payload
+            self._cond.notify()
+
+    def wait(self, timeout):
+        """
+        이벤트를 기다렸다가 모두 꺼냄
+
+        Returns:
+            list: 작업 dict 목록 (시간 초과면 빈 목록)
+        """
+        with self._cond:
+            if not self._pending and not self.closed:
+                self._cond.wait(timeout)
+            events = list(self._pending.values())
+            self._pending.clear()
+            return events
+
+    def close(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify()
+
+
+class DaemonServer:
+    """다운로드 데몬 서버"""
+
+    def __init__(self, downloader, host=DEFAULT_HOST, port=DEFAULT_PORT, download_path='downloads'):
+        """
+        Args:
+            downloader: 공유할 Downloader
+            host: 바인드 주소 (다른 컴퓨터에서 접근하지 못하도록 루프백 주소만 사용)
+            port: 포트 (0이면 빈 포트)
+            download_path: 다운로드 경로 (작업의 저장 경로는 이 안쪽만 허용)
+        """
+        self.downloader = downloader
+        self.download_path = download_path
+        self.tasks = OrderedDict()  # vod_url -> DownloadTask (추가 순서)
+        self._tasks_lock = threading.Lock()
+        self._channels = []
+        self._channels_lock = threading.Lock()
+
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.daemon_server = self
+        self._thread = None
+
+        downloader.add_progress_callback(self._on_progress)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.serve_forever, name="DaemonServer", daemon=True)
+        self._thread.start()
+
+    def serve_forever(self):
+        """현재 스레드에서 서버 실행 (shutdown() 호출까지)"""
+        if not self.downloader.is_running:
+            self.downloader.start()
+        logger.info(f"다운로드 데몬 시작: {self.url}")
+        self.httpd.serve_forever()
+
+    def shutdown(self):
+        """서버와 다운로더 중지"""
+        with self._channels_lock:
+            for channel in self._channels:
+                channel.close()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.downloader.stop()
+        logger.info("다운로드 데몬 중지")
+
+    def add_tasks(self, items):
+        """
+        작업 추가 (요청 본문의 dict 목록)
+
+        Returns:
+            tuple: (추가된 작업 목록, 거부된 항목 목록 [{'vod_url', 'error'}])
+        """
+        tasks = []
+        rejected = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            try:
+                vod_url = self._check_vod_url(item.get('vod_url'))
+                output_path = self._check_output_path(item.get('output_path'))
+            except ValueError as e:
+                logger.warning(f"데몬 작업 거부: {item.get('vod_url')} - {e}")
+                rejected.append({'vod_url': item.get('vod_url'), 'error': str(e)})
+                continue
+            tasks.append(DownloadTask(
+                vod_url=vod_url,
+                title=item.get('title') or vod_url,
+                quality=item.get('quality', 'best'),
+                output_path=output_path
+            ))
+        added = self.downloader.add_downloads(tasks)
+        with self._tasks_lock:
+            for task in added:
+                self.tasks.pop(task.vod_url, None)
+                self.tasks[task.vod_url] = task
+            self._trim_finished()
+        for task in added:
+            self._publish(task)
+        return added, rejected
+
+    def _check_vod_url(self, vod_url):
+        """치지직 VOD URL만 허용 (정규화한 URL 반환)"""
+        parsed = normalize_chzzk_url(vod_url) if isinstance(vod_url, str) else None
+        if not parsed or parsed[0] != 'video':
+            raise ValueError("치지직 VOD URL이 아닙니다")
+        return parsed[2]
+
+    def _check_output_path(self, output_path):
+        """저장 경로는 다운로드 경로 안쪽만 허용 (없으면 다운로드 경로)"""
+        if not output_path:
+            return self.download_path
+        if not isinstance(output_path, str):
+            raise ValueError("저장 경로가 잘못되었습니다")
+        root = os.path.realpath(self.download_path)
+        path = os.path.realpath(output_path)
+        try:
+            inside = os.path.commonpath([root, path]) == root
+        except ValueError:
+            # Windows에서 드라이브가 다른 경우
+            inside = False
+        if not inside:
+            raise ValueError(f"저장 경로는 {self.download_path} 안쪽만 허용됩니다")
+        return output_path
+
+    def list_tasks(self):
+        with self._tasks_lock:
+            return [task.to_dict() for task in self.tasks.values()]
+
+    def cancel_task(self, vod_url):
+        found = self.downloader.cancel_download(vod_url)
+        with self._tasks_lock:
+            task = self.tasks.get(vod_url)
+        if found and task:
+            # 대기 중이던 작업은 워커가 알리지 않으므로 바로 알림
+            self._publish(task)
+        return found
+
+    def remove_task(self, vod_url):
+        self.downloader.remove_download(vod_url)
+        with self._tasks_lock:
+            task = self.tasks.get(vod_url)
+            if task and task.status in FINISHED_STATUSES:
+                del self.tasks[vod_url]
+        return True
+
+    def clear_history(self):
+        self.downloader.clear_history()
+        with self._tasks_lock:
+            for vod_url in [url for url, task in self.tasks.items() if task.status in FINISHED_STATUSES]:
+                del self.tasks[vod_url]
+
+    def get_settings(self):
+        return {
+            'max_concurrent': self.downloader.max_concurrent,
+            'rate_limit': self.downloader.rate_limit,
+        }
+
+    def update_settings(self, settings):
+        """
+        설정 변경 (값을 모두 확인한 뒤 적용)
+
+        Raises:
+            ValueError: 값의 형식이나 범위가 잘못된 경우
+        """
+        if 'max_concurrent' in settings:
+            max_concurrent = self._check_int(settings['max_concurrent'], 'max_concurrent',
+                                             1, MAX_CONCURRENT_LIMIT)
+        if 'rate_limit' in settings:
+            rate_limit = self._check_int(settings['rate_limit'], 'rate_limit', 0)
+        if 'max_concurrent' in settings:
+            self.downloader.set_max_concurrent(max_concurrent)
+        if 'rate_limit' in settings:
+            self.downloader.set_rate_limit(rate_limit)
+        return self.get_settings()
+
+    def _check_int(self, value, name, minimum, maximum=None):
+        """정수이고 범위 안인지 확인 (bool 제외)"""
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError(f"{name}은(는) 정수여야 합니다")
+        if value < minimum or (maximum is not None and value > maximum):
+            limit = f"{minimum} 이상" if maximum is None else f"{minimum}~{maximum}"
+            raise ValueError(f"{name}은(는) {limit}이어야 합니다")
+        return value
+
+    def open_channel(self):
+        """이벤트 스트림 연결 (현재 작업 상태를 먼저 넣어 둠)"""
+        channel = EventChannel()
+        with self._tasks_lock:
+            for task in self.tasks.values():
+                channel.publish(task.to_dict())
+        with self._channels_lock:
+            self._channels.append(channel)
+        return channel
+
+    def close_channel(self, channel):
+        with self._channels_lock:
+            if channel in self._channels:
+                self._channels.remove(channel)
+
+    def _on_progress(self, task):
+        self._publish(task)
+        if task.status in FINISHED_STATUSES:
+            with self._tasks_lock:
+                self._trim_finished()
+
+    def _publish(self, task):
+        payload = task.to_dict()
+        with self._channels_lock:
+            channels = list(self._channels)
+        for channel in channels:
+            channel.publish(payload)
+
+    def _trim_finished(self):
+        """끝난 작업이 FINISHED_TASK_LIMIT개를 넘으면 오래된 것부터 제거 (_tasks_lock 안에서 호출)"""
+        finished = [url for url, task in self.tasks.items() if task.status in FINISHED_STATUSES]
+        for vod_url in finished[:max(0, len(finished) - FINISHED_TASK_LIMIT)]:
+            del self.tasks[vod_url]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """데몬 API 요청 처리"""
+
+    protocol_version = 'HTTP/1.1'
+    # 헤더와 본문을 따로 보내므로 Nagle 알고리즘에 의한 지연(약 40ms) 방지
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        logger.debug(f"데몬 요청: {self.address_string()} {format % args}")
+
+    @property
+    def daemon(self):
+        return self.server.daemon_server
+
+    def _check_host(self):
+        """
+        Host 헤더 확인
+
+        DNS 리바인딩으로 외부 도메인이 127.0.0.1을 가리키게 한 웹 페이지는
+        Host에 그 도메인을 보내므로 루프백 이름만 허용하여 막는다.
+        """
+        port = self.server.server_address[1]
+        if self.headers.get('Host', '').lower() in (f'127.0.0.1:{port}', f'localhost:{port}'):
+            return True
+        self._send_json({'error': 'invalid host'}, status=403)
+        return False
+
+    def do_GET(self):
+        if not self._check_host():
+            return
+        path = urlsplit(self.path).path
+        if path == '/tasks':
+            self._send_json({'tasks': self.daemon.list_tasks()})
+        elif path == '/settings':
+            self._send_json(self.daemon.get_settings())
+        elif path == '/events':
+            self._stream_events()
+        else:
+            self._send_json({'error': 'not found'}, status=404)
+
+    def do_POST(self):
+        if not self._check_host():
+            return
+        # 브라우저가 사전 확인 없이 보낼 수 없는 형식만 받아 웹 페이지에서의 요청 위조를 막음
+        if self.headers.get('Content-Type', '').split(';')[0].strip() != 'application/json':
+            self._send_json({'error': 'Content-Type must be application/json'}, status=415)
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            self._send_json({'error': 'invalid json'}, status=400)
+            return
+        if not isinstance(body, dict):
+            self._send_json({'error': 'body must be a json object'}, status=400)
+            return
+
+        path = urlsplit(self.path).path
+        if path == '/tasks':
+            items = body.get('tasks', [])
+            if not isinstance(items, list):
+                self._send_json({'error': 'tasks must be a list'}, status=400)
+                return
+            added, rejected = self.daemon.add_tasks(items)
+            self._send_json({'added': [task.to_dict() for task in added], 'rejected': rejected})
+        elif path == '/tasks/cancel':
+            self._send_json({'ok': self.daemon.cancel_task(body.get('vod_url'))})
+        elif path == '/tasks/remove':
+            self._send_json({'ok': self.daemon.remove_task(body.get('vod_url'))})
+        elif path == '/history/clear':
+            self.daemon.clear_history()
+            self._send_json({'ok': True})
+        elif path == '/settings':
+            try:
+                self._send_json(self.daemon.update_settings(body))
+            except ValueError as e:
+                self._send_json({'error': str(e)}, status=400)
+        else:
+            self._send_json({'error': 'not found'}, status=404)
+
+    def _send_json(self, data, status=200):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream_events(self):
+        """작업 상태가 바뀔 때마다 'data: <작업 JSON>' 전송"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+
+        channel = self.daemon.open_channel()
+        try:
+            while not channel.closed:
+                events = channel.wait(KEEPALIVE_INTERVAL)
+                if events:
+                    data = ''.join(
+                        f"data: {json.dumps(event, ensure_ascii=False)}\n\n" for event in events
+                    )
+                else:
+                    data = ': keepalive\n\n'
+                self.wfile.write(data.encode('utf-8'))
+                self.wfile.flush()
+        except OSError:
+            # 클라이언트 연결 종료
+            pass
+        finally:
+            self.daemon.close_channel(channel)
+
+
+class RemoteDownloader:
+    """
+    데몬에 연결하는 다운로더
+
+    Downloader와 같은 메서드를 제공하므로 GUI가 그대로 사용할 수 있다.
+    추가한 DownloadTask 객체를 URL별로 보관하고, 이벤트 스트림으로 받은 상태를
+    같은 객체에 반영한 뒤 진행률 콜백을 호출한다.
+    """
+
+    def __init__(self, base_url=None, timeout=10, on_new_task=None):
+        """
+        Args:
+            base_url: 데몬 주소 (None이면 기본 주소)
+            timeout: 요청 시간 제한 (초)
+            on_new_task: 다른 클라이언트가 추가한 작업을 처음 받았을 때 호출할 함수 (task)
+        """
+        self.base_url = (base_url or default_url()).rstrip('/')
+        self.timeout = timeout
+        self.on_new_task = on_new_task
+        self.session = requests.Session()
+        self.tasks = {}  # vod_url -> DownloadTask
+        self._tasks_lock = threading.Lock()
+        self.progress_callbacks = []
+        self.is_running = False
+        self._thread = None
+
+    def ping(self):
+        """데몬 응답 확인 (설정 반환)"""
+        return self._get('/settings')
+
+    def start(self):
+        """이벤트 스트림 수신 시작"""
+        if self.is_running:
+            return
+        self.is_running = True
+        self._thread = threading.Thread(target=self._event_loop, name="DaemonEvents", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        이벤트 스트림 수신 중지 (데몬의 다운로드는 계속 진행)
+
+        수신 스레드는 다음 이벤트나 keepalive를 받으면 종료된다.
+        """
+        self.is_running = False
+
+    def add_download(self, task):
+        self.add_downloads([task])
+
+    def add_downloads(self, tasks):
+        """
+        여러 작업 추가
+
+        데몬이 거부한 작업은 status를 'failed', error_message를 거부 사유로 바꾼다.
+
+        Returns:
+            list: 데몬이 실제로 추가한 작업 (중복, 거부 제외)
+        """
+        by_url = {}
+        with self._tasks_lock:
+            for task in tasks:
+                by_url.setdefault(task.vod_url, task)
+                self.tasks.setdefault(task.vod_url, task)
+        result = self._post('/tasks', {'tasks': [
+            {
+                'vod_url': task.vod_url,
+                'title': task.title,
+                'quality': task.quality,
+                'output_path': task.output_path,
+            }
+            for task in by_url.values()
+        ]})
+        added = [by_url[item['vod_url']] for item in result.get('added', []) if item['vod_url'] in by_url]
+        rejected = result.get('rejected', [])
+        if rejected:
+            with self._tasks_lock:
+                for item in rejected:
+                    self.tasks.pop(item.get('vod_url'), None)
+            for item in rejected:
+                logger.warning(f"데몬이 작업을 거부함: {item.get('vod_url')} - {item.get('error')}")
+                # 거부된 작업은 이벤트가 오지 않으므로 바로 실패로 표시
+                task = by_url.get(item.get('vod_url'))
+                if task:
+                    task.status = 'failed'
+                    task.error_message = item.get('error') or '데몬이 작업을 거부함'
+        logger.info(f"데몬에 다운로드 추가: {len(added)}개")
+        return added
+
+    def get_pending_urls(self):
+        """데몬에서 대기 중이거나 진행 중인 작업의 URL"""
+        tasks = self._get('/tasks').get('tasks', [])
+        return {item['vod_url'] for item in tasks if item['status'] not in FINISHED_STATUSES}
+
+    def cancel_download(self, vod_url):
+        ok = self._post('/tasks/cancel', {'vod_url': vod_url}).get('ok', False)
+        task = self.tasks.get(vod_url)
+        if ok and task:
+            task.cancel_flag = True
+            task.status = 'cancelled'
+        return ok
+
+    def remove_download(self, vod_url):
+        with self._tasks_lock:
+            self.tasks.pop(vod_url, None)
+        return self._post('/tasks/remove', {'vod_url': vod_url}).get('ok', False)
+
+    def clear_history(self):
+        self._post('/history/clear', {})
+
+    def set_max_concurrent(self, max_concurrent):
+        self._post('/settings', {'max_concurrent': max_concurrent})
+
+    def set_rate_limit(self, rate_limit):
+        self._post('/settings', {'rate_limit': rate_limit})
+
+    def add_progress_callback(self, callback):
+        self.progress_callbacks.append(callback)
+
+    def _get(self, path):
+        response = self.session.get(f'{self.base_url}{path}', timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _post(self, path, data):
+        response = self.session.post(f'{self.base_url}{path}', json=data, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _event_loop(self):
+        """이벤트 스트림 수신 (끊기면 다시 연결)"""
+        while self.is_running:
+            try:
+                # 연결 시간만 제한하고, 읽기는 keepalive 간격보다 넉넉하게 기다림
+                with self.session.get(f'{self.base_url}/events', stream=True,
+                                      timeout=(self.timeout, KEEPALIVE_INTERVAL * 3)) as response:
+                    response.raise_for_status()
+                    for line in response.iter_lines(decode_unicode=True):
+                        if not self.is_running:
+                            break
+                        if line and line.startswith('data: '):
+                            self._apply_event(json.loads(line[6:]))
+            except (requests.RequestException, ValueError) as e:
+                if self.is_running:
+                    logger.warning(f"데몬 이벤트 연결 끊김, {RECONNECT_DELAY}초 후 재연결: {e}")
+            if self.is_running:
+                time.sleep(RECONNECT_DELAY)
+
+    def _apply_event(self, data):
+        """받은 상태를 DownloadTask에 반영하고 콜백 호출"""
+        with self._tasks_lock:
+            task = self.tasks.get(data['vod_url'])
+            is_new = task is None
+            if is_new:
+                # 다른 클라이언트가 추가한 작업
+                task = DownloadTask(
+                    vod_url=data['vod_url'],
+                    title=data.get('title', ''),
+                    quality=data.get('quality', 'best')
+                )
+                self.tasks[task.vod_url] = task
+        for key in ('status', 'progress', 'speed', 'eta', 'downloaded_bytes', 'total_bytes',
+                    'error_message', 'output_file', 'checksum', 'integrity_ok'):
+            if key in data:
+                setattr(task, key, data[key])
+        if is_new and self.on_new_task:
+            self.on_new_task(task)
+
+        for callback in self.progress_callbacks:
+            try:
+                callback(task)
+            except Exception as e:
+                logger.error(f"콜백 오류: {e}")
@@ -2,30 +2,43 @@
 다운로드 엔진
 yt-dlp를 사용한 비디오 다운로드 로직
 """
+import itertools
 import os
 import threading
 import queue
+from collections import deque
 from datetime import datetime
-import yt_dlp
-from utils.logger import logger
+from core.integrity import StreamingVerifier
+from core.stream_output import StreamRelay, StreamSink, build_command, default_stream_name
+from core.telemetry import TransferStats, format_eta, format_speed
+from utils.logger import get_logger
+from utils.tracing import tracer
+
+
+logger = get_logger(__name__)
 
 
 class DownloadTask:
     """다운로드 작업 클래스"""
 
-    def __init__(self, vod_url, title, quality='best', output_path='downloads'):
+    def __init__(self, vod_url, title, quality='best', output_path='downloads', stream_target=None):
         self.vod_url = vod_url
         self.title = title
         self.quality = quality
         self.output_path = output_path
+        # 파일 대신 보낼 곳 ('-', 'pipe:<경로>', 'tcp://호스트:포트', None이면 파일로 저장)
+        self.stream_target = stream_target
         self.status = 'pending'  # pending, downloading, completed, failed, paused, cancelled
         self.progress = 0.0
-        self.speed = ''
-        self.eta = ''
+        self.speed = 0.0  # 바이트/초 (EWMA)
+        self.eta = None  # 초 (모르면 None)
+        self.stats = TransferStats()
         self.downloaded_bytes = 0
         self.total_bytes = 0
         self.error_message = ''
         self.output_file = ''
+        self.checksum = ''  # 완료 파일의 SHA-256
+        self.integrity_ok = None  # 컨테이너 구조 검사 결과 (완료 전에는 None)
         self.cancel_flag = False  # 중지 플래그
 
     def to_dict(self):
@@ -34,32 +47,78 @@ class DownloadTask:
             'vod_url': self.vod_url,
             'title': self.title,
             'quality': self.quality,
+            'stream_target': self.stream_target,
             'status': self.status,
             'progress': self.progress,
             'speed': self.speed,
             'eta': self.eta,
+            'downloaded_bytes': self.downloaded_bytes,
+            'total_bytes': self.total_bytes,
             'error_message': self.error_message,
             'output_file': self.output_file,
+            'checksum': self.checksum,
+            'integrity_ok': self.integrity_ok,
         }
 
 
 class Downloader:
     """다운로더 클래스"""
 
-    def __init__(self, max_concurrent=3):
+    def __init__(self, max_concurrent=3, history_limit=500, rate_limit=0):
+        """
+        Args:
+            max_concurrent: 동시 다운로드 수
+            history_limit: 보관할 완료 기록 수
+            rate_limit: 전체 다운로드 속도 제한 (바이트/초, 0이면 제한 없음)
+        """
         self.max_concurrent = max_concurrent
+        self.rate_limit = rate_limit
         self.download_queue = queue.Queue()
         self.active_downloads = {}
-        self.completed_downloads = []
+        # 완료 기록은 최근 history_limit개만 유지
+        self.completed_downloads = deque(maxlen=history_limit)
+        self._history_lock = threading.Lock()  # 워커의 추가와 제거/삭제가 겹치지 않도록
         self.is_running = False
         self.worker_threads = []
         self.progress_callbacks = []
+        self._workers_lock = threading.Lock()
+        self._worker_count = 0
+        self._worker_ids = itertools.count(1)
 
     def add_download(self, task):
         """다운로드 작업 추가"""
+        self._trace_enqueue(task)
         self.download_queue.put(task)
         logger.info(f"다운로드 추가: {task.title}")
 
+    def add_downloads(self, tasks):
+        """
+        여러 다운로드 작업을 한 번에 추가
+
+        이미 대기/진행 중인 URL과 목록 안의 중복은 건너뛴다.
+
+        Returns:
+            list: 실제로 추가된 작업
+        """
+        seen = self.get_pending_urls()
+        added = []
+        for task in tasks:
+            if task.vod_url in seen:
+                continue
+            seen.add(task.vod_url)
+            self._trace_enqueue(task)
+            self.download_queue.put(task)
+            added.append(task)
+        logger.info(f"다운로드 일괄 추가: {len(added)}개 (건너뜀 {len(tasks) - len(added)}개)")
+        return added
+
+    def get_pending_urls(self):
+        """대기 중이거나 진행 중인 작업의 URL"""
+        with self.download_queue.mutex:
+            urls = {task.vod_url for task in self.download_queue.queue}
+        urls.update(list(self.active_downloads))
+        return urls
+
     def start(self):
         """다운로드 시작"""
         if self.is_running:
@@ -69,11 +128,60 @@ class Downloader:
         self.is_running = True
 
         # 워커 스레드 시작
-        for i in range(self.max_concurrent):
-            thread = threading.Thread(target=self._worker, daemon=True)
-            thread.start()
-            self.worker_threads.append(thread)
-            logger.info(f"워커 스레드 {i+1} 시작")
+        self._spawn_workers()
+
+    def set_max_concurrent(self, max_concurrent):
+        """
+        동시 다운로드 수 변경 (실행 중에도 적용)
+
+        늘리면 워커를 바로 추가하고, 줄이면 남는 워커가 진행 중인
+        다운로드를 마친 뒤 종료된다.
+        """
+        max_concurrent = max(1, int(max_concurrent))
+        with self._workers_lock:
+            self.max_concurrent = max_concurrent
+        logger.info(f"동시 다운로드 수 변경: {max_concurrent}")
+        if self.is_running:
+            self._spawn_workers()
+
+    def set_rate_limit(self, rate_limit):
+        """
+        전체 다운로드 속도 제한 변경 (바이트/초, 0이면 제한 없음)
+
+        yt-dlp는 다운로드를 시작할 때 제한 값을 읽으므로 새로 시작하는 다운로드부터 적용된다.
+        """
+        self.rate_limit = max(0, int(rate_limit or 0))
+        logger.info(f"다운로드 속도 제한 변경: {format_speed(self.rate_limit) if self.rate_limit else '없음'}")
+
+    def _task_rate_limit(self):
+        """작업 하나에 줄 속도 제한 (전체 제한을 동시 다운로드 수로 나눔)"""
+        if not self.rate_limit:
+            return None
+        return max(1, self.rate_limit // max(1, self.max_concurrent))
+
+    def _spawn_workers(self):
+        """max_concurrent까지 워커 스레드 추가"""
+        with self._workers_lock:
+            self.worker_threads = [t for t in self.worker_threads if t.is_alive()]
+            while self._worker_count < self.max_concurrent:
+                self._worker_count += 1
+                # 이름으로 프로파일러가 워커 스레드를 구분
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f"Downloader-{next(self._worker_ids)}",
+                    daemon=True
+                )
+                thread.start()
+                self.worker_threads.append(thread)
+                logger.info(f"워커 스레드 {self._worker_count} 시작")
+
+    def _retire_surplus_worker(self):
+        """워커가 max_concurrent보다 많으면 하나 줄임 (줄였으면 True)"""
+        with self._workers_lock:
+            if self._worker_count > self.max_concurrent:
+                self._worker_count -= 1
+                return True
+            return False
 
     def stop(self):
         """다운로드 중지"""
@@ -83,12 +191,18 @@ class Downloader:
     def _worker(self):
         """워커 스레드"""
         while self.is_running:
+            if self._retire_surplus_worker():
+                logger.info("워커 스레드 종료 (동시 다운로드 수 감소)")
+                return
             try:
                 # 큐에서 작업 가져오기 (타임아웃 1초)
                 task = self.download_queue.get(timeout=1)
+                tracer.async_end('queue_wait', id(task))
 
                 # 다운로드 실행
-                self._download_video(task)
+                with tracer.span('download', cat='download', title=task.title):
+                    self._download_video(task)
+                tracer.async_end('task', id(task), status=task.status)
 
                 # 작업 완료
                 self.download_queue.task_done()
@@ -98,6 +212,9 @@ class Downloader:
             except Exception as e:
                 logger.error(f"워커 오류: {e}")
 
+        with self._workers_lock:
+            self._worker_count -= 1
+
     def _download_video(self, task):
         """비디오 다운로드"""
         try:
@@ -110,36 +227,16 @@ class Downloader:
             self.active_downloads[task.vod_url] = task
             logger.info(f"다운로드 시작: {task.title}")
 
-            # 출력 파일명 생성
-            safe_title = self._sanitize_filename(task.title)
-            output_template = os.path.join(task.output_path, f'{safe_title}.%(ext)s')
-
-            # yt-dlp 옵션
-            ydl_opts = {
-                'format': self._get_format_selector(task.quality),
-                'outtmpl': output_template,
-                'progress_hooks': [lambda d: self._progress_hook(d, task)],
-                'quiet': True,
-                'no_warnings': True,
-            }
-
-            # 다운로드 실행
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # 주기적으로 취소 플래그 확인
-                if task.cancel_flag:
-                    raise Exception("사용자가 다운로드를 중지했습니다")
-
-                info = ydl.extract_info(task.vod_url, download=True)
-                task.output_file = ydl.prepare_filename(info)
-
-            # 취소 확인
-            if task.cancel_flag:
-                raise Exception("사용자가 다운로드를 중지했습니다")
+            if task.stream_target:
+                self._download_to_stream(task)
+            else:
+                self._download_to_file(task)
 
             # 완료 처리
             task.status = 'completed'
             task.progress = 100.0
-            self.completed_downloads.append(task)
+            with self._history_lock:
+                self.completed_downloads.append(task)
             if task.vod_url in self.active_downloads:
                 del self.active_downloads[task.vod_url]
 
@@ -161,8 +258,157 @@ class Downloader:
 
             self._notify_progress(task)
 
-    def _progress_hook(self, d, task):
+    def _download_to_file(self, task):
+        """yt-dlp로 파일에 다운로드하고 무결성 매니페스트 저장"""
+        # yt-dlp는 import가 무거우므로 처음 사용할 때 로드
+        import yt_dlp
+
+        # 출력 파일명 생성
+        safe_title = self._sanitize_filename(task.title)
+        output_template = os.path.join(task.output_path, f'{safe_title}.%(ext)s')
+
+        # 다운로드하면서 새로 쓰인 부분으로 해시/구조 검사
+        verifier = StreamingVerifier()
+        # 단계별 시작 시각 (추적이 켜져 있을 때만 사용)
+        trace_marks = {'start': tracer.now(), 'fetch': {}, 'postprocess': {}}
+
+        # yt-dlp 옵션
+        ydl_opts = {
+            'format': self._get_format_selector(task.quality),
+            'outtmpl': output_template,
+            'progress_hooks': [lambda d: self._progress_hook(d, task, verifier, trace_marks)],
+            'postprocessor_hooks': [lambda d: self._trace_postprocess(d, trace_marks)],
+            'quiet': True,
+            'no_warnings': True,
+        }
+        rate_limit = self._task_rate_limit()
+        if rate_limit:
+            ydl_opts['ratelimit'] = rate_limit
+
+        # 다운로드 실행
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            # 주기적으로 취소 플래그 확인
+            if task.cancel_flag:
+                raise Exception("사용자가 다운로드를 중지했습니다")
+
+            info = ydl.extract_info(task.vod_url, download=True)
+            # 병합/리먹스 후 최종 경로 (없으면 예상 파일명)
+            requested = info.get('requested_downloads') or [{}]
+            task.output_file = requested[0].get('filepath') or ydl.prepare_filename(info)
+
+        # 취소 확인
+        if task.cancel_flag:
+            raise Exception("사용자가 다운로드를 중지했습니다")
+
+        with tracer.span('manifest', cat='download'):
+            self._write_manifest(task, verifier, info)
+
+    def _download_to_stream(self, task):
+        """
+        디스크에 쓰지 않고 스트림 대상(표준 출력, 파이프, TCP)으로 전달
+
+        병합이 필요한 형식은 파일 없이 보낼 수 없으므로 하나로 된 형식만 선택한다.
+        """
+        sink = StreamSink(task.stream_target)
+        relay = StreamRelay(
+            build_command(task.vod_url, self._get_stream_format_selector(task.quality), self._task_rate_limit()),
+            sink,
+            on_progress=lambda sent, total: self._stream_progress(task, sent, total),
+            is_cancelled=lambda: task.cancel_flag
+        )
+        try:
+            with tracer.span('stream', cat='download', target=task.stream_target):
+                relay.run()
+        finally:
+            sink.close()
+
+        task.output_file = default_stream_name(task.stream_target)
+        task.checksum = relay.digest.hasher.hexdigest()
+        if relay.digest.ts_checker:
+            task.integrity_ok = relay.digest.ts_checker.result()['container_ok']
+            if not task.integrity_ok:
+                logger.warning(f"컨테이너 구조 오류: {task.title} (ts)")
+        logger.info(f"스트림 전송 완료: {task.title} -> {task.output_file} ({relay.bytes_sent} bytes)")
+
+    def _stream_progress(self, task, sent, total):
+        """스트림 전송 진행률 (전체 크기는 yt-dlp 추정값)"""
+        task.downloaded_bytes = sent
+        task.total_bytes = max(total, sent)
+        if task.total_bytes:
+            task.progress = min(99.9, sent / task.total_bytes * 100)
+        task.stats.update(task.downloaded_bytes, task.total_bytes)
+        task.speed = task.stats.speed
+        task.eta = task.stats.eta
+        self._notify_progress(task)
+
+    def _write_manifest(self, task, verifier, info):
+        """무결성 매니페스트 저장 (실패해도 다운로드는 완료로 처리)"""
+        try:
+            manifest = verifier.finalize(task.output_file, extra={
+                'vod_url': task.vod_url,
+                'title': task.title,
+                'duration': info.get('duration'),
+            })
+        except Exception as e:
+            logger.error(f"무결성 매니페스트 저장 실패: {task.title} - {e}")
+            return
+
+        task.checksum = manifest['sha256']
+        task.integrity_ok = manifest['container_ok']
+        if not task.integrity_ok:
+            logger.warning(f"컨테이너 구조 오류: {task.title} ({manifest['container']})")
+
+    def _trace_enqueue(self, task):
+        """작업 전체 구간과 대기 구간 시작 기록"""
+        if not tracer.enabled:
+            return
+        tracer.async_begin('task', id(task), title=task.title, url=task.vod_url)
+        tracer.async_begin('queue_wait', id(task))
+
+    def _trace_progress(self, d, trace_marks):
+        """
+        진행률 콜백으로 단계 구간 기록
+
+        첫 다운로드 콜백 전까지는 정보 추출(매니페스트 요청 포함),
+        파일별 첫 콜백부터 finished(.part 이름 변경 포함)까지는 조각 다운로드로 본다.
+        """
+        filename = d.get('filename')
+        now = tracer.now()
+        fetch = trace_marks['fetch']
+        if d['status'] == 'downloading' and filename not in fetch:
+            if not fetch:
+                tracer.complete('extract_info', trace_marks['start'], now, cat='download')
+            fetch[filename] = now
+        elif d['status'] == 'finished' and filename in fetch:
+            tracer.complete(
+                'fetch', fetch[filename], now, cat='download',
+                file=os.path.basename(filename or ''),
+                bytes=d.get('total_bytes') or d.get('downloaded_bytes')
+            )
+
+    def _trace_postprocess(self, d, trace_marks):
+        """후처리(병합/리먹스 등) 구간 기록"""
+        if not tracer.enabled:
+            return
+        name = d.get('postprocessor')
+        if d.get('status') == 'started':
+            trace_marks['postprocess'][name] = tracer.now()
+        elif d.get('status') == 'finished' and name in trace_marks['postprocess']:
+            tracer.complete(
+                f'postprocess:{name}', trace_marks['postprocess'].pop(name), tracer.now(),
+                cat='download'
+            )
+
+    def _progress_hook(self, d, task, verifier=None, trace_marks=None):
         """진행률 콜백"""
+        if trace_marks is not None and tracer.enabled:
+            self._trace_progress(d, trace_marks)
+        if verifier and d['status'] in ('downloading', 'finished'):
+            try:
+                verifier.update(d)
+            except Exception as e:
+                logger.error(f"무결성 검사 오류: {e}")
+
         if d['status'] == 'downloading':
             # 진행률 계산
             if d.get('total_bytes'):
@@ -174,9 +420,16 @@ class Downloader:
                 task.downloaded_bytes = d['downloaded_bytes']
                 task.progress = (d['downloaded_bytes'] / d['total_bytes_estimate']) * 100
 
-            # 속도 및 남은 시간
-            task.speed = d.get('_speed_str', '')
-            task.eta = d.get('_eta_str', '')
+            # 속도 및 남은 시간 (조각마다 튀지 않도록 평활)
+            task.stats.update(task.downloaded_bytes, task.total_bytes)
+            task.speed = task.stats.speed
+            task.eta = task.stats.eta
+            # 진행률 로그는 작업마다 일정 간격으로만 기록
+            logger.debug(
+                f"진행률: {task.title} {task.progress:.1f}% "
+                f"{format_speed(task.speed)} ETA {format_eta(task.eta)}",
+                extra={'sample': task.vod_url}
+            )
 
             # 콜백 호출
             self._notify_progress(task)
@@ -207,6 +460,14 @@ class Downloader:
         }
         return quality_map.get(quality, 'best')
 
+    def _get_stream_format_selector(self, quality):
+        """스트림용 화질 선택자 (영상과 음성이 합쳐진 형식만)"""
+        heights = {'1080p': 1080, '720p': 720, '480p': 480, '360p': 360}
+        height = heights.get(quality)
+        if height is None:
+            return 'best'
+        return f'best[height<={height}]/best'
+
     def _sanitize_filename(self, filename):
         """파일명에서 특수문자 제거"""
         # Windows에서 허용되지 않는 문자 제거
@@ -257,11 +518,11 @@ class Downloader:
 
     def remove_download(self, vod_url):
         """다운로드 항목 제거 (완료/실패한 항목)"""
-        # 완료된 다운로드에서 제거
-        self.completed_downloads = [
-            task for task in self.completed_downloads
-            if task.vod_url != vod_url
-        ]
+        # 완료된 다운로드에서 제거 (워커가 추가한 항목을 잃지 않도록 잠근 채 제자리에서)
+        with self._history_lock:
+            kept = [task for task in self.completed_downloads if task.vod_url != vod_url]
+            self.completed_downloads.clear()
+            self.completed_downloads.extend(kept)
 
         # 활성 다운로드면 먼저 중지
         if vod_url in self.active_downloads:
@@ -269,3 +530,9 @@ class Downloader:
 
         logger.info(f"다운로드 항목 제거: {vod_url}")
         return True
+
+    def clear_history(self):
+        """완료 기록 전체 삭제"""
+        with self._history_lock:
+            self.completed_downloads.clear()
+        logger.info("다운로드 기록 삭제")
@@ -0,0 +1,238 @@
+"""
+HTTP 응답 캐시
+치지직 API 응답을 디스크에 저장하고 ETag/Last-Modified로 재검증
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from core.rate_limiter import rate_limiter as default_rate_limiter
+from utils.logger import get_logger
+from utils.tracing import tracer
+
+
+logger = get_logger(__name__)
+
+# 오래된 캐시가 있을 때 재검증 응답을 기다리는 시간 (초), 넘으면 오래된 응답 반환
+REVALIDATE_DEADLINE = 0.4
+
+
+class CachedResponse:
+    """캐시에서 꺼낸 응답 (requests.Response와 같은 방식으로 사용)"""
+
+    def __init__(self, status_code, content, headers=None, from_cache=False, stale=False):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.from_cache = from_cache
+        self.stale = stale
+
+    def json(self):
+        """본문을 JSON으로 변환"""
+        return json.loads(self.content.decode('utf-8'))
+
+
+class HTTPCache:
+    """디스크 기반 HTTP 응답 캐시 클래스"""
+
+    def __init__(self, session, cache_dir='cache/http', ttl=300, stale_ttl=3600, timeout=10,
+                 rate_limiter=None, revalidate_deadline=REVALIDATE_DEADLINE):
+        """
+        Args:
+            session: 요청에 사용할 requests.Session
+            cache_dir: 캐시 저장 디렉토리
+            ttl: 캐시가 신선한 것으로 간주되는 시간 (초)
+            stale_ttl: TTL 이후 재검증이 늦거나 실패하면 오래된 응답을 대신 반환하는 시간 (초)
+            timeout: 네트워크 요청 타임아웃 (초)
+            rate_limiter: HostRateLimiter (None이면 전역 인스턴스)
+            revalidate_deadline: 오래된 응답을 반환하기 전 재검증을 기다리는 시간 (초)
+        """
+        self.session = session
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or default_rate_limiter
+        self.revalidate_deadline = revalidate_deadline
+        self.stats = {'hit': 0, 'miss': 0, 'revalidated': 0, 'stale': 0}
+        self._lock = threading.Lock()
+        self._revalidating = {}  # 키 -> 진행 중인 재검증
+
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+    def get(self, url, params=None, ttl=None, allow_stale=True):
+        """
+        캐시를 거쳐 GET 요청
+
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            ttl: 이 요청에만 적용할 TTL (초, 0이면 항상 조건부 요청)
+            allow_stale: False면 재검증이 늦거나 실패해도 오래된 응답을 반환하지 않음
+
+        Returns:
+            CachedResponse 또는 requests.Response
+        """
+        ttl = self.ttl if ttl is None else ttl
+        key = self._make_key(url, params)
+        entry = self._load(key)
+
+        if entry:
+            age = time.time() - entry['stored_at']
+            if age < ttl:
+                self._count('hit')
+                logger.debug(f"캐시 적중: {url}")
+                return self._to_response(entry, key)
+
+            if allow_stale and age < ttl + self.stale_ttl:
+                return self._revalidate(key, url, params, entry)
+
+        return self._fetch(key, url, params, entry, allow_stale=allow_stale)
+
+    def get_stats(self):
+        """적중/실패 횟수 반환"""
+        with self._lock:
+            return dict(self.stats)
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        for filename in os.listdir(self.cache_dir):
+            try:
+                os.remove(os.path.join(self.cache_dir, filename))
+            except OSError as e:
+                logger.error(f"캐시 파일 삭제 실패: {e}")
+
+    def _fetch(self, key, url, params, entry, allow_stale=True):
+        """네트워크 요청 (캐시 항목이 있으면 조건부 요청)"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            with tracer.span('http.get', cat='http', url=url, conditional=bool(headers)) as span:
+                self.rate_limiter.acquire(url)
+                response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+                span.set(status=response.status_code)
+                self.rate_limiter.check_response(url, response)
+        except Exception as e:
+            if entry and allow_stale:
+                # 네트워크 오류나 요청 제한 시 오래된 응답이라도 반환
+                logger.warning(f"요청 실패, 캐시된 응답 사용: {e}")
+                self._count('stale')
+                return self._to_response(entry, key, stale=True)
+            raise
+
+        if response.status_code == 304 and entry:
+            entry['stored_at'] = time.time()
+            self._save_meta(key, entry)
+            self._count('revalidated')
+            logger.debug(f"캐시 재검증 완료 (304): {url}")
+            return self._to_response(entry, key)
+
+        self._count('miss')
+        if response.status_code == 200:
+            self._store(key, url, response)
+        return response
+
+    def _revalidate(self, key, url, params, entry):
+        """
+        오래된 항목 재검증
+
+        응답이 revalidate_deadline 안에 오면 그 결과를 반환하고,
+        늦거나 실패하면 오래된 응답을 반환한다 (늦은 재검증은 백그라운드에서 계속).
+        같은 키의 재검증은 한 번만 실행한다.
+        """
+        with self._lock:
+            pending = self._revalidating.get(key)
+            started = pending is None
+            if started:
+                pending = {'done': threading.Event(), 'response': None}
+                self._revalidating[key] = pending
+
+        if started:
+            def worker():
+                try:
+                    pending['response'] = self._fetch(key, url, params, entry, allow_stale=False)
+                except Exception as e:
+                    logger.warning(f"캐시 재검증 실패: {e}")
+                finally:
+                    with self._lock:
+                        self._revalidating.pop(key, None)
+                    pending['done'].set()
+
+            threading.Thread(target=worker, daemon=True).start()
+
+        if pending['done'].wait(self.revalidate_deadline):
+            response = pending['response']
+            if response is not None and response.status_code == 200:
+                return response
+
+        self._count('stale')
+        logger.debug(f"재검증이 늦거나 실패하여 오래된 캐시 반환: {url}")
+        return self._to_response(entry, key, stale=True)
+
+    def _count(self, name):
+        """통계 증가"""
+        with self._lock:
+            self.stats[name] += 1
+
+    def _make_key(self, url, params):
+        """URL과 파라미터로 캐시 키 생성"""
+        raw = url
+        if params:
+            raw += '?' + '&'.join(f"{k}={params[k]}" for k in sorted(params))
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def _meta_path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.json')
+
+    def _body_path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.body')
+
+    def _load(self, key):
+        """캐시 메타데이터 로드"""
+        if not os.path.exists(self._body_path(key)):
+            return None
+        try:
+            with open(self._meta_path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _to_response(self, entry, key, stale=False):
+        """캐시 항목을 응답 객체로 변환"""
+        with open(self._body_path(key), 'rb') as f:
+            content = f.read()
+        return CachedResponse(200, content, entry.get('headers'), from_cache=True, stale=stale)
+
+    def _store(self, key, url, response):
+        """응답 저장"""
+        entry = {
+            'url': url,
+            'stored_at': time.time(),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'headers': {'Content-Type': response.headers.get('Content-Type', '')},
+        }
+        try:
+            self._write_atomic(self._body_path(key), response.content)
+            self._save_meta(key, entry)
+        except OSError as e:
+            logger.error(f"캐시 저장 실패: {e}")
+
+    def _save_meta(self, key, entry):
+        """메타데이터 저장"""
+        data = json.dumps(entry, ensure_ascii=False).encode('utf-8')
+        self._write_atomic(self._meta_path(key), data)
+
+    def _write_atomic(self, path, data):
+        """임시 파일에 쓴 뒤 교체"""
+        tmp_path = f'{path}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
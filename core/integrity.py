@@ -0,0 +1,345 @@
+"""
+다운로드 무결성 검사
+다운로드 중 파일에 새로 쓰인 부분만 읽어 SHA-256과 컨테이너 구조를 함께 검사하고,
+결과를 파일 옆 매니페스트(.manifest.json)에 저장
+"""
+import hashlib
+import json
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+MANIFEST_SUFFIX = '.manifest.json'
+READ_CHUNK_SIZE = 4 * 1024 * 1024
+
+TS_PACKET_SIZE = 188
+TS_SYNC_BYTE = 0x47
+TS_NULL_PID = 0x1FFF
+
+MEDIA_EXTENSIONS = ('.mp4', '.ts', '.mkv', '.m4a', '.webm')
+
+
+class TSChecker:
+    """
+    MPEG-TS 구조 검사 (스트리밍)
+
+    188바이트 패킷마다 동기 바이트(0x47)를 확인하고, PID별 continuity counter가
+    1씩 증가하는지 확인한다. HLS 조각 경계에서는 counter가 초기화될 수 있으므로
+    continuity 오류는 기록만 하고 동기 바이트 오류만 손상으로 본다.
+    """
+
+    def __init__(self):
+        self.packets = 0
+        self.sync_errors = 0
+        self.cc_errors = 0
+        self._last_cc = {}  # PID -> 마지막 continuity counter
+        self._remainder = b''
+
+    def feed(self, data):
+        """새로 쓰인 바이트 검사"""
+        if self._remainder:
+            data = self._remainder + data
+        usable = len(data) - len(data) % TS_PACKET_SIZE
+        self._remainder = data[usable:]
+        if not usable:
+            return
+        data = data[:usable]
+
+        count = usable // TS_PACKET_SIZE
+        self.packets += count
+        # 헤더 바이트를 슬라이스로 모아 C 수준에서 처리
+        sync = data[0::TS_PACKET_SIZE]
+        self.sync_errors += count - sync.count(TS_SYNC_BYTE)
+
+        last_cc = self._last_cc
+        errors = 0
+        for h1, h2, h3, h4, h5 in zip(data[1::TS_PACKET_SIZE], data[2::TS_PACKET_SIZE],
+                                      data[3::TS_PACKET_SIZE], data[4::TS_PACKET_SIZE],
+                                      data[5::TS_PACKET_SIZE]):
+            if not h3 & 0x10:
+                # 페이로드가 없는 패킷은 counter가 증가하지 않음
+                continue
+            pid = ((h1 & 0x1F) << 8) | h2
+            if pid == TS_NULL_PID:
+                continue
+            cc = h3 & 0x0F
+            previous = last_cc.get(pid)
+            # 적응 필드의 discontinuity_indicator가 있으면 검사하지 않음
+            discontinuity = (h3 & 0x20) and h4 and (h5 & 0x80)
+            if previous is not None and not discontinuity and cc != (previous + 1) & 0x0F and cc != previous:
+                errors += 1
+            last_cc[pid] = cc
+        self.cc_errors += errors
+
+    def result(self):
+        """검사 결과"""
+        return {
+            'container': 'ts',
+            'container_ok': self.sync_errors == 0 and not self._remainder,
+            'packets': self.packets,
+            'sync_errors': self.sync_errors,
+            'cc_errors': self.cc_errors,
+            'trailing_bytes': len(self._remainder),
+        }
+
+
+def check_mp4(path):
+    """
+    MP4 최상위 박스 구조 검사 (박스 헤더만 읽고 건너뛰므로 파일 전체를 읽지 않음)
+
+    Returns:
+        dict: 검사 결과
+    """
+    file_size = os.path.getsize(path)
+    boxes = []
+    offset = 0
+    error = ''
+    with open(path, 'rb') as f:
+        while offset < file_size:
+            f.seek(offset)
+            header = f.read(8)
+            if len(header) < 8:
+                error = f'잘린 박스 헤더 (offset {offset})'
+                break
+            size, box_type = struct.unpack('>I4s', header)
+            if size == 1:
+                large = f.read(8)
+                if len(large) < 8:
+                    error = f'잘린 박스 헤더 (offset {offset})'
+                    break
+                size = struct.unpack('>Q', large)[0]
+            elif size == 0:
+                # 파일 끝까지 이어지는 박스
+                size = file_size - offset
+            if size < 8 or offset + size > file_size:
+                error = f"잘못된 박스 크기: {box_type.decode('latin-1')} (offset {offset})"
+                break
+            boxes.append(box_type.decode('latin-1'))
+            offset += size
+
+    if not error:
+        if 'ftyp' not in boxes:
+            error = 'ftyp 박스 없음'
+        elif 'moov' not in boxes and 'moof' not in boxes:
+            error = 'moov 박스 없음'
+
+    return {
+        'container': 'mp4',
+        'container_ok': not error,
+        'boxes': boxes[:20],
+        'error': error,
+    }
+
+
+def detect_container(head):
+    """파일 앞부분으로 컨테이너 종류 판별 ('ts', 'mp4', None)"""
+    if len(head) >= 8 and head[4:8] in (b'ftyp', b'styp'):
+        return 'mp4'
+    if head[:1] == bytes([TS_SYNC_BYTE]) and (len(head) <= TS_PACKET_SIZE or head[TS_PACKET_SIZE] == TS_SYNC_BYTE):
+        return 'ts'
+    return None
+
+
+class FileTail:
+    """커지는 파일에서 아직 읽지 않은 부분만 읽어 해시/구조 검사"""
+
+    def __init__(self):
+        self.offset = 0
+        self.hasher = hashlib.sha256()
+        self.container = None
+        self.ts_checker = None
+
+    def update(self, path):
+        """
+        새로 쓰인 바이트 처리
+
+        파일을 열어 둔 채로 두지 않는다 (Windows에서 yt-dlp가 .part 파일 이름을 바꿀 수 있도록).
+        """
+        try:
+            with open(path, 'rb') as f:
+                f.seek(self.offset)
+                while True:
+                    chunk = f.read(READ_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    self.feed(chunk)
+        except OSError:
+            # 아직 파일이 없거나 이름이 바뀌는 중
+            pass
+
+    def feed(self, chunk):
+        """이어지는 바이트 처리 (파일 없이 스트림에도 사용)"""
+        if self.offset == 0:
+            self.container = detect_container(chunk[:TS_PACKET_SIZE + 1])
+            if self.container == 'ts':
+                self.ts_checker = TSChecker()
+        self.offset += len(chunk)
+        self.hasher.update(chunk)
+        if self.ts_checker:
+            self.ts_checker.feed(chunk)
+
+
+class StreamingVerifier:
+    """
+    다운로드 중 무결성 검사
+
+    yt-dlp 진행률 콜백에서 update()를 호출하면 임시 파일에 새로 추가된
+    부분만 읽는다. 후처리(병합/리먹스)로 최종 파일이 달라진 경우에만
+    finalize()에서 최종 파일을 한 번 더 읽는다.
+    """
+
+    def __init__(self):
+        self._tails = {}  # 최종 파일 절대 경로 -> FileTail
+
+    def update(self, d):
+        """yt-dlp 진행률 콜백의 dict로 새 바이트 처리"""
+        filename = d.get('filename')
+        if not filename:
+            return
+        # yt-dlp는 저장 경로가 상대 경로면 상대 파일명을 주므로 절대 경로로 맞춤
+        key = os.path.abspath(filename)
+        tail = self._tails.get(key)
+        if tail is None:
+            tail = self._tails[key] = FileTail()
+        if d.get('status') == 'finished':
+            tail.update(filename)
+        else:
+            tail.update(d.get('tmpfilename') or filename)
+
+    def finalize(self, path, extra=None):
+        """
+        최종 파일의 매니페스트 생성 및 저장
+
+        Args:
+            path: 최종 파일 경로
+            extra: 매니페스트에 함께 저장할 값 (vod_url, title, duration 등)
+
+        Returns:
+            dict: 매니페스트
+        """
+        size = os.path.getsize(path)
+        tail = self._tails.get(os.path.abspath(path))
+        streamed = tail is not None and tail.offset == size
+        if not streamed:
+            # 후처리로 새 파일이 만들어짐 -> 한 번 읽어서 계산
+            tail = FileTail()
+            tail.update(path)
+
+        manifest = build_manifest(path, size, tail)
+        manifest['streamed'] = streamed
+        if extra:
+            manifest.update(extra)
+        write_manifest(path, manifest)
+
+        status = '정상' if manifest['container_ok'] else '구조 오류'
+        logger.info(f"무결성 매니페스트 저장: {os.path.basename(path)} ({status}, 스트리밍 계산 {streamed})")
+        return manifest
+
+
+def build_manifest(path, size, tail):
+    """FileTail 결과로 매니페스트 생성"""
+    if tail.container == 'ts':
+        container = tail.ts_checker.result()
+    elif tail.container == 'mp4':
+        container = check_mp4(path)
+    else:
+        container = {'container': 'unknown', 'container_ok': True}
+
+    manifest = {
+        'file': os.path.basename(path),
+        'size': size,
+        'sha256': tail.hasher.hexdigest(),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+    }
+    manifest.update(container)
+    return manifest
+
+
+def manifest_path(path):
+    """매니페스트 경로"""
+    return f'{path}{MANIFEST_SUFFIX}'
+
+
+def write_manifest(path, manifest):
+    """매니페스트 저장 (임시 파일에 쓴 뒤 교체)"""
+    target = manifest_path(path)
+    tmp_path = f'{target}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=4, ensure_ascii=False)
+    os.replace(tmp_path, target)
+
+
+def verify_file(path):
+    """
+    매니페스트와 파일 비교
+
+    Returns:
+        tuple: (정상 여부, 메시지) - 매니페스트가 없는 파일(매니페스트 도입 전 다운로드 등)은 (None, 메시지)
+    """
+    if not os.path.exists(manifest_path(path)):
+        return None, '매니페스트 없음 (건너뜀)'
+    try:
+        with open(manifest_path(path), 'r', encoding='utf-8') as f:
+            expected = json.load(f)
+    except (OSError, ValueError) as e:
+        return False, f'매니페스트를 읽을 수 없음: {e}'
+
+    try:
+        size = os.path.getsize(path)
+        if size != expected.get('size'):
+            return False, f"크기 불일치 ({size} != {expected.get('size')})"
+        tail = FileTail()
+        tail.update(path)
+        actual = build_manifest(path, size, tail)
+    except OSError as e:
+        return False, f'파일을 읽을 수 없음: {e}'
+
+    if actual['sha256'] != expected.get('sha256'):
+        return False, 'SHA-256 불일치'
+    if not actual['container_ok']:
+        return False, f"컨테이너 구조 오류 ({actual['container']})"
+    return True, '정상'
+
+
+def find_media_files(directory):
+    """매니페스트가 있거나 미디어 확장자인 파일 목록 (하위 폴더 포함)"""
+    files = []
+    for root, _, names in os.walk(directory):
+        for name in names:
+            if name.endswith(MANIFEST_SUFFIX) or name.endswith('.part'):
+                continue
+            if name.lower().endswith(MEDIA_EXTENSIONS) or os.path.exists(
+                    os.path.join(root, name + MANIFEST_SUFFIX)):
+                files.append(os.path.join(root, name))
+    return sorted(files)
+
+
+def verify_directory(directory, max_workers=None, on_result=None):
+    """
+    폴더의 모든 파일을 병렬로 검사
+
+    Args:
+        directory: 검사할 폴더
+        max_workers: 동시에 검사할 파일 수 (None이면 CPU 수)
+        on_result: (경로, 정상 여부, 메시지)를 받을 함수 (파일 순서대로, 건너뛴 파일은 정상 여부가 None)
+
+    Returns:
+        list: [(경로, 정상 여부, 메시지)]
+    """
+    files = find_media_files(directory)
+    results = []
+    # hashlib은 큰 블록을 처리할 때 GIL을 놓으므로 스레드로 병렬 처리
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                            thread_name_prefix="Verify") as executor:
+        futures = {executor.submit(verify_file, path): path for path in files}
+        for future, path in futures.items():
+            ok, message = future.result()
+            results.append((path, ok, message))
+            if on_result:
+                on_result(path, ok, message)
+    return results
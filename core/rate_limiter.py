@@ -0,0 +1,192 @@
+"""
+요청 속도 제한
+호스트별 토큰 버킷과 429/503 Retry-After 처리
+"""
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Retry-After가 없을 때 기본 대기 시간 (초)
+DEFAULT_RETRY_AFTER = 30
+
+# 이보다 오래 기다려야 하면 대기하지 않고 RateLimitedError 발생
+DEFAULT_MAX_WAIT = 10
+
+
+class RateLimitedError(Exception):
+    """서버가 요청 제한을 알렸거나 대기 시간이 너무 긴 경우"""
+
+    def __init__(self, host, retry_after):
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(f"요청 제한: {host} ({retry_after:.0f}초 후 재시도)")
+
+
+class TokenBucket:
+    """토큰 버킷 (스레드 안전하지 않음, 호출자가 잠금)"""
+
+    def __init__(self, rate, burst, clock=time.monotonic):
+        """
+        Args:
+            rate: 초당 보충되는 토큰 수
+            burst: 최대 토큰 수
+            clock: 시간 함수
+        """
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.clock = clock
+        self.tokens = float(self.capacity)
+        self.updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self):
+        """토큰이 있으면 하나 사용하고 True 반환"""
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def reserve(self):
+        """토큰 하나를 예약하고 사용 가능해질 때까지의 시간 반환"""
+        self._refill()
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def time_until_available(self):
+        """다음 토큰까지 남은 시간 (초)"""
+        self._refill()
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class HostRateLimiter:
+    """호스트별 요청 속도 제한 클래스"""
+
+    def __init__(self, rate=10.0, burst=20, clock=time.monotonic, sleep=time.sleep):
+        """
+        Args:
+            rate: 호스트당 기본 초당 요청 수
+            burst: 호스트당 기본 순간 최대 요청 수
+            clock: 시간 함수
+            sleep: 대기 함수
+        """
+        self.default_rate = rate
+        self.default_burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._blocked_until = {}
+        self._limits = {}
+
+    def configure(self, host, rate, burst):
+        """특정 호스트의 제한 설정"""
+        with self._lock:
+            self._limits[host] = (rate, burst)
+            self._buckets.pop(host, None)
+
+    def acquire(self, url, max_wait=DEFAULT_MAX_WAIT):
+        """
+        요청 전 호출하여 필요하면 대기
+
+        Args:
+            url: 요청 URL 또는 호스트
+            max_wait: 최대 대기 시간 (초)
+
+        Raises:
+            RateLimitedError: 대기 시간이 max_wait보다 긴 경우
+        """
+        host = self._host(url)
+        with self._lock:
+            now = self.clock()
+            blocked = self._blocked_until.get(host, 0) - now
+            if blocked > max_wait:
+                raise RateLimitedError(host, blocked)
+
+            bucket = self._bucket(host)
+            wait = max(blocked, bucket.time_until_available())
+            if wait > max_wait:
+                raise RateLimitedError(host, wait)
+            wait = max(blocked, bucket.reserve())
+
+        if wait > 0:
+            logger.debug(f"요청 속도 제한 대기: {host} ({wait:.2f}초)")
+            self.sleep(wait)
+
+    def check_response(self, url, response):
+        """
+        응답이 429/503이면 호스트를 막고 예외 발생
+
+        Raises:
+            RateLimitedError: 요청 제한 응답인 경우
+        """
+        if response.status_code not in (429, 503):
+            return
+
+        retry_after = self._parse_retry_after(response.headers.get('Retry-After'))
+        host = self._host(url)
+        self.penalize(host, retry_after)
+        raise RateLimitedError(host, retry_after)
+
+    def penalize(self, host, retry_after):
+        """호스트를 retry_after초 동안 막기"""
+        host = self._host(host)
+        with self._lock:
+            until = self.clock() + retry_after
+            self._blocked_until[host] = max(self._blocked_until.get(host, 0), until)
+        logger.warning(f"요청 제한 응답: {host} ({retry_after:.0f}초 대기)")
+
+    def get_blocked_remaining(self, url):
+        """호스트가 막혀 있는 남은 시간 (초)"""
+        host = self._host(url)
+        with self._lock:
+            return max(0.0, self._blocked_until.get(host, 0) - self.clock())
+
+    def _bucket(self, host):
+        """호스트 버킷 (잠금 안에서 호출)"""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate, burst = self._limits.get(host, (self.default_rate, self.default_burst))
+            bucket = TokenBucket(rate, burst, self.clock)
+            self._buckets[host] = bucket
+        return bucket
+
+    def _host(self, url):
+        """URL에서 호스트 추출 (이미 호스트면 그대로)"""
+        if '://' in url:
+            return urlparse(url).netloc
+        return url
+
+    def _parse_retry_after(self, value):
+        """Retry-After 헤더 (초 또는 HTTP 날짜) 파싱"""
+        if not value:
+            return DEFAULT_RETRY_AFTER
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return DEFAULT_RETRY_AFTER
+
+
+# 전역 속도 제한 인스턴스
+rate_limiter = HostRateLimiter()
+rate_limiter.configure('api.chzzk.naver.com', rate=5.0, burst=10)
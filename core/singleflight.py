@@ -0,0 +1,70 @@
+"""
+중복 요청 병합
+같은 키의 호출이 진행 중이면 새로 실행하지 않고 그 결과를 함께 사용
+"""
+import threading
+
+
+class _Call:
+    """진행 중인 호출"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """단일 실행 그룹 클래스"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, *args, **kwargs):
+        """
+        키당 하나의 호출만 실행
+
+        먼저 들어온 스레드가 fn을 실행하고, 그동안 같은 키로 들어온 스레드는
+        기다렸다가 같은 결과(또는 예외)를 받는다. 결과 객체는 공유되므로
+        호출자는 수정하지 않아야 한다.
+
+        Args:
+            key: 요청을 구분하는 해시 가능한 값
+            fn: 실행할 함수
+
+        Returns:
+            fn의 반환값
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                is_leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                is_leader = True
+
+        if not is_leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def in_flight(self):
+        """진행 중인 키 수"""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,269 @@
+"""
+스트림 출력
+yt-dlp를 하위 프로세스로 실행하여(-o -) 합쳐진 미디어를 디스크에 쓰지 않고
+표준 출력, 이름 있는 파이프, 로컬 TCP 소켓으로 순서대로 전달
+
+    '-'                 표준 출력
+    'pipe:<경로>'        이름 있는 파이프(FIFO, Windows는 \\\\.\\pipe\\이름) 또는 파일
+    'tcp://호스트:포트'   TCP 연결
+"""
+import os
+import queue
+import socket
+import subprocess
+import sys
+import threading
+from collections import deque
+from urllib.parse import urlsplit
+from core.integrity import FileTail
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# 한 번에 읽는 크기
+STREAM_CHUNK_SIZE = 256 * 1024
+# 읽기와 쓰기 사이에 쌓아 둘 최대 조각 수 (가득 차면 yt-dlp 출력 읽기를 멈춤)
+STREAM_QUEUE_CHUNKS = 64
+# 취소 확인 간격 (초)
+STREAM_POLL_INTERVAL = 0.5
+# 실패 메시지에 남길 yt-dlp 오류 출력 줄 수
+STDERR_TAIL_LINES = 20
+
+# yt-dlp가 stderr에 출력할 진행률 형식
+PROGRESS_PREFIX = 'PROGRESS '
+PROGRESS_TEMPLATE = (
+    'download:' + PROGRESS_PREFIX +
+    '%(progress.downloaded_bytes)s %(progress.total_bytes)s %(progress.total_bytes_estimate)s'
+)
+
+# 실행 파일로 빌드된 경우 yt-dlp 하위 프로세스로 자신을 다시 실행할 때 쓰는 숨은 옵션 (main.py에서 처리)
+CHILD_FLAG = '--yt-dlp-child'
+
+
+def is_stream_target(target):
+    """출력 대상이 스트림인지 여부"""
+    return bool(target) and (target == '-' or target.startswith(('pipe:', 'tcp://')))
+
+
+class StreamCancelled(Exception):
+    """스트리밍 중 취소됨"""
+
+
+class StreamSink:
+    """스트림 출력 대상"""
+
+    def __init__(self, target):
+        """
+        Args:
+            target: '-', 'pipe:<경로>', 'tcp://호스트:포트'
+
+        Raises:
+            ValueError: 지원하지 않는 대상
+            OSError: 열기/연결 실패
+        """
+        self.target = target
+        self._file = None
+        self._socket = None
+        self._owns_file = False
+
+        if target == '-':
+            self._file = sys.stdout.buffer
+        elif target.startswith('pipe:'):
+            # FIFO는 읽는 쪽이 열 때까지 기다림
+            self._file = open(target[len('pipe:'):], 'wb')
+            self._owns_file = True
+        elif target.startswith('tcp://'):
+            parts = urlsplit(target)
+            if not parts.hostname or not parts.port:
+                raise ValueError(f"TCP 주소가 잘못되었습니다: {target}")
+            self._socket = socket.create_connection((parts.hostname, parts.port), timeout=10)
+            # 받는 쪽이 느리면 sendall이 기다림 (시간 제한 없음)
+            self._socket.settimeout(None)
+        else:
+            raise ValueError(f"지원하지 않는 스트림 출력: {target}")
+
+    def write(self, data):
+        if self._socket is not None:
+            self._socket.sendall(data)
+        else:
+            self._file.write(data)
+
+    def close(self):
+        try:
+            if self._socket is not None:
+                self._socket.shutdown(socket.SHUT_WR)
+                self._socket.close()
+            elif self._owns_file:
+                self._file.close()
+            else:
+                self._file.flush()
+        except OSError:
+            pass
+
+
+def build_command(url, format_selector, rate_limit=None):
+    """
+    yt-dlp 하위 프로세스 명령
+
+    실행 파일로 빌드된 경우(-m을 사용할 수 없음) 자신을 숨은 옵션으로 다시 실행한다.
+    """
+    if getattr(sys, 'frozen', False):
+        command = [sys.executable, CHILD_FLAG]
+    else:
+        command = [sys.executable, '-m', 'yt_dlp']
+    command += [
+        '-f', format_selector,
+        '-o', '-',
+        '--newline',
+        '--no-part',
+        '--progress-template', PROGRESS_TEMPLATE,
+    ]
+    if rate_limit:
+        command += ['--limit-rate', str(rate_limit)]
+    command.append(url)
+    return command
+
+
+class StreamRelay:
+    """
+    yt-dlp 출력을 대상에 전달
+
+    읽는 스레드가 yt-dlp 표준 출력을 조각으로 나눠 크기가 제한된 큐에 넣고,
+    호출한 스레드가 큐에서 꺼내 대상에 쓴다. 대상이 느리면 큐가 가득 차서
+    읽기가 멈추고, 파이프가 가득 차면 yt-dlp도 멈춘다.
+    """
+
+    def __init__(self, command, sink, on_progress=None, is_cancelled=None):
+        """
+        Args:
+            command: yt-dlp 명령
+            sink: StreamSink
+            on_progress: (보낸 바이트, 전체 바이트 추정)을 받을 함수
+            is_cancelled: 취소 여부를 돌려주는 함수
+        """
+        self.command = command
+        self.sink = sink
+        self.on_progress = on_progress
+        self.is_cancelled = is_cancelled or (lambda: False)
+
+        self.bytes_sent = 0
+        self.total_bytes = 0
+        self.digest = FileTail()  # 보낸 데이터의 SHA-256과 컨테이너 구조
+        self._queue = queue.Queue(maxsize=STREAM_QUEUE_CHUNKS)
+        self._stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+        self._process = None
+        self._stopped = threading.Event()
+
+    def run(self):
+        """
+        스트리밍 실행 (끝날 때까지 대기)
+
+        Raises:
+            StreamCancelled: 취소된 경우
+            RuntimeError: yt-dlp 실패
+            OSError: 대상에 쓰기 실패 (받는 쪽이 연결을 끊음 등)
+        """
+        creationflags = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        self._process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            creationflags=creationflags
+        )
+        reader = threading.Thread(target=self._read_stdout, name="StreamReader", daemon=True)
+        stderr_reader = threading.Thread(target=self._read_stderr, name="StreamStderr", daemon=True)
+        reader.start()
+        stderr_reader.start()
+
+        try:
+            while True:
+                if self.is_cancelled():
+                    raise StreamCancelled()
+                try:
+                    chunk = self._queue.get(timeout=STREAM_POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+                if chunk is None:
+                    break
+                self.sink.write(chunk)
+                self.digest.feed(chunk)
+                self.bytes_sent += len(chunk)
+                if self.on_progress:
+                    self.on_progress(self.bytes_sent, self.total_bytes)
+        except BaseException:
+            self._kill()
+            raise
+        finally:
+            reader.join(timeout=5)
+
+        returncode = self._process.wait()
+        stderr_reader.join(timeout=5)
+        if returncode != 0:
+            errors = [line for line in self._stderr_tail if line.startswith('ERROR')]
+            raise RuntimeError(errors[-1] if errors else f"yt-dlp 종료 코드 {returncode}")
+
+    def _read_stdout(self):
+        stdout = self._process.stdout
+        try:
+            while True:
+                chunk = stdout.read1(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self._put(chunk)
+        except (OSError, ValueError):
+            # 중단되어 프로세스가 종료됨
+            pass
+        self._put(None)
+
+    def _put(self, item):
+        """큐에 자리가 날 때까지 기다리며 넣기 (중단되면 버림)"""
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=STREAM_POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def _read_stderr(self):
+        for raw in self._process.stderr:
+            line = raw.decode('utf-8', errors='replace').strip()
+            if line.startswith(PROGRESS_PREFIX):
+                self._parse_progress(line[len(PROGRESS_PREFIX):])
+            elif line:
+                self._stderr_tail.append(line)
+                logger.debug(f"yt-dlp: {line}")
+
+    def _parse_progress(self, text):
+        """'받은 바이트 전체 바이트 추정' (모르는 값은 NA)"""
+        values = text.split()
+        for value in values[1:]:
+            try:
+                total = int(float(value))
+            except ValueError:
+                continue
+            if total:
+                self.total_bytes = total
+                return
+
+    def _kill(self):
+        self._stopped.set()
+        if self._process and self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+        # 큐에 걸려 있는 읽는 스레드를 풀어 줌
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+
+def default_stream_name(target):
+    """로그/기록에 표시할 출력 이름"""
+    if target == '-':
+        return 'stdout'
+    if target.startswith('pipe:'):
+        return os.path.basename(target[len('pipe:'):]) or target
+    return target
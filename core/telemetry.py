@@ -0,0 +1,137 @@
+"""
+다운로드 속도/남은 시간 측정
+EWMA로 평활한 속도(바이트/초)와 작업별 최근 속도 기록(고정 크기 링 버퍼)
+"""
+import time
+from array import array
+
+
+# EWMA 가중치 (클수록 최근 값에 민감)
+SPEED_ALPHA = 0.3
+# 속도 계산 최소 간격 (초) - 조각 단위로 몰려 오는 콜백의 순간 속도 튐 방지
+MIN_SAMPLE_INTERVAL = 0.5
+# 작업별로 보관할 최근 속도 기록 수
+HISTORY_SIZE = 60
+
+
+class TransferStats:
+    """작업 하나의 전송 속도 통계"""
+
+    def __init__(self, alpha=SPEED_ALPHA, history_size=HISTORY_SIZE, clock=time.monotonic):
+        self.alpha = alpha
+        self.clock = clock
+        self.speed = 0.0  # 평활한 속도 (바이트/초)
+        self.eta = None  # 남은 시간 (초, 알 수 없으면 None)
+
+        self._history = array('d', bytes(8 * history_size))  # 최근 속도 링 버퍼
+        self._history_index = 0
+        self._history_count = 0
+
+        self._last_time = None
+        self._last_bytes = 0
+
+    def update(self, downloaded_bytes, total_bytes=0):
+        """
+        진행 상황 반영
+
+        Args:
+            downloaded_bytes: 지금까지 받은 바이트
+            total_bytes: 전체 바이트 (모르면 0)
+        """
+        now = self.clock()
+        if self._last_time is None or downloaded_bytes < self._last_bytes:
+            # 첫 호출 또는 다른 파일(영상/음성)로 넘어감
+            self._last_time = now
+            self._last_bytes = downloaded_bytes
+            return
+
+        elapsed = now - self._last_time
+        if elapsed < MIN_SAMPLE_INTERVAL:
+            return
+
+        instant = (downloaded_bytes - self._last_bytes) / elapsed
+        self._last_time = now
+        self._last_bytes = downloaded_bytes
+
+        if self._history_count == 0:
+            self.speed = instant
+        else:
+            self.speed = self.alpha * instant + (1 - self.alpha) * self.speed
+        self._record(self.speed)
+
+        if total_bytes and self.speed > 0:
+            self.eta = max(0.0, (total_bytes - downloaded_bytes) / self.speed)
+        else:
+            self.eta = None
+
+    def history(self):
+        """최근 속도 기록 (오래된 것부터)"""
+        size = len(self._history)
+        if self._history_count < size:
+            return self._history[:self._history_count].tolist()
+        index = self._history_index
+        return (self._history[index:] + self._history[:index]).tolist()
+
+    def _record(self, value):
+        self._history[self._history_index] = value
+        self._history_index = (self._history_index + 1) % len(self._history)
+        self._history_count = min(self._history_count + 1, len(self._history))
+
+
+def aggregate(tasks, finished_sizes=()):
+    """
+    전체 처리량과 대기열 전체 남은 시간
+
+    크기를 아직 모르는 대기 작업은 크기를 아는 작업의 평균 크기로 추정한다.
+
+    Args:
+        tasks: 진행 중/대기 중인 DownloadTask 목록
+        finished_sizes: 끝난 작업의 크기 (평균 크기 추정용)
+
+    Returns:
+        tuple: (전체 속도 바이트/초, 남은 시간 초 또는 None)
+    """
+    total_speed = 0.0
+    remaining = 0
+    unknown = 0
+    known_sizes = [size for size in finished_sizes if size]
+
+    for task in tasks:
+        if task.status == 'downloading':
+            total_speed += task.speed
+        if task.total_bytes:
+            known_sizes.append(task.total_bytes)
+            remaining += max(0, task.total_bytes - task.downloaded_bytes)
+        else:
+            unknown += 1
+
+    if unknown:
+        if not known_sizes:
+            return total_speed, None
+        remaining += unknown * (sum(known_sizes) / len(known_sizes))
+
+    if total_speed <= 0:
+        return total_speed, None
+    return total_speed, remaining / total_speed
+
+
+def format_speed(bytes_per_second):
+    """속도를 읽기 쉬운 문자열로 변환"""
+    value = float(bytes_per_second or 0)
+    for unit in ('B/s', 'KB/s', 'MB/s'):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB/s"
+
+
+def format_eta(seconds):
+    """남은 시간을 읽기 쉬운 문자열로 변환"""
+    if seconds is None:
+        return "--:--"
+    seconds = int(seconds)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
@@ -0,0 +1,61 @@
+"""
+로컬 VOD 필터
+이미 불러온 VOD 목록을 네트워크 없이 제목으로 검색 (초성 검색 지원)
+"""
+import time
+from utils.hangul import build_search_pattern
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class LocalVODSearch:
+    """메모리 내 VOD 검색 클래스"""
+
+    def __init__(self):
+        self.vods = []
+        self._titles = []  # 소문자 제목 (vods와 같은 순서)
+        self._keys = set()
+
+    def set_vods(self, vods):
+        """검색 대상 교체"""
+        self.vods = []
+        self._titles = []
+        self._keys = set()
+        self.add_vods(vods)
+
+    def add_vods(self, vods):
+        """검색 대상 추가 (이미 있는 videoNo는 무시)"""
+        for vod in vods:
+            key = vod.get('videoNo')
+            if key in self._keys:
+                continue
+            self._keys.add(key)
+            self.vods.append(vod)
+            self._titles.append(vod.get('videoTitle', '').lower())
+
+    def search(self, keyword):
+        """
+        제목 검색
+
+        Args:
+            keyword: 검색어 (초성 포함 가능)
+
+        Returns:
+            list: 일치하는 VOD 목록 (원래 순서 유지)
+        """
+        keyword = keyword.strip()
+        if not keyword:
+            return list(self.vods)
+
+        started = time.perf_counter()
+        pattern = build_search_pattern(keyword)
+        results = [
+            vod for vod, title in zip(self.vods, self._titles)
+            if pattern.search(title)
+        ]
+
+        elapsed = (time.perf_counter() - started) * 1000
+        logger.debug(f"로컬 검색 '{keyword}': {len(results)}/{len(self.vods)}개 ({elapsed:.1f}ms)")
+        return results
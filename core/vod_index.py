@@ -0,0 +1,358 @@
+"""
+로컬 VOD 인덱스
+채널별로 수집한 VOD를 SQLite에 저장하고 제목 전문 검색 제공
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# 정렬 기준 -> 컬럼
+SORT_COLUMNS = {
+    'date': 'publish_date',
+    'duration': 'duration',
+    'title': 'title',
+}
+
+# trigram 토크나이저는 3글자 이상에서만 MATCH 가능
+MIN_FTS_KEYWORD_LENGTH = 3
+
+
+class VODIndex:
+    """VOD 인덱스 클래스"""
+
+    def __init__(self, db_path='cache/vod_index.db'):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.has_fts = self._create_schema()
+
+    def _create_schema(self):
+        """테이블 생성, FTS5 사용 가능 여부 반환"""
+        with self._lock, self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS vods (
+                    video_no INTEGER PRIMARY KEY,
+                    channel_id TEXT NOT NULL,
+                    title TEXT NOT NULL DEFAULT '',
+                    publish_date TEXT NOT NULL DEFAULT '',
+                    duration INTEGER NOT NULL DEFAULT 0,
+                    downloaded INTEGER NOT NULL DEFAULT 0,
+                    data TEXT NOT NULL
+                )
+            """)
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_vods_channel_date "
+                "ON vods(channel_id, publish_date DESC)"
+            )
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    channel_id TEXT PRIMARY KEY,
+                    newest_video_no INTEGER,
+                    newest_publish_date TEXT NOT NULL DEFAULT '',
+                    synced_at REAL NOT NULL DEFAULT 0,
+                    complete INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            # 채널 감시가 마지막으로 처리한 VOD (목록 로드/검색이 옮기는 sync_state와 별도)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS watch_state (
+                    channel_id TEXT PRIMARY KEY,
+                    video_no INTEGER,
+                    publish_date TEXT NOT NULL DEFAULT ''
+                )
+            """)
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(sync_state)")}
+            if 'complete' not in columns:
+                # 이전 버전 DB (전체 수집 여부를 모르므로 이어서 수집하도록 0)
+                self.conn.execute(
+                    "ALTER TABLE sync_state ADD COLUMN complete INTEGER NOT NULL DEFAULT 0"
+                )
+
+            try:
+                # 한국어는 공백 단위 토큰화가 맞지 않으므로 trigram 사용
+                self.conn.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS vods_fts USING fts5(
+                        title, content='vods', content_rowid='video_no', tokenize='trigram'
+                    )
+                """)
+                self.conn.executescript("""
+                    CREATE TRIGGER IF NOT EXISTS vods_ai AFTER INSERT ON vods BEGIN
+                        INSERT INTO vods_fts(rowid, title) VALUES (new.video_no, new.title);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS vods_ad AFTER DELETE ON vods BEGIN
+                        INSERT INTO vods_fts(vods_fts, rowid, title) VALUES ('delete', old.video_no, old.title);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS vods_au AFTER UPDATE OF title ON vods BEGIN
+                        INSERT INTO vods_fts(vods_fts, rowid, title) VALUES ('delete', old.video_no, old.title);
+                        INSERT INTO vods_fts(rowid, title) VALUES (new.video_no, new.title);
+                    END;
+                """)
+                return True
+            except sqlite3.OperationalError as e:
+                logger.warning(f"FTS5 사용 불가, LIKE 검색으로 대체: {e}")
+                return False
+
+    def add_vods(self, channel_id, vods):
+        """
+        VOD 추가/갱신 (다운로드 여부는 유지)
+
+        Args:
+            channel_id: 채널 ID
+            vods: API에서 받은 VOD 목록
+
+        Returns:
+            int: 처리한 항목 수
+        """
+        rows = []
+        for vod in vods:
+            video_no = vod.get('videoNo')
+            if video_no is None:
+                continue
+            rows.append((
+                int(video_no),
+                channel_id,
+                vod.get('videoTitle', ''),
+                vod.get('publishDate', ''),
+                vod.get('duration') or 0,
+                json.dumps(vod, ensure_ascii=False),
+            ))
+
+        if not rows:
+            return 0
+
+        with self._lock, self.conn:
+            self.conn.executemany("""
+                INSERT INTO vods (video_no, channel_id, title, publish_date, duration, data)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(video_no) DO UPDATE SET
+                    channel_id = excluded.channel_id,
+                    title = excluded.title,
+                    publish_date = excluded.publish_date,
+                    duration = excluded.duration,
+                    data = excluded.data
+            """, rows)
+
+        logger.debug(f"VOD 인덱스 갱신: {channel_id} ({len(rows)}개)")
+        return len(rows)
+
+    def search(self, channel_id, keyword='', sort='date', descending=True,
+               min_duration=None, max_duration=None, downloaded=None,
+               limit=None, offset=0):
+        """
+        VOD 검색
+
+        Args:
+            channel_id: 채널 ID
+            keyword: 제목 검색어 (비어 있으면 전체)
+            sort: 정렬 기준 ('date', 'duration', 'title')
+            descending: 내림차순 여부
+            min_duration: 최소 길이 (초)
+            max_duration: 최대 길이 (초)
+            downloaded: True/False로 다운로드 여부 필터, None이면 전체
+            limit: 최대 결과 수
+            offset: 건너뛸 결과 수
+
+        Returns:
+            list: VOD 목록 (API 응답과 같은 형식)
+        """
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"지원하지 않는 정렬 기준: {sort}")
+
+        conditions = ["v.channel_id = ?"]
+        args = [channel_id]
+        source = "vods v"
+
+        keyword = (keyword or '').strip()
+        if keyword:
+            if self.has_fts and len(keyword) >= MIN_FTS_KEYWORD_LENGTH:
+                source = "vods_fts f JOIN vods v ON v.video_no = f.rowid"
+                conditions.append("vods_fts MATCH ?")
+                args.append('"' + keyword.replace('"', '""') + '"')
+            else:
+                escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+                conditions.append("v.title LIKE ? ESCAPE '\\'")
+                args.append(f'%{escaped}%')
+
+        if min_duration is not None:
+            conditions.append("v.duration >= ?")
+            args.append(min_duration)
+        if max_duration is not None:
+            conditions.append("v.duration <= ?")
+            args.append(max_duration)
+        if downloaded is not None:
+            conditions.append("v.downloaded = ?")
+            args.append(1 if downloaded else 0)
+
+        order = "DESC" if descending else "ASC"
+        sql = (
+            f"SELECT v.data, v.downloaded FROM {source} "
+            f"WHERE {' AND '.join(conditions)} "
+            f"ORDER BY v.{SORT_COLUMNS[sort]} {order}, v.video_no {order}"
+        )
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            args.extend([limit, offset])
+
+        with self._lock:
+            rows = self.conn.execute(sql, args).fetchall()
+
+        results = []
+        for data, is_downloaded in rows:
+            vod = json.loads(data)
+            vod['downloaded'] = bool(is_downloaded)
+            results.append(vod)
+        return results
+
+    def get_titles(self, video_nos):
+        """
+        VOD 제목 조회
+
+        Args:
+            video_nos: videoNo 목록
+
+        Returns:
+            dict: videoNo -> 제목 (인덱스에 있는 것만)
+        """
+        numbers = [int(no) for no in video_nos if str(no).isdigit()]
+        titles = {}
+        # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+        for start in range(0, len(numbers), 500):
+            chunk = numbers[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            with self._lock:
+                rows = self.conn.execute(
+                    f"SELECT video_no, title FROM vods WHERE video_no IN ({placeholders})",
+                    chunk
+                ).fetchall()
+            titles.update(rows)
+        return titles
+
+    def count(self, channel_id):
+        """채널의 인덱스된 VOD 수"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT COUNT(*) FROM vods WHERE channel_id = ?", (channel_id,)
+            ).fetchone()
+        return row[0]
+
+    def mark_downloaded(self, video_no, downloaded=True):
+        """다운로드 여부 표시"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE vods SET downloaded = ? WHERE video_no = ?",
+                (1 if downloaded else 0, int(video_no))
+            )
+
+    def get_sync_state(self, channel_id):
+        """
+        채널 동기화 상태 조회
+
+        Returns:
+            dict: newest_video_no, newest_publish_date, synced_at, complete (없으면 None)
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT newest_video_no, newest_publish_date, synced_at, complete "
+                "FROM sync_state WHERE channel_id = ?", (channel_id,)
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            'newest_video_no': row[0],
+            'newest_publish_date': row[1],
+            'synced_at': row[2],
+            'complete': bool(row[3]),
+        }
+
+    def set_sync_state(self, channel_id, newest_video_no, newest_publish_date, complete=False):
+        """
+        채널 동기화 상태 저장
+
+        Args:
+            complete: 채널 전체를 수집했는지 여부 (한 번 True가 되면 유지)
+        """
+        with self._lock, self.conn:
+            self.conn.execute("""
+                INSERT INTO sync_state (channel_id, newest_video_no, newest_publish_date, synced_at, complete)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(channel_id) DO UPDATE SET
+                    newest_video_no = excluded.newest_video_no,
+                    newest_publish_date = excluded.newest_publish_date,
+                    synced_at = excluded.synced_at,
+                    complete = MAX(sync_state.complete, excluded.complete)
+            """, (channel_id, newest_video_no, newest_publish_date or '', time.time(), 1 if complete else 0))
+
+    def mark_sync_complete(self, channel_id):
+        """채널 전체 수집 완료 표시"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE sync_state SET complete = 1 WHERE channel_id = ?", (channel_id,)
+            )
+
+    def get_watch_cursor(self, channel_id):
+        """
+        채널 감시가 마지막으로 처리한 VOD
+
+        Returns:
+            tuple: (videoNo, publishDate) (없으면 None)
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT video_no, publish_date FROM watch_state WHERE channel_id = ?", (channel_id,)
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def set_watch_cursor(self, channel_id, video_no, publish_date):
+        """채널 감시가 마지막으로 처리한 VOD 저장"""
+        with self._lock, self.conn:
+            self.conn.execute("""
+                INSERT INTO watch_state (channel_id, video_no, publish_date) VALUES (?, ?, ?)
+                ON CONFLICT(channel_id) DO UPDATE SET
+                    video_no = excluded.video_no,
+                    publish_date = excluded.publish_date
+            """, (channel_id, int(video_no), publish_date or ''))
+
+    def newer_than(self, channel_id, video_no, publish_date):
+        """
+        기준 VOD보다 나중에 올라온 VOD (최신순)
+
+        Args:
+            channel_id: 채널 ID
+            video_no: 기준 videoNo
+            publish_date: 기준 업로드 날짜
+
+        Returns:
+            list: VOD 목록
+        """
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT data, downloaded FROM vods
+                WHERE channel_id = ? AND video_no != ?
+                  AND (publish_date > ? OR (publish_date = ? AND video_no > ?))
+                ORDER BY publish_date DESC, video_no DESC
+            """, (channel_id, int(video_no), publish_date or '', publish_date or '', int(video_no))).fetchall()
+
+        results = []
+        for data, is_downloaded in rows:
+            vod = json.loads(data)
+            vod['downloaded'] = bool(is_downloaded)
+            results.append(vod)
+        return results
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self.conn.close()
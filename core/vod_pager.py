@@ -0,0 +1,85 @@
+"""
+VOD 페이지 로더
+무한 스크롤용으로 다음 페이지를 한 페이지 앞서 미리 가져옴
+전체 수집 전인 채널은 API에서, 수집이 끝난 채널은 로컬 인덱스에서 페이지를 읽음
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class VODPager:
+    """VOD 페이지 로더 클래스"""
+
+    def __init__(self, api, channel_id, page_size=50):
+        """
+        Args:
+            api: ChzzkAPI 인스턴스
+            channel_id: 채널 ID
+            page_size: 페이지당 항목 수
+        """
+        self.api = api
+        self.channel_id = channel_id
+        self.page_size = page_size
+        self.next_page = 0
+        self.has_more = True
+
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="VODPager")
+        self._prefetch = None  # (페이지 번호, Future)
+        self._seen = set()  # 이미 반환한 videoNo
+        self._closed = False
+
+    def fetch_next(self):
+        """
+        다음 페이지 가져오기 (백그라운드 스레드에서 호출)
+
+        미리 받아 둔 페이지가 있으면 그것을 사용하고,
+        반환하기 전에 그다음 페이지를 미리 요청한다.
+
+        Returns:
+            list: VOD 목록 (더 없으면 빈 리스트)
+        """
+        with self._lock:
+            if not self.has_more:
+                return []
+
+            page = self.next_page
+            if self._prefetch and self._prefetch[0] == page:
+                future = self._prefetch[1]
+                self._prefetch = None
+            else:
+                future = None
+
+        vod_list = future.result() if future else self._fetch(page)
+        fetched = len(vod_list)
+
+        with self._lock:
+            # 페이지 사이에 새 VOD가 올라오거나 API에서 인덱스로 바뀌면
+            # 앞 페이지의 항목이 다시 나올 수 있으므로 제외
+            vod_list = [vod for vod in vod_list if vod.get('videoNo') not in self._seen]
+            self._seen.update(vod.get('videoNo') for vod in vod_list)
+            self.next_page = page + 1
+            self.has_more = fetched >= self.page_size
+            if self.has_more and not self._closed:
+                self._prefetch = (
+                    self.next_page,
+                    self._executor.submit(self._fetch, self.next_page)
+                )
+
+        logger.info(f"VOD 페이지 로드: {self.channel_id} {page}페이지 ({len(vod_list)}개)")
+        return vod_list
+
+    def close(self):
+        """미리 가져오기 중지"""
+        with self._lock:
+            self._closed = True
+            self._prefetch = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch(self, page):
+        """페이지 요청 (수집 완료 여부는 페이지마다 다시 확인)"""
+        return self.api.get_vod_page(self.channel_id, page=page, size=self.page_size)
@@ -0,0 +1,61 @@
+"""
+VOD 목록 스냅샷
+마지막으로 받은 VOD 목록을 채널별로 저장하여 시작 즉시 표시
+"""
+import gzip
+import json
+import os
+import threading
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# 화면 표시에 필요한 필드만 저장
+SNAPSHOT_FIELDS = ('videoNo', 'videoTitle', 'publishDate', 'duration', 'thumbnailImageUrl')
+
+
+class VODSnapshot:
+    """VOD 목록 스냅샷 클래스"""
+
+    def __init__(self, cache_dir='cache/snapshots'):
+        self.cache_dir = cache_dir
+
+    def load(self, channel_id):
+        """
+        저장된 VOD 목록 로드
+
+        Returns:
+            list: VOD 목록 (없거나 읽을 수 없으면 빈 리스트)
+        """
+        path = self._path(channel_id)
+        if not os.path.exists(path):
+            return []
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                vods = json.load(f)
+            logger.info(f"VOD 스냅샷 로드: {channel_id} ({len(vods)}개)")
+            return vods
+        except (OSError, ValueError) as e:
+            logger.warning(f"VOD 스냅샷 로드 실패: {e}")
+            return []
+
+    def save(self, channel_id, vods):
+        """VOD 목록 저장 (임시 파일에 쓴 뒤 교체)"""
+        compact = [
+            {field: vod[field] for field in SNAPSHOT_FIELDS if field in vod}
+            for vod in vods
+        ]
+        try:
+            if not os.path.exists(self.cache_dir):
+                os.makedirs(self.cache_dir)
+            path = self._path(channel_id)
+            tmp_path = f'{path}.{threading.get_ident()}.tmp'
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(compact, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"VOD 스냅샷 저장 실패: {e}")
+
+    def _path(self, channel_id):
+        return os.path.join(self.cache_dir, f'{channel_id}.json.gz')
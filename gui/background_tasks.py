@@ -0,0 +1,115 @@
+"""
+GUI 백그라운드 작업
+작업 종류별 세대 번호로 이전 요청의 결과를 버리는 공용 스레드 풀
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class BackgroundTasks:
+    """GUI 백그라운드 작업 실행 클래스"""
+
+    def __init__(self, root, max_workers=4):
+        """
+        Args:
+            root: 메인 스레드 콜백에 사용할 Tk 위젯
+            max_workers: 최대 작업 스레드 수
+        """
+        self.root = root
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="GUI-Task"
+        )
+        self._lock = threading.Lock()
+        self._generations = {}  # kind -> 최신 세대 번호
+        self._futures = {}  # kind -> 최신 Future
+        self._closed = False
+
+    def submit(self, kind, fn, *args, on_success=None, on_error=None, on_stale=None):
+        """
+        작업 실행
+
+        같은 kind의 새 작업이 들어오면 이전 작업은 아직 시작 전이면 취소되고,
+        이미 실행 중이면 끝난 뒤 결과가 버려진다.
+
+        Args:
+            kind: 작업 종류 ('vod_list', 'search' 등)
+            fn: 작업자 스레드에서 실행할 함수
+            on_success: 결과를 받을 함수 (메인 스레드, 최신 작업일 때만)
+            on_error: 예외를 받을 함수 (메인 스레드, 최신 작업일 때만)
+            on_stale: 버려진 결과를 정리할 함수
+
+        Returns:
+            int: 세대 번호 (없으면 None)
+        """
+        with self._lock:
+            if self._closed:
+                return None
+            generation = self._generations.get(kind, 0) + 1
+            self._generations[kind] = generation
+            previous = self._futures.get(kind)
+            if previous is not None and previous.cancel():
+                logger.debug(f"대기 중인 작업 취소: {kind}")
+            future = self._executor.submit(
+                self._run, kind, generation, fn, args, on_success, on_error, on_stale
+            )
+            self._futures[kind] = future
+        return generation
+
+    def cancel(self, kind):
+        """해당 종류의 진행 중인 작업 결과를 모두 버림"""
+        with self._lock:
+            self._generations[kind] = self._generations.get(kind, 0) + 1
+            future = self._futures.pop(kind, None)
+        if future is not None:
+            future.cancel()
+
+    def is_current(self, kind, generation):
+        """최신 작업인지 확인"""
+        with self._lock:
+            return self._generations.get(kind) == generation
+
+    def shutdown(self):
+        """대기 중인 작업 취소 후 종료 (실행 중인 작업은 기다리지 않음)"""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, kind, generation, fn, args, on_success, on_error, on_stale):
+        """작업자 스레드에서 실행"""
+        if not self.is_current(kind, generation):
+            return
+
+        try:
+            result = fn(*args)
+        except Exception as e:
+            if self.is_current(kind, generation) and on_error:
+                self._call_soon(kind, generation, on_error, e)
+            return
+
+        if not self.is_current(kind, generation):
+            logger.debug(f"이전 작업 결과 무시: {kind}")
+            if on_stale:
+                on_stale(result)
+            return
+        if on_success:
+            self._call_soon(kind, generation, on_success, result, on_stale)
+
+    def _call_soon(self, kind, generation, callback, value, on_stale=None):
+        """메인 스레드에서 콜백 (그 사이 새 작업이 들어왔으면 무시)"""
+        def deliver():
+            if self.is_current(kind, generation):
+                callback(value)
+            elif on_stale:
+                logger.debug(f"이전 작업 결과 무시: {kind}")
+                on_stale(value)
+
+        try:
+            self.root.after(0, deliver)
+        except RuntimeError:
+            # 메인 루프가 종료됨
+            pass
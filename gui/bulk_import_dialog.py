@@ -0,0 +1,116 @@
+"""
+일괄 추가 다이얼로그
+여러 VOD/채널 URL을 붙여넣거나 파일에서 불러와 한 번에 다운로드 목록에 추가
+"""
+from tkinter import filedialog
+import customtkinter as ctk
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class BulkImportDialog(ctk.CTkToplevel):
+    """일괄 추가 다이얼로그"""
+
+    def __init__(self, parent, on_import):
+        """
+        Args:
+            parent: 부모 윈도우
+            on_import: 입력한 텍스트를 받을 함수 (완료되면 show_result 호출)
+        """
+        super().__init__(parent)
+
+        self.on_import = on_import
+
+        # 윈도우 설정
+        self.title("URL 일괄 추가")
+        self.geometry("600x450")
+
+        self.transient(parent)
+
+        # UI 구성
+        self._setup_ui()
+
+    def _setup_ui(self):
+        """UI 구성"""
+        main_frame = ctk.CTkFrame(self)
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+        guide_label = ctk.CTkLabel(
+            main_frame,
+            text="VOD 또는 채널 URL을 한 줄에 하나씩 입력하세요.\n채널 URL은 채널의 모든 VOD로 펼쳐집니다.",
+            font=ctk.CTkFont(size=13),
+            justify="left"
+        )
+        guide_label.pack(pady=(0, 10), anchor="w")
+
+        self.url_textbox = ctk.CTkTextbox(main_frame, wrap="none")
+        self.url_textbox.pack(fill="both", expand=True, pady=(0, 10))
+
+        self.status_label = ctk.CTkLabel(main_frame, text="", font=ctk.CTkFont(size=12))
+        self.status_label.pack(pady=(0, 10), anchor="w")
+
+        button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        button_frame.pack(fill="x")
+
+        open_button = ctk.CTkButton(
+            button_frame,
+            text="파일 열기",
+            command=self._on_open_file,
+            width=100
+        )
+        open_button.pack(side="left")
+
+        close_button = ctk.CTkButton(
+            button_frame,
+            text="닫기",
+            command=self.destroy,
+            width=100,
+            fg_color="gray"
+        )
+        close_button.pack(side="right")
+
+        self.import_button = ctk.CTkButton(
+            button_frame,
+            text="추가",
+            command=self._on_import_click,
+            width=100
+        )
+        self.import_button.pack(side="right", padx=(0, 10))
+
+    def _on_open_file(self):
+        """텍스트 파일에서 URL 불러오기"""
+        path = filedialog.askopenfilename(
+            parent=self,
+            filetypes=[("텍스트 파일", "*.txt"), ("모든 파일", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error(f"URL 파일 읽기 실패: {e}")
+            self.status_label.configure(text=f"파일을 읽을 수 없습니다: {e}")
+            return
+        self.url_textbox.delete("1.0", "end")
+        self.url_textbox.insert("1.0", text)
+
+    def _on_import_click(self):
+        """추가 버튼 클릭"""
+        text = self.url_textbox.get("1.0", "end").strip()
+        if not text:
+            self.status_label.configure(text="URL을 입력하세요.")
+            return
+
+        self.import_button.configure(state="disabled")
+        self.status_label.configure(text="URL 확인 및 채널 VOD 조회 중...")
+        self.on_import(text)
+
+    def show_result(self, message):
+        """가져오기 결과 표시"""
+        if not self.winfo_exists():
+            return
+        self.status_label.configure(text=message)
+        self.import_button.configure(state="normal")
@@ -1,8 +1,33 @@
 """
 다운로드 상태 프레임
 """
+import itertools
+from collections import OrderedDict, deque
+from datetime import datetime
 import customtkinter as ctk
-from utils.logger import logger
+from core.telemetry import aggregate, format_eta, format_speed
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# 끝난 작업 상태 (위젯 대신 기록으로 표시)
+FINISHED_STATUSES = ('completed', 'failed', 'cancelled')
+
+STATUS_LABELS = {
+    'completed': '완료',
+    'failed': '실패',
+    'cancelled': '중지됨',
+}
+
+# 기록 한 페이지의 항목 수
+HISTORY_PAGE_SIZE = 20
+
+# 위젯으로 표시할 최대 작업 수 (나머지는 대기 개수로만 표시)
+MAX_ACTIVE_WIDGETS = 30
+
+# 전체 속도/남은 시간 갱신 간격 (밀리초)
+SUMMARY_INTERVAL_MS = 500
 
 
 class DownloadItem(ctk.CTkFrame):
@@ -95,7 +120,10 @@ class DownloadItem(ctk.CTkFrame):
 
         # 상태 텍스트 업데이트
         if task.status == 'downloading':
-            status_text = f"다운로드 중: {task.progress:.1f}% | 속도: {task.speed} | 남은 시간: {task.eta}"
+            status_text = (
+                f"다운로드 중: {task.progress:.1f}% | 속도: {format_speed(task.speed)} "
+                f"| 남은 시간: {format_eta(task.eta)}"
+            )
             self.cancel_button.configure(state="normal")  # 중지 버튼 활성화
         elif task.status == 'completed':
             status_text = "완료"
@@ -113,14 +141,24 @@ class DownloadItem(ctk.CTkFrame):
 
 
 class DownloadFrame(ctk.CTkScrollableFrame):
-    """다운로드 프레임 클래스"""
+    """다운로드 프레임 클래스
+
+    진행 중/대기 중인 작업만 위젯으로 표시하고, 끝난 작업은
+    데이터로만 보관하여 페이지 단위 기록으로 보여준다.
+    """
 
-    def __init__(self, master, on_cancel=None, on_remove=None, **kwargs):
+    def __init__(self, master, on_cancel=None, on_remove=None, on_clear_history=None,
+                 history_limit=500, **kwargs):
         super().__init__(master, **kwargs)
 
         self.download_items = {}  # vod_url -> DownloadItem
+        self.waiting = OrderedDict()  # vod_url -> DownloadTask (위젯 없이 대기)
         self.on_cancel = on_cancel
         self.on_remove = on_remove
+        self.on_clear_history = on_clear_history
+        self.history = deque(maxlen=history_limit)  # 끝난 작업 기록 (dict)
+        self.history_page = 0
+        self._summary_job = None
 
         self._setup_ui()
 
@@ -132,18 +170,99 @@ class DownloadFrame(ctk.CTkScrollableFrame):
             text="다운로드 상태",
             font=ctk.CTkFont(size=16, weight="bold")
         )
-        title_label.pack(padx=10, pady=10)
+        title_label.pack(padx=10, pady=(10, 0))
+
+        # 전체 속도와 대기열 남은 시간
+        self.summary_label = ctk.CTkLabel(self, text="", font=ctk.CTkFont(size=11))
+        self.summary_label.pack(padx=10, pady=(0, 10))
+
+        # 진행 중인 항목
+        self.active_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.active_frame.pack(fill="x")
 
         # 초기 메시지
         self.empty_label = ctk.CTkLabel(
-            self,
+            self.active_frame,
             text="다운로드 중인 항목이 없습니다.",
             font=ctk.CTkFont(size=12)
         )
         self.empty_label.pack(pady=20)
 
+        # 위젯 없이 대기 중인 작업 수
+        self.waiting_label = ctk.CTkLabel(self, text="", font=ctk.CTkFont(size=12))
+
+        self._setup_history()
+
+    def _setup_history(self):
+        """완료 기록 영역 구성"""
+        history_frame = ctk.CTkFrame(self)
+        history_frame.pack(fill="x", padx=5, pady=(10, 5))
+
+        self.history_label = ctk.CTkLabel(
+            history_frame,
+            text="완료 기록 (0)",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            anchor="w"
+        )
+        self.history_label.pack(padx=10, pady=(5, 0), fill="x")
+
+        self.history_text = ctk.CTkTextbox(
+            history_frame,
+            height=200,
+            font=ctk.CTkFont(size=10),
+            wrap="none"
+        )
+        self.history_text.pack(padx=5, pady=5, fill="x")
+        self.history_text.configure(state="disabled")
+
+        nav_frame = ctk.CTkFrame(history_frame, fg_color="transparent")
+        nav_frame.pack(padx=5, pady=(0, 5), fill="x")
+
+        self.prev_button = ctk.CTkButton(
+            nav_frame, text="◀", width=30, height=25,
+            command=lambda: self._change_history_page(-1)
+        )
+        self.prev_button.pack(side="left", padx=2)
+
+        self.page_label = ctk.CTkLabel(nav_frame, text="1/1", font=ctk.CTkFont(size=10))
+        self.page_label.pack(side="left", padx=5)
+
+        self.next_button = ctk.CTkButton(
+            nav_frame, text="▶", width=30, height=25,
+            command=lambda: self._change_history_page(1)
+        )
+        self.next_button.pack(side="left", padx=2)
+
+        clear_button = ctk.CTkButton(
+            nav_frame, text="기록 지우기", width=70, height=25,
+            command=self._on_clear_history
+        )
+        clear_button.pack(side="right", padx=2)
+
     def add_task(self, task):
         """다운로드 작업 추가"""
+        self._add(task)
+        self._update_waiting_label()
+        self._schedule_summary()
+        logger.info(f"다운로드 항목 추가: {task.title}")
+
+    def add_tasks(self, tasks):
+        """여러 다운로드 작업을 한 번에 추가 (위젯은 MAX_ACTIVE_WIDGETS개까지만 생성)"""
+        for task in tasks:
+            self._add(task)
+        self._update_waiting_label()
+        self._schedule_summary()
+        logger.info(f"다운로드 항목 일괄 추가: {len(tasks)}개 (대기 {len(self.waiting)}개)")
+
+    def _add(self, task):
+        """위젯 수에 여유가 있으면 위젯 생성, 없으면 대기 목록에 추가"""
+        if len(self.download_items) >= MAX_ACTIVE_WIDGETS:
+            self.waiting[task.vod_url] = task
+        else:
+            self._create_item(task)
+
+    def _create_item(self, task):
+        """다운로드 항목 위젯 생성"""
         # 빈 메시지 제거
         if self.empty_label:
             self.empty_label.destroy()
@@ -151,7 +270,7 @@ class DownloadFrame(ctk.CTkScrollableFrame):
 
         # 다운로드 항목 생성
         download_item = DownloadItem(
-            self, task,
+            self.active_frame, task,
             on_cancel=self.on_cancel,
             on_remove=self._on_remove_item
         )
@@ -159,29 +278,132 @@ class DownloadFrame(ctk.CTkScrollableFrame):
 
         self.download_items[task.vod_url] = download_item
 
-        logger.info(f"다운로드 항목 추가: {task.title}")
+    def _update_waiting_label(self):
+        """대기 개수 표시"""
+        if self.waiting:
+            self.waiting_label.configure(text=f"+ 대기 중 {len(self.waiting)}개")
+            if not self.waiting_label.winfo_ismapped():
+                self.waiting_label.pack(after=self.active_frame, pady=(0, 5))
+        else:
+            self.waiting_label.pack_forget()
 
     def _on_remove_item(self, task):
         """항목 제거 (UI에서)"""
         if self.on_remove:
             self.on_remove(task)
+        self._remove_widget(task)
 
-        # UI에서 제거
+    def _remove_widget(self, task):
+        """항목 위젯 제거"""
         if task.vod_url in self.download_items:
             item = self.download_items[task.vod_url]
             item.destroy()
             del self.download_items[task.vod_url]
 
+        # 빈 자리는 대기 중인 작업으로 채우기
+        while self.waiting and len(self.download_items) < MAX_ACTIVE_WIDGETS:
+            _, waiting_task = self.waiting.popitem(last=False)
+            self._create_item(waiting_task)
+        self._update_waiting_label()
+
         # 항목이 없으면 빈 메시지 표시
         if not self.download_items and not self.empty_label:
             self.empty_label = ctk.CTkLabel(
-                self,
+                self.active_frame,
                 text="다운로드 중인 항목이 없습니다.",
                 font=ctk.CTkFont(size=12)
             )
             self.empty_label.pack(pady=20)
 
     def update_task(self, task):
-        """다운로드 작업 업데이트"""
-        if task.vod_url in self.download_items:
+        """다운로드 작업 업데이트 (끝난 작업은 기록으로 이동)"""
+        self._schedule_summary()
+        if task.vod_url in self.waiting:
+            if task.status in FINISHED_STATUSES:
+                del self.waiting[task.vod_url]
+                self._update_waiting_label()
+                self._archive(task)
+                return
+            if task.status == 'pending':
+                return
+            # 대기 목록에 있던 작업이 시작되면 위젯으로 표시
+            del self.waiting[task.vod_url]
+            self._create_item(task)
+            self._update_waiting_label()
+
+        if task.vod_url not in self.download_items:
+            return
+
+        if task.status in FINISHED_STATUSES:
+            self._remove_widget(task)
+            self._archive(task)
+        else:
             self.download_items[task.vod_url].update(task)
+
+    def _schedule_summary(self):
+        """전체 속도 표시 갱신 예약 (진행률 콜백마다 다시 계산하지 않도록 묶음)"""
+        if self._summary_job is None:
+            self._summary_job = self.after(SUMMARY_INTERVAL_MS, self._update_summary)
+
+    def _update_summary(self):
+        """전체 속도와 대기열 남은 시간 표시"""
+        self._summary_job = None
+        tasks = [item.task for item in self.download_items.values()]
+        tasks.extend(self.waiting.values())
+        tasks = [task for task in tasks if task.status not in FINISHED_STATUSES]
+        if not tasks:
+            self.summary_label.configure(text="")
+            return
+
+        finished_sizes = [
+            record.get('total_bytes', 0) for record in self.history
+            if record['status'] == 'completed'
+        ]
+        speed, eta = aggregate(tasks, finished_sizes)
+        self.summary_label.configure(
+            text=f"전체 {format_speed(speed)} | {len(tasks)}개 남음 | 남은 시간 {format_eta(eta)}"
+        )
+
+    def _archive(self, task):
+        """끝난 작업을 기록에 추가"""
+        record = task.to_dict()
+        record['finished_at'] = datetime.now().strftime('%m-%d %H:%M')
+        self.history.append(record)
+        self.history_page = 0
+        self._render_history()
+
+    def _change_history_page(self, delta):
+        """기록 페이지 이동"""
+        self.history_page = max(0, min(self.history_page + delta, self._history_page_count() - 1))
+        self._render_history()
+
+    def _history_page_count(self):
+        return max(1, (len(self.history) + HISTORY_PAGE_SIZE - 1) // HISTORY_PAGE_SIZE)
+
+    def _render_history(self):
+        """현재 페이지의 기록만 텍스트로 표시 (최신순)"""
+        start = self.history_page * HISTORY_PAGE_SIZE
+        records = list(itertools.islice(reversed(self.history), start, start + HISTORY_PAGE_SIZE))
+
+        lines = []
+        for record in records:
+            status_text = STATUS_LABELS.get(record['status'], record['status'])
+            if record['status'] == 'failed' and record['error_message']:
+                status_text = f"{status_text}({record['error_message'][:20]})"
+            lines.append(f"[{record['finished_at']}] {status_text} {record['title']}")
+
+        self.history_text.configure(state="normal")
+        self.history_text.delete("1.0", "end")
+        self.history_text.insert("1.0", "\n".join(lines))
+        self.history_text.configure(state="disabled")
+
+        self.history_label.configure(text=f"완료 기록 ({len(self.history)})")
+        self.page_label.configure(text=f"{self.history_page + 1}/{self._history_page_count()}")
+
+    def _on_clear_history(self):
+        """기록 지우기"""
+        self.history.clear()
+        self.history_page = 0
+        self._render_history()
+        if self.on_clear_history:
+            self.on_clear_history()
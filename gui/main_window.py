@@ -4,32 +4,63 @@ CustomTkinter를 사용한 GUI
 """
 import customtkinter as ctk
 from core.config_manager import ConfigManager
-from core.chzzk_api import ChzzkAPI
 from core.downloader import Downloader
+from core.channel_watcher import ChannelWatcher
+from core.rate_limiter import RateLimitedError
+from core.vod_filter import LocalVODSearch
+from core.vod_pager import VODPager
+from core.vod_snapshot import VODSnapshot
+from gui.background_tasks import BackgroundTasks
+from gui.bulk_import_dialog import BulkImportDialog
 from gui.vod_list_frame import VODListFrame
 from gui.search_frame import SearchFrame
 from gui.download_frame import DownloadFrame
 from gui.update_dialog import UpdateDialog
-from utils.logger import logger
-from utils.validators import validate_chzzk_url
+from utils.logger import get_logger, set_levels
+from utils.profiling import install_signal_handler, profiling_session
+from utils.startup_profiler import startup_profiler
+from utils.validators import validate_chzzk_url, extract_channel_id, extract_video_id
 from utils.version_checker import VersionChecker, get_current_version
 
 
+logger = get_logger(__name__)
+
+
 class MainWindow(ctk.CTk):
     """메인 윈도우 클래스"""
 
-    def __init__(self):
+    def __init__(self, attach_url=None):
+        """
+        Args:
+            attach_url: 다운로드 데몬 주소 (지정하면 자체 다운로더 대신 데몬의 다운로더 사용)
+        """
         super().__init__()
 
-        # 설정 로드
+        # 설정 로드 (API와 다운로더는 창을 띄운 뒤 백그라운드에서 초기화)
         self.config_manager = ConfigManager()
-        self.api = ChzzkAPI()
-        self.downloader = Downloader(
-            max_concurrent=self.config_manager.get('max_concurrent_downloads', 3)
+        set_levels(self.config_manager.get('log_levels', {}))
+        self.config_manager.add_listener(
+            lambda changed: set_levels(changed['log_levels']),
+            keys=['log_levels']
         )
+        self.api = None
+        self.downloader = None
+        self.attach_url = attach_url
+        self.vod_pager = None
+        self.channel_watcher = None
+        self.vod_snapshot = VODSnapshot()
+        self.bulk_import_dialog = None
+        self.local_search = LocalVODSearch()  # 불러온 VOD (입력 중 필터링용)
+        self._search_keyword = ''
+        self.tasks = BackgroundTasks(self)  # 목록 로드/검색 등 공용 작업 스레드
+        self._pending_actions = []  # 초기화 전에 들어온 요청
+        self._startup_steps_left = 2  # 첫 화면 표시, 백엔드 준비
 
         # 윈도우 설정
-        self.title(f"사모장 치지직 다시보기 다운로더 v{get_current_version()}")
+        title = f"사모장 치지직 다시보기 다운로더 v{get_current_version()}"
+        if attach_url:
+            title += f" (데몬 연결: {attach_url})"
+        self.title(title)
         self.geometry("1200x700")
 
         # 테마 설정
@@ -38,23 +69,102 @@ class MainWindow(ctk.CTk):
         ctk.set_default_color_theme("blue")
 
         # UI 초기화
-        self._setup_ui()
+        with startup_profiler.measure("UI 구성"):
+            self._setup_ui()
 
-        # 다운로더 시작
-        self.downloader.start()
-        self.downloader.add_progress_callback(self._on_download_progress)
+        # 마지막으로 본 VOD 목록을 바로 표시 (최신 목록은 백그라운드에서 반영)
+        with startup_profiler.measure("VOD 스냅샷 표시"):
+            self._show_snapshot()
 
         # 다운로드 디렉토리 확인
         self.config_manager.ensure_download_path()
 
         logger.info("메인 윈도우 초기화 완료")
+        self.after_idle(self._on_first_idle)
 
         # 버전 체크 (백그라운드)
         self._check_for_updates()
 
+        # API/다운로더 초기화 (백그라운드)
+        self.tasks.submit(
+            'backend',
+            self._init_backend_thread,
+            on_success=self._on_backend_ready,
+            on_error=lambda e: self._on_task_error("초기화 오류", e)
+        )
+
+    def _init_backend_thread(self):
+        """API와 다운로더 초기화 (백그라운드 스레드)"""
+        with startup_profiler.measure("ChzzkAPI 초기화"):
+            from core.chzzk_api import ChzzkAPI
+            api = ChzzkAPI()
+        with startup_profiler.measure("Downloader 초기화"):
+            if self.attach_url:
+                from core.daemon import RemoteDownloader
+                downloader = RemoteDownloader(
+                    self.attach_url,
+                    on_new_task=lambda task: self.after(0, lambda: self.download_frame.add_task(task))
+                )
+                downloader.ping()
+            else:
+                downloader = Downloader(
+                    max_concurrent=self.config_manager.get('max_concurrent_downloads', 3),
+                    history_limit=self.config_manager.get('download_history_limit', 500),
+                    rate_limit=self.config_manager.get('download_rate_limit', 0)
+                )
+        return api, downloader
+
+    def _on_backend_ready(self, backend):
+        """백엔드 준비 완료 (메인 스레드)"""
+        api, downloader = backend
+        self.api = api
+        self.downloader = downloader
+
+        # 다운로더 시작 (동시 다운로드 수는 설정 변경 시 바로 반영)
+        self.downloader.start()
+        self.config_manager.add_listener(
+            lambda changed: self.downloader.set_max_concurrent(changed['max_concurrent_downloads']),
+            keys=['max_concurrent_downloads']
+        )
+        self.config_manager.add_listener(
+            lambda changed: self.downloader.set_rate_limit(changed['download_rate_limit']),
+            keys=['download_rate_limit']
+        )
+        self.downloader.add_progress_callback(self._on_download_progress)
+
         # 자동으로 VOD 목록 로드
         self._auto_load_vod_list()
 
+        # 감시 채널 확인 시작
+        self._start_channel_watcher()
+
+        # 기다리던 요청 실행
+        pending, self._pending_actions = self._pending_actions, []
+        for action in pending:
+            action()
+
+        startup_profiler.mark("백엔드 준비 완료")
+        self._finish_startup_step()
+
+    def _on_first_idle(self):
+        """첫 화면이 그려진 시점"""
+        startup_profiler.mark("첫 화면 표시")
+        self._finish_startup_step()
+
+    def _finish_startup_step(self):
+        """시작 단계가 모두 끝나면 측정 결과 출력"""
+        self._startup_steps_left -= 1
+        if self._startup_steps_left == 0:
+            startup_profiler.report()
+
+    def _run_when_ready(self, action):
+        """백엔드가 준비되면 실행 (이미 준비됐으면 바로 실행)"""
+        if self.api and self.downloader:
+            action()
+        else:
+            logger.info("초기화 중입니다. 완료 후 실행합니다.")
+            self._pending_actions.append(action)
+
     def _setup_ui(self):
         """UI 구성"""
         # 그리드 설정
@@ -148,6 +258,27 @@ class MainWindow(ctk.CTk):
         )
         theme_menu.grid(row=8, column=0, padx=20, pady=(5, 10))
 
+        # URL 일괄 추가
+        bulk_import_button = ctk.CTkButton(
+            sidebar,
+            text="URL 일괄 추가",
+            command=self._open_bulk_import
+        )
+        bulk_import_button.grid(row=9, column=0, padx=20, pady=(20, 10))
+
+        # 디버그: 일정 시간 프로파일링 (결과는 logs 폴더)
+        self.profile_button = ctk.CTkButton(
+            sidebar,
+            text="프로파일링 시작",
+            command=self._toggle_profiling,
+            fg_color="gray"
+        )
+        self.profile_button.grid(row=11, column=0, padx=20, pady=(10, 20))
+        profiling_session.listeners.append(self._on_profiling_state)
+        if install_signal_handler(profiling_session, schedule=self.after, cancel=self.after_cancel):
+            # Tk 루프 중에도 신호 처리기가 실행되도록 주기적으로 Python 코드 실행
+            self._signal_heartbeat()
+
     def _create_main_area(self):
         """중앙 영역 생성"""
         main_frame = ctk.CTkFrame(self)
@@ -156,11 +287,15 @@ class MainWindow(ctk.CTk):
         main_frame.grid_columnconfigure(0, weight=1)
 
         # 검색 프레임
-        self.search_frame = SearchFrame(main_frame, self._on_search)
+        self.search_frame = SearchFrame(main_frame, self._on_search, self._on_search_typing)
         self.search_frame.grid(row=0, column=0, padx=10, pady=(10, 5), sticky="ew")
 
         # VOD 목록 프레임
-        self.vod_list_frame = VODListFrame(main_frame, self._on_download_click)
+        self.vod_list_frame = VODListFrame(
+            main_frame,
+            self._on_download_click,
+            load_more_callback=self._on_load_more
+        )
         self.vod_list_frame.grid(row=1, column=0, padx=10, pady=(5, 10), sticky="nsew")
 
     def _create_download_panel(self):
@@ -169,7 +304,9 @@ class MainWindow(ctk.CTk):
             self,
             width=300,
             on_cancel=self._on_cancel_download,
-            on_remove=self._on_remove_download
+            on_remove=self._on_remove_download,
+            on_clear_history=self._on_clear_history,
+            history_limit=self.config_manager.get('download_history_limit', 500)
         )
         self.download_frame.grid(row=0, column=2, padx=(0, 10), pady=10, sticky="nsew")
 
@@ -177,17 +314,47 @@ class MainWindow(ctk.CTk):
         """자동 VOD 목록 로드 (초기화 시)"""
         saved_url = self.config_manager.get('channel_url', '')
         if saved_url:
-            from utils.validators import extract_channel_id
             channel_id = extract_channel_id(saved_url)
             if channel_id:
                 logger.info(f"자동 VOD 목록 로드 시작: {channel_id}")
-                import threading
-                thread = threading.Thread(
-                    target=self._load_vod_list_thread,
-                    args=(channel_id,),
-                    daemon=True
-                )
-                thread.start()
+                self._submit_vod_list(channel_id)
+
+    def _show_snapshot(self):
+        """저장된 채널의 마지막 VOD 목록 표시"""
+        channel_id = extract_channel_id(self.config_manager.get('channel_url', ''))
+        if not channel_id:
+            return
+        vod_list = self.vod_snapshot.load(channel_id)
+        if vod_list:
+            self.local_search.set_vods(vod_list)
+            self.vod_list_frame.display_vods(vod_list)
+
+    def _start_channel_watcher(self):
+        """감시 채널 설정이 있으면 채널 감시 시작"""
+        channel_ids = []
+        for url in self.config_manager.get('watched_channels', []):
+            channel_id = extract_channel_id(url)
+            if channel_id:
+                channel_ids.append(channel_id)
+            else:
+                logger.warning(f"감시 채널 URL 무시: {url}")
+
+        if not channel_ids:
+            return
+
+        self.channel_watcher = ChannelWatcher(
+            self.api,
+            self.downloader,
+            quality=self.config_manager.get('default_quality', 'best'),
+            output_path=self.config_manager.get('download_path', 'downloads'),
+            interval=self.config_manager.get('watch_interval_seconds', 600),
+            requests_per_minute=self.config_manager.get('watch_requests_per_minute', 30),
+            auto_enqueue=self.config_manager.get('auto_start_download', False),
+            on_enqueue=lambda task: self.after(0, lambda: self.download_frame.add_task(task))
+        )
+        for channel_id in channel_ids:
+            self.channel_watcher.add_channel(channel_id)
+        self.channel_watcher.start()
 
     def _load_vod_list(self):
         """VOD 목록 로드"""
@@ -203,7 +370,6 @@ class MainWindow(ctk.CTk):
         self.config_manager.set('channel_url', url)
 
         # 채널 ID 추출
-        from utils.validators import extract_channel_id
         channel_id = extract_channel_id(url)
 
         if not channel_id:
@@ -213,31 +379,127 @@ class MainWindow(ctk.CTk):
         logger.info(f"VOD 목록 로드 시작: {channel_id}")
 
         # 백그라운드에서 로드
-        import threading
-        thread = threading.Thread(
-            target=self._load_vod_list_thread,
-            args=(channel_id,),
-            daemon=True
+        self._run_when_ready(lambda: self._submit_vod_list(channel_id))
+
+    def _submit_vod_list(self, channel_id):
+        """VOD 목록 로드 요청 (이전 채널의 로드/검색 결과는 버림)"""
+        self.tasks.cancel('search')
+        self.tasks.cancel('load_more')
+        self.tasks.submit(
+            'vod_list',
+            self._load_vod_list_thread,
+            channel_id,
+            on_success=self._show_first_page,
+            on_error=lambda e: self._on_task_error("로드 오류", e),
+            on_stale=lambda result: result[0].close()
         )
-        thread.start()
 
     def _load_vod_list_thread(self, channel_id):
         """VOD 목록 로드 (백그라운드 스레드)"""
-        try:
-            # VOD 목록 가져오기
-            vod_list = self.api.get_vod_list(channel_id, page=0, size=50)
+        # 전에 본 채널은 새 VOD만 동기화, 처음 보는 채널은 첫 페이지를 API에서 바로 가져옴
+        if self.api.has_sync_baseline(channel_id):
+            self.api.sync_channel(channel_id)
+        pager = VODPager(self.api, channel_id, page_size=50)
+        vod_list = pager.fetch_next()
+        self.vod_snapshot.save(channel_id, vod_list)
+        return pager, vod_list
+
+    def _show_first_page(self, result):
+        """첫 페이지 표시 후 이후 페이지는 스크롤 시 로드"""
+        pager, vod_list = result
+        if self.vod_pager:
+            self.vod_pager.close()
+        self.vod_pager = pager
+        self.local_search.set_vods(vod_list)
+        if self._search_keyword:
+            self._apply_local_filter()
+        else:
+            self.vod_list_frame.display_vods(vod_list, has_more=pager.has_more)
+
+        # 전체 수집은 첫 화면을 그린 뒤 백그라운드에서
+        if not self.api.is_channel_synced(pager.channel_id):
+            self.tasks.submit(
+                'crawl',
+                self._crawl_channel_thread,
+                pager,
+                on_success=self._merge_crawled,
+                on_error=lambda e: self._on_task_error("채널 수집 오류", e)
+            )
+
+    def _crawl_channel_thread(self, pager):
+        """채널 전체 수집 (백그라운드 스레드)"""
+        self.api.resume_crawl(pager.channel_id, size=pager.page_size)
+        loaded = len(self.local_search.vods)
+        return pager, self.api.get_stored_vods(pager.channel_id, page=0, size=loaded)
+
+    def _merge_crawled(self, result):
+        """수집이 끝나면 불러온 범위를 인덱스 내용으로 갱신 (그 사이 목록이 바뀌었으면 무시)"""
+        pager, vod_list = result
+        if pager is not self.vod_pager or len(vod_list) < len(self.local_search.vods):
+            return
+        self.local_search.set_vods(vod_list)
+        if self._search_keyword:
+            self._apply_local_filter()
+        else:
+            self.vod_list_frame.display_vods(vod_list, has_more=pager.has_more)
+
+    def _on_load_more(self):
+        """목록 끝에 가까워졌을 때 다음 페이지 로드"""
+        pager = self.vod_pager
+        if not pager:
+            return
+
+        self.tasks.submit(
+            'load_more',
+            self._load_more_thread,
+            pager,
+            on_success=self._append_page,
+            on_error=lambda e: self._on_load_more_error(pager, e)
+        )
+
+    def _load_more_thread(self, pager):
+        """다음 페이지 로드 (백그라운드 스레드)"""
+        return pager, pager.fetch_next()
+
+    def _on_load_more_error(self, pager, error):
+        """다음 페이지 로드 실패 (다시 스크롤하면 재시도)"""
+        logger.error(f"다음 페이지 로드 오류: {error}")
+        self._append_page((pager, []))
+
+    def _append_page(self, result):
+        """다음 페이지 추가 (그 사이 목록이 바뀌었으면 무시)"""
+        pager, vod_list = result
+        if pager is not self.vod_pager:
+            return
+        self.local_search.add_vods(vod_list)
+        if self._search_keyword:
+            self._apply_local_filter()
+        else:
+            self.vod_list_frame.append_vods(vod_list, has_more=pager.has_more)
+
+    def _on_search_typing(self, keyword):
+        """입력 중 검색 콜백 (불러온 VOD를 메모리에서 필터링)"""
+        self._search_keyword = keyword
+        if not keyword:
+            # 검색어를 지우면 원래 목록과 페이지 로드 복원
+            has_more = self.vod_pager.has_more if self.vod_pager else False
+            self.vod_list_frame.display_vods(self.local_search.vods, has_more=has_more)
+            return
 
-            # UI 업데이트 (메인 스레드에서)
-            self.after(0, lambda: self.vod_list_frame.display_vods(vod_list))
+        results = self._apply_local_filter()
+        # 불러온 범위에 없고 남은 페이지가 있을 때만 전체 검색
+        if not results and self.vod_pager and self.vod_pager.has_more:
+            self._on_search(keyword)
 
-        except Exception as e:
-            logger.error(f"VOD 목록 로드 오류: {e}")
-            self.after(0, lambda: self._show_error("로드 오류", str(e)))
+    def _apply_local_filter(self):
+        """현재 검색어로 불러온 VOD 필터링 후 표시"""
+        results = self.local_search.search(self._search_keyword)
+        self.vod_list_frame.display_vods(results, keep_position=False)
+        return results
 
     def _on_search(self, keyword):
         """검색 콜백"""
         url = self.channel_url_entry.get().strip()
-        from utils.validators import extract_channel_id
         channel_id = extract_channel_id(url)
 
         if not channel_id:
@@ -245,24 +507,46 @@ class MainWindow(ctk.CTk):
             return
 
         logger.info(f"검색: {keyword}")
-
-        # 백그라운드에서 검색
-        import threading
-        thread = threading.Thread(
-            target=self._search_vods_thread,
-            args=(channel_id, keyword),
-            daemon=True
-        )
-        thread.start()
+        self._search_keyword = keyword
+
+        # 백그라운드에서 검색 (이전 검색 결과는 버림)
+        self._run_when_ready(lambda: self.tasks.submit(
+            'search',
+            self._search_vods_thread,
+            channel_id,
+            keyword,
+            on_success=self._show_search_results,
+            on_error=lambda e: self._on_task_error("검색 오류", e)
+        ))
 
     def _search_vods_thread(self, channel_id, keyword):
         """VOD 검색 (백그라운드 스레드)"""
-        try:
-            results = self.api.search_vods(channel_id, keyword)
-            self.after(0, lambda: self.vod_list_frame.display_vods(results))
-        except Exception as e:
-            logger.error(f"검색 오류: {e}")
-            self.after(0, lambda: self._show_error("검색 오류", str(e)))
+        # 검색 전에 확인해야 수집 도중 끝난 경우에도 다시 검색함
+        complete = self.api.is_channel_synced(channel_id)
+        return channel_id, keyword, self.api.search_vods(channel_id, keyword), complete
+
+    def _search_after_crawl_thread(self, channel_id, keyword):
+        """진행 중인 채널 수집이 끝나길 기다렸다가 다시 검색 (백그라운드 스레드)"""
+        self.api.resume_crawl(channel_id)
+        return channel_id, keyword, self.api.search_vods(channel_id, keyword), True
+
+    def _show_search_results(self, result):
+        """검색 결과 표시 (그 사이 검색어가 바뀌었으면 무시)"""
+        channel_id, keyword, results, complete = result
+        if keyword != self._search_keyword:
+            return
+        self.vod_list_frame.display_vods(results, keep_position=False)
+
+        # 수집 중인 채널은 지금까지의 결과를 먼저 보여 주고 수집이 끝나면 갱신
+        if not complete:
+            self.tasks.submit(
+                'search',
+                self._search_after_crawl_thread,
+                channel_id,
+                keyword,
+                on_success=self._show_search_results,
+                on_error=lambda e: self._on_task_error("검색 오류", e)
+            )
 
     def _on_download_click(self, vod_info):
         """다운로드 버튼 클릭 콜백"""
@@ -281,19 +565,69 @@ class MainWindow(ctk.CTk):
         )
 
         # 다운로더에 추가
-        self.downloader.add_download(task)
-        self.download_frame.add_task(task)
+        def enqueue():
+            self.downloader.add_download(task)
+            self.download_frame.add_task(task)
+            logger.info(f"다운로드 추가: {task.title}")
+
+        self._run_when_ready(enqueue)
+
+    def _open_bulk_import(self):
+        """일괄 추가 다이얼로그 열기"""
+        if self.bulk_import_dialog and self.bulk_import_dialog.winfo_exists():
+            self.bulk_import_dialog.focus()
+            return
+        self.bulk_import_dialog = BulkImportDialog(self, self._on_bulk_import)
+
+    def _on_bulk_import(self, text):
+        """일괄 추가 콜백 (URL 확인과 채널 펼치기는 백그라운드)"""
+        dialog = self.bulk_import_dialog
+        self._run_when_ready(lambda: self.tasks.submit(
+            'bulk_import',
+            self._bulk_import_thread,
+            text,
+            self.quality_var.get(),
+            self.config_manager.get('download_path', 'downloads'),
+            on_success=lambda result: self._enqueue_bulk_import(dialog, result),
+            on_error=lambda e: dialog.show_result(f"가져오기 실패: {e}")
+        ))
+
+    def _bulk_import_thread(self, text, quality, output_path):
+        """URL 목록을 다운로드 작업으로 변환 (백그라운드 스레드)"""
+        from core.bulk_import import BulkImporter
+
+        importer = BulkImporter(self.api)
+        return importer.build_tasks(
+            text,
+            quality=quality,
+            output_path=output_path,
+            skip_urls=self.downloader.get_pending_urls()
+        )
 
-        logger.info(f"다운로드 추가: {task.title}")
+    def _enqueue_bulk_import(self, dialog, result):
+        """변환된 작업을 한 번에 다운로더와 다운로드 패널에 추가"""
+        added = self.downloader.add_downloads(result.tasks)
+        result.duplicates += len(result.tasks) - len(added)
+        result.tasks = added
+        self.download_frame.add_tasks(added)
+        dialog.show_result(result.summary())
 
     def _on_download_progress(self, task):
         """다운로드 진행률 콜백"""
+        # 완료된 VOD는 인덱스에 표시
+        if task.status == 'completed':
+            video_id = extract_video_id(task.vod_url)
+            if video_id:
+                self.api.mark_downloaded(video_id)
+
         # UI 업데이트
         self.after(0, lambda: self.download_frame.update_task(task))
 
     def _on_cancel_download(self, task):
         """다운로드 중지 콜백"""
         self.downloader.cancel_download(task.vod_url)
+        # 대기 중이던 작업은 워커가 알리지 않으므로 바로 반영
+        self.download_frame.update_task(task)
         logger.info(f"다운로드 중지 요청: {task.title}")
 
     def _on_remove_download(self, task):
@@ -301,6 +635,11 @@ class MainWindow(ctk.CTk):
         self.downloader.remove_download(task.vod_url)
         logger.info(f"다운로드 항목 제거: {task.title}")
 
+    def _on_clear_history(self):
+        """다운로드 기록 삭제 콜백"""
+        if self.downloader:
+            self.downloader.clear_history()
+
     def _on_quality_change(self, quality):
         """화질 변경 콜백"""
         self.config_manager.set('default_quality', quality)
@@ -312,6 +651,17 @@ class MainWindow(ctk.CTk):
         self.config_manager.set('theme', theme)
         logger.info(f"테마 변경: {theme}")
 
+    def _toggle_profiling(self):
+        """프로파일링 켜기/끄기 (디버그 버튼)"""
+        profiling_session.toggle(schedule=self.after, cancel=self.after_cancel)
+
+    def _on_profiling_state(self, active):
+        """프로파일링 상태에 따라 버튼 표시 변경"""
+        self.profile_button.configure(text="프로파일링 중지" if active else "프로파일링 시작")
+
+    def _signal_heartbeat(self):
+        self.after(500, self._signal_heartbeat)
+
     def _show_error(self, title, message):
         """에러 메시지 표시"""
         dialog = ctk.CTkInputDialog(
@@ -319,32 +669,51 @@ class MainWindow(ctk.CTk):
             title=title
         )
 
+    def _on_task_error(self, title, error):
+        """백그라운드 작업 오류 표시 (메인 스레드)"""
+        if isinstance(error, RateLimitedError):
+            logger.warning(f"{title}: {error}")
+            self._show_rate_limited(error)
+            return
+        logger.error(f"{title}: {error}")
+        self._show_error(title, str(error))
+
+    def _show_rate_limited(self, error):
+        """요청 제한 상태 표시 (빈 목록과 구분)"""
+        self.vod_list_frame.show_message(
+            f"요청이 너무 많아 잠시 제한되었습니다.\n{error.retry_after:.0f}초 후 다시 시도하세요."
+        )
+
     def _check_for_updates(self):
         """업데이트 확인 (백그라운드)"""
-        import threading
-        thread = threading.Thread(target=self._check_updates_thread, daemon=True)
-        thread.start()
+        self.tasks.submit(
+            'update_check',
+            self._check_updates_thread,
+            on_success=self._show_update_dialog,
+            on_error=lambda e: logger.error(f"업데이트 확인 오류: {e}")
+        )
 
     def _check_updates_thread(self):
         """업데이트 확인 스레드"""
-        try:
-            checker = VersionChecker()
-            has_update, latest_version, download_url, release_notes = checker.check_for_updates_simple()
-
-            if has_update:
-                # UI 업데이트는 메인 스레드에서
-                self.after(0, lambda: self._show_update_dialog(
-                    latest_version, download_url, release_notes
-                ))
-        except Exception as e:
-            logger.error(f"업데이트 확인 오류: {e}")
-
-    def _show_update_dialog(self, latest_version, download_url, release_notes):
-        """업데이트 다이얼로그 표시"""
-        UpdateDialog(self, latest_version, download_url, release_notes)
+        checker = VersionChecker()
+        return checker.check_for_updates_simple()
+
+    def _show_update_dialog(self, result):
+        """업데이트가 있으면 다이얼로그 표시"""
+        has_update, latest_version, download_url, release_notes = result
+        if has_update:
+            UpdateDialog(self, latest_version, download_url, release_notes)
 
     def on_closing(self):
         """윈도우 종료 시"""
         logger.info("애플리케이션 종료")
-        self.downloader.stop()
+        profiling_session.stop()
+        self.tasks.shutdown()
+        if self.channel_watcher:
+            self.channel_watcher.stop()
+        if self.api:
+            logger.info(f"API 캐시 통계: {self.api.get_cache_stats()}")
+        if self.downloader:
+            self.downloader.stop()
+        self.config_manager.close()
         self.destroy()
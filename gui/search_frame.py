@@ -2,16 +2,30 @@
 검색 프레임
 """
 import customtkinter as ctk
-from utils.logger import logger
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# 입력이 멈춘 뒤 필터링까지 기다리는 시간 (밀리초)
+TYPING_DEBOUNCE_MS = 150
 
 
 class SearchFrame(ctk.CTkFrame):
     """검색 프레임 클래스"""
 
-    def __init__(self, master, search_callback):
+    def __init__(self, master, search_callback, typing_callback=None):
+        """
+        Args:
+            search_callback: Enter/검색 버튼 시 호출 (전체 검색)
+            typing_callback: 입력이 멈추면 호출 (불러온 VOD 필터링)
+        """
         super().__init__(master)
 
         self.search_callback = search_callback
+        self.typing_callback = typing_callback
+        self._typing_job = None
+        self._last_typed = ''
 
         self._setup_ui()
 
@@ -34,6 +48,7 @@ class SearchFrame(ctk.CTkFrame):
         )
         self.search_entry.grid(row=0, column=1, padx=5, pady=10, sticky="ew")
         self.search_entry.bind("<Return>", self._on_search)
+        self.search_entry.bind("<KeyRelease>", self._on_key_release)
 
         # 검색 버튼
         search_button = ctk.CTkButton(
@@ -44,9 +59,32 @@ class SearchFrame(ctk.CTkFrame):
         )
         search_button.grid(row=0, column=2, padx=(5, 10), pady=10)
 
+    def _on_key_release(self, event=None):
+        """입력할 때마다 필터링 예약 (연속 입력은 마지막 한 번만 처리)"""
+        if not self.typing_callback:
+            return
+        if self._typing_job is not None:
+            self.after_cancel(self._typing_job)
+        self._typing_job = self.after(TYPING_DEBOUNCE_MS, self._on_typing_idle)
+
+    def _on_typing_idle(self):
+        """입력이 멈췄을 때 필터링 실행"""
+        self._typing_job = None
+        keyword = self.search_entry.get().strip()
+        # 방향키 등으로 검색어가 바뀌지 않았으면 무시
+        if keyword == self._last_typed:
+            return
+        self._last_typed = keyword
+        self.typing_callback(keyword)
+
     def _on_search(self, event=None):
         """검색 실행"""
+        if self._typing_job is not None:
+            self.after_cancel(self._typing_job)
+            self._typing_job = None
+
         keyword = self.search_entry.get().strip()
+        self._last_typed = keyword
 
         if not keyword:
             logger.warning("검색어가 비어있습니다")
@@ -0,0 +1,216 @@
+"""
+썸네일 서비스
+제한된 작업자 스레드로 썸네일을 받아 메모리/디스크에 캐시
+"""
+import hashlib
+import itertools
+import os
+import queue
+import threading
+from collections import OrderedDict
+from io import BytesIO
+import requests
+from core.rate_limiter import RateLimitedError, rate_limiter
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# 표시 크기
+THUMBNAIL_SIZE = (160, 90)
+# 로드에 실패했을 때 표시할 빈 이미지 색
+PLACEHOLDER_COLOR = (64, 64, 64)
+
+# 우선순위 (작을수록 먼저)
+PRIORITY_VISIBLE = 0
+PRIORITY_PREFETCH = 1
+
+
+class ThumbnailTicket:
+    """썸네일 요청 (취소할 때 사용)"""
+
+    def __init__(self, url, callback):
+        self.url = url
+        self.callback = callback
+
+
+class ThumbnailService:
+    """썸네일 로드 서비스 클래스"""
+
+    def __init__(self, root, cache_dir='cache/thumbnails', max_workers=4, memory_items=300):
+        """
+        Args:
+            root: 메인 스레드 콜백에 사용할 Tk 위젯
+            cache_dir: 디스크 캐시 디렉토리
+            max_workers: 동시에 받는 썸네일 수
+            memory_items: 메모리에 유지할 PhotoImage 수
+        """
+        self.root = root
+        self.cache_dir = cache_dir
+        self.memory_items = memory_items
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._pending = {}  # url -> [ThumbnailTicket]
+        self._inflight = set()
+        self._memory = OrderedDict()  # url -> PhotoImage (메인 스레드 전용)
+        self._placeholder = None  # 실패 시 표시할 PhotoImage (메인 스레드 전용)
+
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+        for i in range(max_workers):
+            threading.Thread(
+                target=self._worker,
+                name=f"Thumbnail-{i + 1}",
+                daemon=True
+            ).start()
+
+    def request(self, url, callback, priority=PRIORITY_VISIBLE):
+        """
+        썸네일 요청 (메인 스레드에서 호출)
+
+        Args:
+            url: 썸네일 URL
+            callback: PhotoImage를 받을 함수 (메인 스레드에서 호출)
+            priority: PRIORITY_VISIBLE 또는 PRIORITY_PREFETCH
+
+        Returns:
+            ThumbnailTicket: 취소용 티켓 (메모리 캐시에 있으면 None)
+        """
+        photo = self._memory.get(url)
+        if photo is not None:
+            self._memory.move_to_end(url)
+            callback(photo)
+            return None
+
+        ticket = ThumbnailTicket(url, callback)
+        with self._lock:
+            self._pending.setdefault(url, []).append(ticket)
+        self._queue.put((priority, next(self._seq), url))
+        return ticket
+
+    def cancel(self, ticket):
+        """요청 취소 (화면 밖으로 나간 행)"""
+        if ticket is None:
+            return
+        with self._lock:
+            tickets = self._pending.get(ticket.url)
+            if tickets and ticket in tickets:
+                tickets.remove(ticket)
+                if not tickets:
+                    del self._pending[ticket.url]
+
+    def _worker(self):
+        """작업자 스레드"""
+        while True:
+            _, _, url = self._queue.get()
+            with self._lock:
+                # 취소되었거나 다른 작업자가 처리 중이면 건너뛰기
+                if url not in self._pending or url in self._inflight:
+                    continue
+                self._inflight.add(url)
+
+            img = None
+            try:
+                img = self._load(url)
+            except RateLimitedError as e:
+                logger.warning(f"썸네일 로드 보류: {e}")
+            except Exception as e:
+                logger.error(f"썸네일 로드 실패: {e}")
+
+            with self._lock:
+                self._inflight.discard(url)
+
+            try:
+                if img is None:
+                    # 기다리던 행이 빈 칸으로 남지 않도록 빈 이미지 전달
+                    self.root.after(0, self._deliver_placeholder, url)
+                else:
+                    self.root.after(0, self._deliver, url, img)
+            except RuntimeError:
+                # 메인 루프가 종료됨
+                return
+
+    def _load(self, url):
+        """디스크 캐시 또는 네트워크에서 160x90 이미지 로드"""
+        # Pillow는 첫 썸네일을 로드할 때 import (시작 시간 단축)
+        from PIL import Image
+
+        cache_path = self._cache_path(url)
+        if os.path.exists(cache_path):
+            img = Image.open(cache_path)
+            img.load()
+            return img
+
+        rate_limiter.acquire(url)
+        response = self.session.get(url, timeout=5)
+        rate_limiter.check_response(url, response)
+        if response.status_code != 200:
+            return None
+
+        img = Image.open(BytesIO(response.content))
+        # JPEG는 디코딩 단계에서 축소하여 디코딩 비용 절감
+        img.draft('RGB', THUMBNAIL_SIZE)
+        img = img.convert('RGB').resize(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+
+        tmp_path = f'{cache_path}.{threading.get_ident()}.tmp'
+        try:
+            img.save(tmp_path, 'JPEG', quality=85)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.error(f"썸네일 캐시 저장 실패: {e}")
+        return img
+
+    def _deliver(self, url, img):
+        """메인 스레드에서 PhotoImage 생성 후 콜백 호출"""
+        from PIL import ImageTk
+
+        with self._lock:
+            tickets = self._pending.pop(url, [])
+
+        photo = ImageTk.PhotoImage(img)
+        self._memory[url] = photo
+        self._memory.move_to_end(url)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+        for ticket in tickets:
+            try:
+                ticket.callback(photo)
+            except Exception as e:
+                logger.error(f"썸네일 설정 실패: {e}")
+
+    def _deliver_placeholder(self, url):
+        """
+        메인 스레드에서 실패한 URL을 기다리던 요청에 빈 이미지 전달
+
+        메모리 캐시에는 넣지 않으므로 다음에 요청하면 다시 받는다.
+        """
+        from PIL import Image, ImageTk
+
+        with self._lock:
+            tickets = self._pending.pop(url, [])
+        if not tickets:
+            return
+
+        if self._placeholder is None:
+            self._placeholder = ImageTk.PhotoImage(Image.new('RGB', THUMBNAIL_SIZE, PLACEHOLDER_COLOR))
+
+        for ticket in tickets:
+            try:
+                ticket.callback(self._placeholder)
+            except Exception as e:
+                logger.error(f"썸네일 설정 실패: {e}")
+
+    def _cache_path(self, url):
+        """URL에 해당하는 디스크 캐시 경로"""
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f'{key}.jpg')
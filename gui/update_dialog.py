@@ -3,7 +3,10 @@
 """
 import customtkinter as ctk
 import webbrowser
-from utils.logger import logger
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
 
 
 class UpdateDialog(ctk.CTkToplevel):
@@ -1,64 +1,70 @@
 """
 VOD 목록 프레임
 """
+import sys
+import tkinter as tk
 import customtkinter as ctk
-from PIL import Image, ImageTk
-import requests
-from io import BytesIO
-import threading
-from utils.logger import logger
+from gui.thumbnail_service import ThumbnailService, PRIORITY_VISIBLE, PRIORITY_PREFETCH
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# 행 하나의 높이 (썸네일 90 + 여백)
+ROW_HEIGHT = 120
+
+# 화면 밖에 미리 만들어 둘 여분 행 수
+OVERSCAN_ROWS = 2
+
+# 끝에서 이만큼 남으면 다음 페이지 요청
+LOAD_MORE_THRESHOLD_ROWS = 10
 
 
 class VODItem(ctk.CTkFrame):
-    """개별 VOD 항목"""
+    """개별 VOD 항목 (다른 VOD로 다시 바인딩하여 재사용)"""
 
-    def __init__(self, master, vod_info, download_callback):
-        super().__init__(master)
+    def __init__(self, master, download_callback, thumbnail_service, vod_info=None):
+        super().__init__(master, height=ROW_HEIGHT - 10)
 
-        self.vod_info = vod_info
+        self.vod_info = None
         self.download_callback = download_callback
+        self.thumbnail_service = thumbnail_service
+        self._thumbnail_ticket = None
+        self._thumbnail_url = None
 
         self._setup_ui()
 
+        if vod_info:
+            self.bind_vod(vod_info)
+
     def _setup_ui(self):
         """UI 구성"""
         self.grid_columnconfigure(1, weight=1)
+        self.grid_propagate(False)
 
         # 썸네일 (나중에 로드)
         self.thumbnail_label = ctk.CTkLabel(self, text="", width=160, height=90)
+        self.thumbnail_label.image = None
         self.thumbnail_label.grid(row=0, column=0, rowspan=3, padx=10, pady=10)
 
-        # 썸네일 로드 (백그라운드)
-        thumbnail_url = self.vod_info.get('thumbnailImageUrl', '')
-        if thumbnail_url:
-            threading.Thread(
-                target=self._load_thumbnail,
-                args=(thumbnail_url,),
-                daemon=True
-            ).start()
-
         # 제목
-        title = self.vod_info.get('videoTitle', 'Unknown')
-        title_label = ctk.CTkLabel(
+        self.title_label = ctk.CTkLabel(
             self,
-            text=title,
+            text="",
             font=ctk.CTkFont(size=14, weight="bold"),
             anchor="w"
         )
-        title_label.grid(row=0, column=1, padx=10, pady=(10, 5), sticky="w")
+        self.title_label.grid(row=0, column=1, padx=10, pady=(10, 5), sticky="w")
 
         # 정보 (길이, 날짜)
-        duration = self._format_duration(self.vod_info.get('duration', 0))
-        publish_date = self.vod_info.get('publishDate', '')[:10]  # YYYY-MM-DD
-        info_text = f"길이: {duration} | 업로드: {publish_date}"
-
-        info_label = ctk.CTkLabel(
+        self.info_label = ctk.CTkLabel(
             self,
-            text=info_text,
+            text="",
             font=ctk.CTkFont(size=12),
             anchor="w"
         )
-        info_label.grid(row=1, column=1, padx=10, pady=5, sticky="w")
+        self.info_label.grid(row=1, column=1, padx=10, pady=5, sticky="w")
 
         # 다운로드 버튼
         download_button = ctk.CTkButton(
@@ -69,28 +75,45 @@ class VODItem(ctk.CTkFrame):
         )
         download_button.grid(row=0, column=2, rowspan=2, padx=10, pady=10)
 
-    def _load_thumbnail(self, url):
-        """썸네일 이미지 로드"""
-        try:
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                img = Image.open(BytesIO(response.content))
-                img = img.resize((160, 90), Image.Resampling.LANCZOS)
+    def bind_vod(self, vod_info, priority=PRIORITY_VISIBLE):
+        """표시할 VOD 교체"""
+        self.vod_info = vod_info
+
+        self.title_label.configure(text=vod_info.get('videoTitle', 'Unknown'))
+
+        duration = self._format_duration(vod_info.get('duration', 0))
+        publish_date = vod_info.get('publishDate', '')[:10]  # YYYY-MM-DD
+        self.info_label.configure(text=f"길이: {duration} | 업로드: {publish_date}")
 
-                # UI 업데이트 (메인 스레드)
-                self.after(0, lambda: self._set_thumbnail(img))
+        # 같은 썸네일이 이미 표시 중이면 그대로 사용
+        thumbnail_url = vod_info.get('thumbnailImageUrl', '')
+        if thumbnail_url == self._thumbnail_url and (
+            self.thumbnail_label.image is not None or self._thumbnail_ticket is not None
+        ):
+            return
+
+        # 이전 썸네일 요청 취소 후 새로 요청
+        self.thumbnail_service.cancel(self._thumbnail_ticket)
+        self._thumbnail_ticket = None
+        self._thumbnail_url = thumbnail_url
+        self.thumbnail_label.configure(image=None)
+        self.thumbnail_label.image = None
+        if thumbnail_url:
+            self._thumbnail_ticket = self.thumbnail_service.request(
+                thumbnail_url, self._set_thumbnail, priority
+            )
 
-        except Exception as e:
-            logger.error(f"썸네일 로드 실패: {e}")
+    def release(self):
+        """화면에서 빠질 때 썸네일 요청 취소 (표시 중인 이미지는 유지)"""
+        self.thumbnail_service.cancel(self._thumbnail_ticket)
+        self._thumbnail_ticket = None
+        self.vod_info = None
 
-    def _set_thumbnail(self, img):
+    def _set_thumbnail(self, photo):
         """썸네일 설정"""
-        try:
-            photo = ImageTk.PhotoImage(img)
-            self.thumbnail_label.configure(image=photo, text="")
-            self.thumbnail_label.image = photo  # 참조 유지
-        except Exception as e:
-            logger.error(f"썸네일 설정 실패: {e}")
+        self._thumbnail_ticket = None
+        self.thumbnail_label.configure(image=photo, text="")
+        self.thumbnail_label.image = photo  # 참조 유지
 
     def _format_duration(self, seconds):
         """초를 시:분:초 형식으로 변환"""
@@ -105,51 +128,294 @@ class VODItem(ctk.CTkFrame):
 
     def _on_download_click(self):
         """다운로드 버튼 클릭"""
-        if self.download_callback:
+        if self.download_callback and self.vod_info:
             self.download_callback(self.vod_info)
 
 
-class VODListFrame(ctk.CTkScrollableFrame):
-    """VOD 목록 프레임"""
+class VODListFrame(ctk.CTkFrame):
+    """VOD 목록 프레임
 
-    def __init__(self, master, download_callback):
+    화면에 보이는 만큼의 VODItem만 만들어 두고, 스크롤할 때
+    각 행을 해당 위치의 VOD로 다시 바인딩한다.
+    """
+
+    def __init__(self, master, download_callback, load_more_callback=None):
         super().__init__(master)
 
         self.download_callback = download_callback
-        self.vod_items = []
+        self.load_more_callback = load_more_callback
+        self.has_more = False
+        self._loading_more = False
+        self.vods = []
+        self.vod_items = []  # 재사용하는 행 위젯
+        self._row_windows = []  # 행별 캔버스 윈도우 ID
+        self._slot_keys = []  # 행별로 현재 표시 중인 VOD의 videoNo
+        self.thumbnail_service = ThumbnailService(self)
+
+        self._setup_ui()
 
         # 초기 메시지
+        self.empty_label = None
+        self.show_message("채널 URL을 입력하고 'VOD 목록 로드'를 클릭하세요.")
+
+    def _setup_ui(self):
+        """UI 구성"""
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.canvas = tk.Canvas(
+            self,
+            highlightthickness=0,
+            borderwidth=0,
+            yscrollincrement=ROW_HEIGHT // 3,
+            bg=self._apply_appearance_mode(self.cget("fg_color"))
+        )
+        self.canvas.grid(row=0, column=0, sticky="nsew", padx=(5, 0), pady=5)
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.canvas.yview)
+        self.scrollbar.grid(row=0, column=1, sticky="ns", pady=5)
+        self.canvas.configure(yscrollcommand=self._on_canvas_scroll)
+
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        if sys.platform.startswith("linux"):
+            self.bind_all("<Button-4>", self._on_mouse_wheel, add="+")
+            self.bind_all("<Button-5>", self._on_mouse_wheel, add="+")
+        else:
+            self.bind_all("<MouseWheel>", self._on_mouse_wheel, add="+")
+
+    def _set_appearance_mode(self, mode_string):
+        """테마 변경 시 캔버스 배경도 변경"""
+        super()._set_appearance_mode(mode_string)
+        self.canvas.configure(bg=self._apply_appearance_mode(self.cget("fg_color")))
+
+    def display_vods(self, vod_list, keep_position=True, has_more=False):
+        """
+        VOD 목록 표시
+
+        videoNo 기준으로 이전 목록과 비교하여, 계속 보이는 VOD의 행 위젯과
+        썸네일은 그대로 두고 바뀐 행만 다시 바인딩한다.
+
+        Args:
+            vod_list: VOD 목록
+            keep_position: 화면 맨 위의 VOD가 새 목록에도 있으면 그 위치 유지
+            has_more: 끝까지 스크롤하면 다음 페이지를 요청할지 여부
+        """
+        self.has_more = has_more
+        self._loading_more = False
+
+        if not vod_list:
+            self.show_message("VOD가 없습니다.")
+            return
+
+        anchor_key, anchor_offset = self._get_scroll_anchor() if keep_position else (None, 0)
+
+        old_keys = {self._vod_key(vod): index for index, vod in enumerate(self.vods)}
+        new_vods = list(vod_list)
+        new_keys = [self._vod_key(vod) for vod in new_vods]
+        inserted = sum(1 for key in new_keys if key not in old_keys)
+        removed = len(old_keys) - (len(new_keys) - inserted)
+        moved = sum(
+            1 for index, key in enumerate(new_keys)
+            if key in old_keys and old_keys[key] != index
+        )
+
+        self._hide_message()
+        self.vods = new_vods
+        self._update_scrollregion()
+
+        top = 0
+        if anchor_key is not None and anchor_key in old_keys:
+            try:
+                top = new_keys.index(anchor_key) * ROW_HEIGHT + anchor_offset
+            except ValueError:
+                top = 0
+        total_height = len(self.vods) * ROW_HEIGHT
+        self.canvas.yview_moveto(top / total_height if total_height else 0)
+        self._refresh_rows()
+
+        logger.info(
+            f"VOD 목록 표시 완료: {len(new_vods)}개 "
+            f"(추가 {inserted}, 삭제 {removed}, 이동 {moved})"
+        )
+
+    def append_vods(self, vod_list, has_more):
+        """
+        다음 페이지를 목록 끝에 추가
+
+        Args:
+            vod_list: 추가할 VOD 목록 (이미 있는 videoNo는 무시)
+            has_more: 다음 페이지가 더 있는지 여부
+        """
+        self.has_more = has_more
+        self._loading_more = False
+
+        known = {self._vod_key(vod) for vod in self.vods}
+        added = [vod for vod in vod_list if self._vod_key(vod) not in known]
+        if not added:
+            return
+
+        self.vods.extend(added)
+        self._update_scrollregion()
+        self._refresh_rows()
+        logger.info(f"VOD 목록 추가: {len(added)}개 (전체 {len(self.vods)}개)")
+
+    def show_message(self, text):
+        """목록 대신 안내 메시지 표시"""
+        self.clear()
         self.empty_label = ctk.CTkLabel(
             self,
-            text="채널 URL을 입력하고 'VOD 목록 로드'를 클릭하세요.",
+            text=text,
             font=ctk.CTkFont(size=14)
         )
-        self.empty_label.pack(pady=50)
+        self.empty_label.place(relx=0.5, y=50, anchor="n")
 
-    def display_vods(self, vod_list):
-        """VOD 목록 표시"""
-        # 기존 항목 제거
-        self.clear()
+    def clear(self):
+        """모든 항목 제거 (행 위젯은 숨겨서 재사용)"""
+        self._hide_message()
+        self.vods = []
+        self.has_more = False
+        self._loading_more = False
+        self._slot_keys = [None] * len(self.vod_items)
+        for item, window_id in zip(self.vod_items, self._row_windows):
+            self.canvas.itemconfigure(window_id, state="hidden")
+            item.release()
+        self._update_scrollregion()
 
-        if not vod_list:
-            self.empty_label = ctk.CTkLabel(
-                self,
-                text="VOD가 없습니다.",
-                font=ctk.CTkFont(size=14)
+    def _hide_message(self):
+        """안내 메시지 제거"""
+        if self.empty_label:
+            self.empty_label.destroy()
+            self.empty_label = None
+
+    def _on_canvas_configure(self, event):
+        """캔버스 크기 변경 시 행 수와 폭 조정"""
+        self._ensure_pool(event.height)
+        for window_id in self._row_windows:
+            self.canvas.itemconfigure(window_id, width=event.width - 10)
+        self._update_scrollregion()
+        self._refresh_rows()
+
+    def _on_canvas_scroll(self, first, last):
+        """캔버스 스크롤 시 스크롤바 갱신 및 행 재바인딩"""
+        self.scrollbar.set(first, last)
+        self._refresh_rows()
+
+    def _on_mouse_wheel(self, event):
+        """마우스 휠 스크롤 (이 프레임 안에서만)"""
+        if not self._is_inside(event.widget):
+            return
+        if event.num == 4:
+            delta = -1
+        elif event.num == 5:
+            delta = 1
+        elif sys.platform == "darwin":
+            delta = -event.delta
+        else:
+            delta = -int(event.delta / 40)
+        self.canvas.yview_scroll(delta, "units")
+
+    def _is_inside(self, widget):
+        """위젯이 이 프레임의 하위 위젯인지 확인"""
+        while widget is not None:
+            if widget is self:
+                return True
+            widget = getattr(widget, "master", None)
+        return False
+
+    def _ensure_pool(self, viewport_height):
+        """화면을 채울 만큼 행 위젯 생성"""
+        needed = viewport_height // ROW_HEIGHT + 1 + OVERSCAN_ROWS
+        width = max(self.canvas.winfo_width() - 10, 1)
+        while len(self.vod_items) < needed:
+            item = VODItem(self.canvas, self.download_callback, self.thumbnail_service)
+            window_id = self.canvas.create_window(
+                5, 0, window=item, anchor="nw",
+                width=width, height=ROW_HEIGHT - 10, state="hidden"
             )
-            self.empty_label.pack(pady=50)
+            self.vod_items.append(item)
+            self._row_windows.append(window_id)
+            self._slot_keys.append(None)
+
+    def _update_scrollregion(self):
+        """전체 목록 높이에 맞게 스크롤 영역 설정"""
+        height = len(self.vods) * ROW_HEIGHT
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), height))
+
+    def _get_scroll_anchor(self):
+        """화면 맨 위 VOD의 videoNo와 그 행 안에서의 오프셋"""
+        if not self.vods:
+            return None, 0
+        total_height = len(self.vods) * ROW_HEIGHT
+        top = int(self.canvas.yview()[0] * total_height)
+        index = min(top // ROW_HEIGHT, len(self.vods) - 1)
+        return self._vod_key(self.vods[index]), top - index * ROW_HEIGHT
+
+    def _vod_key(self, vod):
+        """VOD 식별 키"""
+        return vod.get('videoNo')
+
+    def _refresh_rows(self):
+        """보이는 범위의 데이터로 행 위젯 재배치
+
+        이미 같은 VOD가 바인딩된 행은 위치만 옮기고, 새로 보이게 된
+        VOD만 남는 행에 다시 바인딩한다.
+        """
+        pool_size = len(self.vod_items)
+        if not pool_size:
             return
 
-        # VOD 항목 생성
-        for vod_info in vod_list:
-            vod_item = VODItem(self, vod_info, self.download_callback)
-            vod_item.pack(fill="x", padx=10, pady=5)
-            self.vod_items.append(vod_item)
+        total_height = len(self.vods) * ROW_HEIGHT
+        top = int(self.canvas.yview()[0] * total_height) if total_height else 0
+        bottom = top + self.canvas.winfo_height()
+        first = max(0, top // ROW_HEIGHT - 1)
+        last = min(len(self.vods), first + pool_size)
 
-        logger.info(f"VOD 목록 표시 완료: {len(vod_list)}개")
+        wanted = [(index, self._vod_key(self.vods[index])) for index in range(first, last)]
+        wanted_keys = {key for _, key in wanted}
+        key_to_slot = {
+            key: slot for slot, key in enumerate(self._slot_keys)
+            if key is not None and key in wanted_keys
+        }
+        free_slots = [
+            slot for slot in range(pool_size)
+            if self._slot_keys[slot] not in key_to_slot
+        ]
 
-    def clear(self):
-        """모든 항목 제거"""
-        for widget in self.winfo_children():
-            widget.destroy()
-        self.vod_items.clear()
+        for index, key in wanted:
+            vod = self.vods[index]
+            slot = key_to_slot.get(key)
+            if slot is None:
+                slot = free_slots.pop()
+                self._slot_keys[slot] = key
+                needs_bind = True
+            else:
+                # 같은 VOD라도 제목 등이 바뀌었으면 다시 바인딩
+                needs_bind = self.vod_items[slot].vod_info != vod
+
+            if needs_bind:
+                # 화면에 보이는 행의 썸네일을 먼저 로드
+                row_top = index * ROW_HEIGHT
+                visible = row_top + ROW_HEIGHT > top and row_top < bottom
+                priority = PRIORITY_VISIBLE if visible else PRIORITY_PREFETCH
+                self.vod_items[slot].bind_vod(vod, priority)
+
+            window_id = self._row_windows[slot]
+            self.canvas.coords(window_id, 5, index * ROW_HEIGHT + 5)
+            self.canvas.itemconfigure(window_id, state="normal")
+
+        for slot in free_slots:
+            if self.vod_items[slot].vod_info is not None:
+                self.canvas.itemconfigure(self._row_windows[slot], state="hidden")
+                self.vod_items[slot].release()
+                self._slot_keys[slot] = None
+
+        self._maybe_load_more(last)
+
+    def _maybe_load_more(self, last_index):
+        """끝에 가까워지면 다음 페이지 요청 (한 번에 하나만)"""
+        if not self.has_more or self._loading_more or not self.load_more_callback:
+            return
+        if last_index < len(self.vods) - LOAD_MORE_THRESHOLD_ROWS:
+            return
+        self._loading_more = True
+        self.load_more_callback()
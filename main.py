@@ -4,24 +4,304 @@
 """
 import sys
 import os
+import time
+import atexit
+import argparse
 
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from gui.main_window import MainWindow
-from utils.logger import logger
+# 스트림 출력용 yt-dlp 하위 프로세스 (실행 파일로 빌드되어 python -m yt_dlp를 쓸 수 없는 경우)
+# 로그 파일을 함께 열지 않도록 다른 모듈을 import하기 전에 처리
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == '--yt-dlp-child':
+    import yt_dlp
+    yt_dlp.main(sys.argv[2:])
+
+from utils.startup_profiler import startup_profiler
+from utils.logger import get_logger, set_file_format
+from utils.profiling import install_signal_handler, profiling_session
+from utils.tracing import tracer
+
+
+logger = get_logger('main')
+
+
+def parse_args(argv=None):
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="사모장 치지직 다시보기 다운로더")
+    parser.add_argument(
+        '--profile-startup',
+        action='store_true',
+        help='import 및 초기화 단계별 시작 시간을 로그에 기록'
+    )
+    parser.add_argument(
+        '--startup-budget',
+        type=int,
+        default=1500,
+        metavar='MS',
+        help='시작 시간 목표 (밀리초, --profile-startup과 함께 사용)'
+    )
+    parser.add_argument(
+        '--import',
+        dest='import_file',
+        metavar='FILE',
+        help='GUI 없이 파일의 VOD/채널 URL을 모두 다운로드 (- 이면 표준 입력)'
+    )
+    parser.add_argument(
+        '--quality',
+        help='--import 다운로드 화질 (기본: 설정의 default_quality)'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        metavar='DIR',
+        help='--import 저장 경로 (기본: 설정의 download_path). '
+             '파일 대신 보내려면 - (표준 출력), pipe:<경로>, tcp://호스트:포트'
+    )
+    parser.add_argument(
+        '--verify',
+        metavar='DIR',
+        help='GUI 없이 폴더의 다운로드 파일을 매니페스트와 비교하여 검사'
+    )
+    parser.add_argument(
+        '--profile',
+        type=float,
+        metavar='SECONDS',
+        help='시작 후 SECONDS초 동안 cProfile/tracemalloc/워커 스택을 수집하여 logs 폴더에 저장'
+    )
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='GUI 없이 다운로드 데몬 실행 (여러 GUI/스크립트가 대기열과 속도 제한을 공유)'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        help='--daemon 포트 (기본: 설정의 daemon_port)'
+    )
+    parser.add_argument(
+        '--attach',
+        nargs='?',
+        const='',
+        metavar='URL',
+        help='실행 중인 데몬에 연결하여 다운로드 (GUI 또는 --import, URL 생략 시 기본 주소)'
+    )
+    parser.add_argument(
+        '--trace',
+        metavar='FILE',
+        help='다운로드 단계/API 호출 구간을 기록하여 종료 시 Chrome trace JSON으로 저장 (Perfetto에서 열기)'
+    )
+    parser.add_argument(
+        '--log-format',
+        choices=('text', 'json'),
+        help='파일 로그 형식 (json: 한 줄에 레코드 하나인 JSON Lines)'
+    )
+    return parser.parse_args(argv)
+
+
+def run_import(args):
+    """
+    GUI 없이 URL 목록 다운로드
+
+    Returns:
+        int: 종료 코드 (실패한 다운로드가 있으면 1)
+    """
+    from core.bulk_import import BulkImporter
+    from core.chzzk_api import ChzzkAPI
+    from core.config_manager import ConfigManager
+    from core.downloader import Downloader
+    from core.stream_output import is_stream_target
+
+    config = ConfigManager()
+    stream_target = args.output if is_stream_target(args.output) else None
+    if stream_target and args.attach is not None:
+        print("스트림 출력은 --attach와 함께 사용할 수 없습니다", file=sys.stderr)
+        return 2
+    # 표준 출력으로 영상을 보낼 때는 안내 메시지를 표준 오류로 출력
+    out = sys.stderr if stream_target == '-' else sys.stdout
+
+    if args.import_file == '-':
+        text = sys.stdin.read()
+    else:
+        with open(args.import_file, 'r', encoding='utf-8') as f:
+            text = f.read()
+
+    if stream_target:
+        output_path = config.get('download_path', 'downloads')
+    else:
+        output_path = args.output or config.get('download_path', 'downloads')
+        os.makedirs(output_path, exist_ok=True)
+
+    api = ChzzkAPI()
+    result = BulkImporter(api).build_tasks(
+        text,
+        quality=args.quality or config.get('default_quality', 'best'),
+        output_path=output_path
+    )
+    print(result.summary(), file=out)
+    for token in result.invalid:
+        print(f"  잘못된 항목: {token}", file=out)
+    for channel_id, error in result.failed_channels.items():
+        print(f"  채널 조회 실패: {channel_id} ({error})", file=out)
+    if not result.tasks:
+        return 1 if result.invalid or result.failed_channels else 0
+
+    if stream_target:
+        # 입력 순서대로 하나씩 보내야 출력이 섞이지 않음
+        for task in result.tasks:
+            task.stream_target = stream_target
+        downloader = Downloader(max_concurrent=1, rate_limit=config.get('download_rate_limit', 0))
+    elif args.attach is not None:
+        from core.daemon import RemoteDownloader
+        downloader = RemoteDownloader(args.attach or None)
+        downloader.ping()
+    else:
+        downloader = Downloader(
+            max_concurrent=config.get('max_concurrent_downloads', 3),
+            rate_limit=config.get('download_rate_limit', 0)
+        )
+    finished = set()
+
+    def on_progress(task):
+        if task.status in ('completed', 'failed', 'cancelled') and task.vod_url not in finished:
+            finished.add(task.vod_url)
+            print(f"[{len(finished)}/{len(result.tasks)}] {task.status}: {task.title}", file=out)
+
+    downloader.add_progress_callback(on_progress)
+    downloader.add_downloads(result.tasks)
+    # 데몬이 거부한 작업은 진행 알림이 오지 않으므로 바로 끝난 것으로 셈
+    for task in result.tasks:
+        if task.status == 'failed':
+            print(f"  거부됨: {task.vod_url} ({task.error_message})", file=out)
+            on_progress(task)
+    downloader.start()
+    try:
+        # 프로파일링 종료 시간을 확인하며 대기 (cProfile은 시작한 스레드에서 종료)
+        while len(finished) < len(result.tasks):
+            time.sleep(0.2)
+            profiling_session.poll()
+    except KeyboardInterrupt:
+        print("중지 중...", file=out)
+        for task in result.tasks:
+            downloader.cancel_download(task.vod_url)
+        return 130
+    finally:
+        profiling_session.stop()
+        downloader.stop()
+
+    failed = [task for task in result.tasks if task.status == 'failed']
+    return 1 if failed else 0
+
+
+def run_daemon(args):
+    """
+    다운로드 데몬 실행 (Ctrl+C로 종료)
+
+    Returns:
+        int: 종료 코드
+    """
+    from core.config_manager import ConfigManager
+    from core.daemon import DaemonServer
+    from core.downloader import Downloader
+
+    config = ConfigManager()
+    downloader = Downloader(
+        max_concurrent=config.get('max_concurrent_downloads', 3),
+        history_limit=config.get('download_history_limit', 500),
+        rate_limit=config.get('download_rate_limit', 0)
+    )
+    try:
+        server = DaemonServer(
+            downloader,
+            port=args.port or config.get('daemon_port', 47651),
+            download_path=config.get('download_path', 'downloads')
+        )
+    except OSError as e:
+        print(f"데몬 시작 실패: {e}")
+        return 1
+
+    print(f"다운로드 데몬 실행 중: {server.url} (종료: Ctrl+C)")
+    server.start()
+    try:
+        while True:
+            time.sleep(0.2)
+            profiling_session.poll()
+    except KeyboardInterrupt:
+        print("중지 중...")
+    finally:
+        profiling_session.stop()
+        server.shutdown()
+    return 0
+
+
+def run_verify(directory):
+    """
+    폴더의 다운로드 파일 무결성 검사 (파일별 병렬)
+
+    Returns:
+        int: 종료 코드 (문제가 있는 파일이 있으면 1, 매니페스트가 없는 파일은 제외)
+    """
+    from core.integrity import verify_directory
+
+    def on_result(path, ok, message):
+        label = 'SKIP' if ok is None else 'OK  ' if ok else 'FAIL'
+        print(f"{label} {path}: {message}")
+
+    results = verify_directory(directory, on_result=on_result)
+    failed = sum(1 for _, ok, _ in results if ok is False)
+    skipped = sum(1 for _, ok, _ in results if ok is None)
+    print(f"검사 {len(results) - skipped}개, 실패 {failed}개, 매니페스트 없음 {skipped}개")
+    return 1 if failed else 0
+
+
+def attach_url(args):
+    """--attach 옵션의 데몬 주소 (옵션이 없으면 None)"""
+    if args.attach is None:
+        return None
+    if args.attach:
+        return args.attach
+    from core.daemon import default_url
+    return default_url()
 
 
 def main():
     """메인 함수"""
+    args = parse_args()
+    if args.log_format:
+        set_file_format(args.log_format)
+    if args.trace:
+        tracer.enable()
+        atexit.register(tracer.export, args.trace)
+
+    if args.import_file:
+        install_signal_handler(profiling_session)
+        if args.profile:
+            profiling_session.start(args.profile)
+        sys.exit(run_import(args))
+    if args.daemon:
+        install_signal_handler(profiling_session)
+        if args.profile:
+            profiling_session.start(args.profile)
+        sys.exit(run_daemon(args))
+    if args.verify:
+        sys.exit(run_verify(args.verify))
+    if args.profile_startup:
+        startup_profiler.enable(budget_ms=args.startup_budget)
+        startup_profiler.mark("main 시작")
+
     try:
         logger.info("=" * 50)
         logger.info("사모장 치지직 다시보기 다운로더 시작")
         logger.info("=" * 50)
 
+        with startup_profiler.measure("import gui.main_window"):
+            from gui.main_window import MainWindow
+
         # 메인 윈도우 생성 및 실행
-        app = MainWindow()
+        with startup_profiler.measure("MainWindow 생성"):
+            app = MainWindow(attach_url=attach_url(args))
         app.protocol("WM_DELETE_WINDOW", app.on_closing)
+        if args.profile:
+            profiling_session.start(args.profile, schedule=app.after, cancel=app.after_cancel)
         app.mainloop()
 
     except Exception as e:
@@ -0,0 +1,145 @@
+"""
+채널 감시 테스트
+가짜 시계와 가짜 치지직 서버로 run_pending()을 실행
+
+    python -m pytest tests
+"""
+import random
+import shutil
+import tempfile
+import unittest
+from urllib.parse import urlsplit
+from core.channel_watcher import ChannelWatcher
+from core.chzzk_api import ChzzkAPI
+from core.rate_limiter import rate_limiter
+from tools.fake_chzzk_server import FakeChzzkServer, make_channel_id
+
+
+INTERVAL = 600
+
+
+class FakeClock:
+    """run_pending()과 예산 대기에 사용하는 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class RecordingDownloader:
+    """추가된 작업만 기록"""
+
+    def __init__(self):
+        self.tasks = []
+
+    def add_download(self, task):
+        self.tasks.append(task)
+
+
+class ChannelWatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.channels = [make_channel_id(number) for number in range(1, 6)]
+        self.server = FakeChzzkServer(vod_counts={channel_id: 200 for channel_id in self.channels}).start()
+        # 속도 제한은 감시 예산만 보도록 가짜 서버 호스트는 풀어 둠
+        rate_limiter.configure(urlsplit(self.server.url).netloc, rate=1e9, burst=10 ** 9)
+        self.cache_dir = tempfile.mkdtemp(prefix='chzzk_test_')
+        self.api = ChzzkAPI(cache_dir=self.cache_dir, base_url=self.server.api_base_url)
+        self.clock = FakeClock()
+        self.downloader = RecordingDownloader()
+
+    def tearDown(self):
+        self.api.vod_index.close()
+        self.server.shutdown()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def make_watcher(self, requests_per_minute=60):
+        return ChannelWatcher(
+            self.api, self.downloader,
+            interval=INTERVAL, jitter=0, requests_per_minute=requests_per_minute,
+            clock=self.clock, sleep=self.clock.sleep, rng=random.Random(0)
+        )
+
+    def next_round(self, watcher):
+        """모든 채널의 다음 확인 시각까지 시계를 진행하고 실행"""
+        self.clock.now += INTERVAL
+        return watcher.run_pending()
+
+    def requests(self):
+        return self.server.stats.get('videos', 0)
+
+    def enqueued_numbers(self):
+        return [int(task.vod_url.rsplit('/', 1)[1]) for task in self.downloader.tasks]
+
+    def test_baseline_then_new_vods_are_enqueued(self):
+        channel_id = self.channels[0]
+        watcher = self.make_watcher()
+        watcher.add_channel(channel_id, delay=0)
+
+        watcher.run_pending()
+        # 첫 확인은 첫 페이지 한 번으로 기준점만 저장
+        self.assertEqual(self.requests(), 1)
+        self.assertEqual(self.downloader.tasks, [])
+
+        self.server.add_vods(channel_id, 3)
+        self.next_round(watcher)
+        newest = self.server.vod_page(channel_id, 0, 3)
+        # 오래된 것부터 추가
+        self.assertEqual(self.enqueued_numbers(), [vod['videoNo'] for vod in reversed(newest)])
+
+        self.next_round(watcher)
+        self.assertEqual(len(self.downloader.tasks), 3)
+
+    def test_other_sync_does_not_hide_new_vods(self):
+        channel_id = self.channels[0]
+        watcher = self.make_watcher()
+        watcher.add_channel(channel_id, delay=0)
+        watcher.run_pending()
+
+        self.server.add_vods(channel_id, 3)
+        self.next_round(watcher)
+        self.assertEqual(len(self.downloader.tasks), 3)
+
+        # 목록 로드처럼 다른 곳에서 먼저 동기화해도 감시는 새 VOD를 추가해야 함
+        self.server.add_vods(channel_id, 2)
+        self.assertEqual(len(self.api.sync_channel(channel_id)), 2)
+        self.next_round(watcher)
+        self.assertEqual(len(self.downloader.tasks), 5)
+        self.assertEqual(len(set(self.enqueued_numbers())), 5)
+
+    def test_budget_limits_polls(self):
+        watcher = self.make_watcher(requests_per_minute=2)
+        for channel_id in self.channels:
+            watcher.add_channel(channel_id, delay=0)
+
+        wait = watcher.run_pending()
+        self.assertEqual(self.requests(), 2)
+        self.assertAlmostEqual(wait, 30.0)
+
+        self.clock.now += wait
+        watcher.run_pending()
+        self.assertEqual(self.requests(), 3)
+
+    def test_extra_pages_are_charged(self):
+        channel_id = self.channels[0]
+        watcher = self.make_watcher(requests_per_minute=60)
+        watcher.add_channel(channel_id, delay=0)
+        watcher.run_pending()
+
+        # 30개씩 3페이지에 걸친 새 VOD
+        self.server.add_vods(channel_id, 70)
+        before = self.requests()
+        self.next_round(watcher)
+        self.assertEqual(self.requests() - before, 3)
+        self.assertEqual(len(self.downloader.tasks), 70)
+        # 예산은 다 찬 상태(60)에서 요청 3번만큼 줄어듦
+        self.assertAlmostEqual(watcher.budget.tokens, 57.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+HTTP 응답 캐시 테스트
+가짜 치지직 서버에 ChzzkAPI로 요청하며 적중/실패/재검증/오래된 응답 횟수 확인
+
+    python -m pytest tests
+"""
+import shutil
+import tempfile
+import time
+import unittest
+from urllib.parse import urlsplit
+from core.chzzk_api import ChzzkAPI
+from core.rate_limiter import rate_limiter
+from tools.fake_chzzk_server import FakeChzzkServer, make_channel_id
+
+
+TTL = 0.5
+REVALIDATE_DEADLINE = 0.15
+
+
+class HTTPCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.channel_id = make_channel_id(1)
+        self.server = FakeChzzkServer(vod_counts={self.channel_id: 100}).start()
+        rate_limiter.configure(urlsplit(self.server.url).netloc, rate=1e9, burst=10 ** 9)
+        self.cache_dir = tempfile.mkdtemp(prefix='chzzk_test_')
+        self.api = ChzzkAPI(cache_dir=self.cache_dir, cache_ttl=TTL, base_url=self.server.api_base_url)
+        self.api.http_cache.revalidate_deadline = REVALIDATE_DEADLINE
+
+    def tearDown(self):
+        self.api.vod_index.close()
+        self.server.shutdown()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def stats(self):
+        return self.api.get_cache_stats()
+
+    def first_video_no(self, **kwargs):
+        return self.api.get_vod_list(self.channel_id, page=0, size=30, **kwargs)[0]['videoNo']
+
+    def expire(self):
+        time.sleep(TTL + 0.05)
+
+    def test_miss_then_hit(self):
+        self.first_video_no()
+        self.first_video_no()
+        self.assertEqual(self.stats(), {'hit': 1, 'miss': 1, 'revalidated': 0, 'stale': 0})
+        self.assertEqual(self.server.stats['videos'], 1)
+
+    def test_revalidates_after_ttl(self):
+        self.first_video_no()
+        self.expire()
+        self.first_video_no()
+        # 바뀌지 않았으면 304로 재검증하고 캐시 본문 사용
+        self.assertEqual(self.stats(), {'hit': 0, 'miss': 1, 'revalidated': 1, 'stale': 0})
+        self.assertEqual(self.server.stats['not_modified'], 1)
+
+        # 재검증 직후에는 다시 신선한 항목
+        self.first_video_no()
+        self.assertEqual(self.stats()['hit'], 1)
+
+    def test_changed_content_after_ttl_is_fresh(self):
+        old = self.first_video_no()
+        self.server.add_vods(self.channel_id, 2)
+        self.expire()
+        # 서버가 빠르게 응답하면 오래된 응답이 아니라 새 목록
+        self.assertEqual(self.first_video_no(), old + 2)
+        self.assertEqual(self.stats(), {'hit': 0, 'miss': 2, 'revalidated': 0, 'stale': 0})
+
+    def test_slow_revalidation_serves_stale(self):
+        old = self.first_video_no()
+        self.server.add_vods(self.channel_id, 1)
+        self.expire()
+        self.server.latency = REVALIDATE_DEADLINE * 3
+
+        start = time.perf_counter()
+        self.assertEqual(self.first_video_no(), old)
+        self.assertLess(time.perf_counter() - start, REVALIDATE_DEADLINE * 2)
+        self.assertEqual(self.stats()['stale'], 1)
+
+        # 늦은 재검증은 백그라운드에서 끝나 캐시를 갱신
+        time.sleep(REVALIDATE_DEADLINE * 3)
+        self.server.latency = 0
+        self.assertEqual(self.first_video_no(), old + 1)
+        self.assertEqual(self.stats()['hit'], 1)
+
+    def test_error_serves_stale_unless_fresh_required(self):
+        old = self.first_video_no()
+        self.expire()
+        self.server.error_rate = 1.0
+
+        self.assertEqual(self.first_video_no(), old)
+        self.assertEqual(self.stats()['stale'], 1)
+
+        # 동기화 경로(fresh)는 오래된 응답을 쓰지 않음
+        self.assertEqual(self.api.get_vod_list(self.channel_id, page=0, size=30, fresh=True), [])
+        self.assertEqual(self.stats()['stale'], 1)
+
+    def test_fresh_always_asks_server(self):
+        self.first_video_no()
+        self.first_video_no(fresh=True)
+        self.assertEqual(self.stats(), {'hit': 0, 'miss': 1, 'revalidated': 1, 'stale': 0})
+        self.assertEqual(self.server.stats['videos'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
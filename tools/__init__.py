@@ -0,0 +1,4 @@
+"""
+개발 도구
+가짜 치지직 서버, 부하 측정 등
+"""
@@ -0,0 +1,349 @@
+"""
+가짜 치지직 서버
+실제 api.chzzk.naver.com 대신 채널 정보, VOD 목록(합성 VOD 수천 개), 썸네일, HLS를
+로컬에서 제공하여 목록/검색/썸네일 경로를 네트워크 없이 시험
+
+지연과 오류를 넣을 수 있다:
+    python tools/fake_chzzk_server.py --port 8765 --vods 5000 --latency 80 --jitter 40 --error-rate 0.02
+
+앱을 가짜 서버에 연결:
+    CHZZK_API_BASE_URL=http://127.0.0.1:8765/service/v1 python main.py
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from urllib.parse import parse_qs, urlsplit
+
+
+DEFAULT_VOD_COUNT = 1000
+# 채널마다 videoNo가 겹치지 않도록 채널별 시작 번호 간격
+VIDEO_NO_STRIDE = 1000000
+# HLS 조각 수와 조각당 TS 패킷 수 (188바이트 * 1000 = 약 184KB)
+HLS_SEGMENTS = 10
+HLS_SEGMENT_PACKETS = 1000
+HLS_SEGMENT_SECONDS = 6
+
+TITLE_GAMES = ['마인크래프트', '리그 오브 레전드', '발로란트', '배틀그라운드', '스타크래프트',
+               '로스트아크', '메이플스토리', '저스트 채팅', '노래', '그림']
+TITLE_WORDS = ['합방', '정주행', '첫 플레이', '랭크 게임', '시참', '공포 게임', '엔딩',
+               '대회', '먹방', '여행', '생일', '기념 방송', '하이라이트', '빌드 연구']
+
+_CHANNEL_PATH = re.compile(r'^/service/v1/channels/([0-9a-f]{32})(/videos)?$')
+_THUMBNAIL_PATH = re.compile(r'^/thumbnails/(\d+)\.jpg$')
+_HLS_PATH = re.compile(r'^/hls/(\d+)/(index\.m3u8|seg(\d+)\.ts)$')
+
+
+def make_channel_id(number):
+    """번호로 채널 ID(32자리 16진수) 생성"""
+    return f'{number:032x}'
+
+
+def make_vod(channel, index, base_url):
+    """
+    합성 VOD 생성 (index 0이 가장 최신)
+
+    Args:
+        channel: FakeChannel
+        index: 최신순 위치
+        base_url: 썸네일 URL에 사용할 서버 주소
+    """
+    video_no = channel.base_video_no + channel.vod_count - index
+    rng = random.Random(video_no)
+    publish = channel.newest - timedelta(hours=index * 7 + rng.randint(0, 5))
+    return {
+        'videoNo': video_no,
+        'videoId': hashlib.md5(str(video_no).encode()).hexdigest(),
+        'videoTitle': f"[{rng.choice(TITLE_GAMES)}] {rng.choice(TITLE_WORDS)} {rng.choice(TITLE_WORDS)} #{video_no % 10000}",
+        'videoType': 'REPLAY',
+        'publishDate': publish.strftime('%Y-%m-%d %H:%M:%S'),
+        'thumbnailImageUrl': f'{base_url}/thumbnails/{video_no}.jpg',
+        'duration': rng.randint(600, 6 * 3600),
+        'readCount': rng.randint(0, 50000),
+        'channelId': channel.channel_id,
+        'adult': False,
+    }
+
+
+class FakeChannel:
+    """합성 채널"""
+
+    def __init__(self, channel_id, vod_count, base_video_no):
+        self.channel_id = channel_id
+        self.vod_count = vod_count
+        self.base_video_no = base_video_no
+        self.newest = datetime(2025, 1, 1)
+
+
+class FakeChzzkServer:
+    """가짜 치지직 서버"""
+
+    def __init__(self, host='127.0.0.1', port=0, vod_counts=None, default_vod_count=DEFAULT_VOD_COUNT,
+                 latency=0.0, jitter=0.0, error_rate=0.0, throttle_rate=0.0, seed=None):
+        """
+        Args:
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트)
+            vod_counts: 채널 ID -> VOD 수 (목록에 없는 채널은 default_vod_count)
+            default_vod_count: 처음 보는 채널의 VOD 수
+            latency: 요청마다 더할 지연 (초)
+            jitter: 지연에 더할 무작위 범위 (초)
+            error_rate: 500 응답 비율 (0~1)
+            throttle_rate: 429 응답 비율 (0~1, Retry-After: 1)
+            seed: 지연/오류 난수 시드
+        """
+        self.default_vod_count = default_vod_count
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rng = random.Random(seed)
+        self.stats = {}  # 요청 종류 -> 횟수
+        self._channels = {}
+        self._lock = threading.Lock()
+        self._thumbnails = {}  # 색상 번호 -> JPEG 바이트
+
+        for channel_id, count in (vod_counts or {}).items():
+            self._add_channel(channel_id, count)
+
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.fake_server = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def api_base_url(self):
+        """ChzzkAPI base_url로 사용할 주소"""
+        return f'{self.url}/service/v1'
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="FakeChzzk", daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def channel(self, channel_id):
+        """채널 (처음 보는 ID면 default_vod_count개로 생성)"""
+        with self._lock:
+            channel = self._channels.get(channel_id)
+            if channel is None:
+                channel = self._add_channel(channel_id, self.default_vod_count)
+            return channel
+
+    def vod_page(self, channel_id, page, size):
+        """최신순 VOD 한 페이지"""
+        channel = self.channel(channel_id)
+        start = page * size
+        end = min(start + size, channel.vod_count)
+        return [make_vod(channel, index, self.url) for index in range(start, end)]
+
+    def add_vods(self, channel_id, count):
+        """채널에 새 VOD 추가 (기존 VOD의 번호와 날짜는 그대로)"""
+        channel = self.channel(channel_id)
+        with self._lock:
+            channel.vod_count += count
+            channel.newest += timedelta(hours=7 * count)
+
+    def thumbnail(self, video_no):
+        """썸네일 JPEG (VOD마다 다른 색, 색상별로 한 번만 인코딩)"""
+        color = video_no % 16
+        with self._lock:
+            data = self._thumbnails.get(color)
+        if data is None:
+            from PIL import Image
+
+            image = Image.new('RGB', (480, 270), ((color * 37) % 256, (color * 91) % 256, (color * 53) % 256))
+            buffer = BytesIO()
+            image.save(buffer, 'JPEG', quality=80)
+            data = buffer.getvalue()
+            with self._lock:
+                self._thumbnails[color] = data
+        return data
+
+    def count(self, kind):
+        with self._lock:
+            self.stats[kind] = self.stats.get(kind, 0) + 1
+
+    def _add_channel(self, channel_id, count):
+        channel = FakeChannel(channel_id, count, (len(self._channels) + 1) * VIDEO_NO_STRIDE)
+        self._channels[channel_id] = channel
+        return channel
+
+
+def build_segment(video_no, index):
+    """MPEG-TS 조각 (PID 0x100, continuity counter가 이어지는 패킷)"""
+    packets = bytearray()
+    for n in range(HLS_SEGMENT_PACKETS):
+        cc = (index * HLS_SEGMENT_PACKETS + n) & 0x0F
+        header = bytes([0x47, 0x41 if n == 0 else 0x01, 0x00, 0x10 | cc])
+        packets += header + bytes([(video_no + n) & 0xFF]) * 184
+    return bytes(packets)
+
+
+def build_playlist(video_no):
+    """HLS 미디어 재생 목록"""
+    lines = ['#EXTM3U', '#EXT-X-VERSION:3', f'#EXT-X-TARGETDURATION:{HLS_SEGMENT_SECONDS}',
+             '#EXT-X-MEDIA-SEQUENCE:0', '#EXT-X-PLAYLIST-TYPE:VOD']
+    for index in range(HLS_SEGMENTS):
+        lines.append(f'#EXTINF:{HLS_SEGMENT_SECONDS}.0,')
+        lines.append(f'seg{index}.ts')
+    lines.append('#EXT-X-ENDLIST')
+    return '\n'.join(lines) + '\n'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """가짜 서버 요청 처리"""
+
+    protocol_version = 'HTTP/1.1'
+    # 헤더와 본문을 따로 보내므로 Nagle 알고리즘에 의한 지연(약 40ms) 방지
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def handle(self):
+        try:
+            super().handle()
+        except ConnectionError:
+            # 클라이언트가 먼저 연결을 끊음 (취소된 다운로드 등)
+            pass
+
+    @property
+    def fake(self):
+        return self.server.fake_server
+
+    def do_GET(self):
+        fake = self.fake
+        delay = fake.latency + (fake.rng.uniform(0, fake.jitter) if fake.jitter else 0)
+        if delay:
+            time.sleep(delay)
+
+        roll = fake.rng.random()
+        if roll < fake.error_rate:
+            fake.count('error')
+            self._send(500, b'{"code":500,"message":"injected error"}', 'application/json')
+            return
+        if roll < fake.error_rate + fake.throttle_rate:
+            fake.count('throttled')
+            self._send(429, b'{"code":429,"message":"too many requests"}', 'application/json',
+                       {'Retry-After': '1'})
+            return
+
+        parts = urlsplit(self.path)
+        match = _CHANNEL_PATH.match(parts.path)
+        if match:
+            self._channel(match.group(1), bool(match.group(2)), parse_qs(parts.query))
+            return
+        match = _THUMBNAIL_PATH.match(parts.path)
+        if match:
+            fake.count('thumbnail')
+            self._send(200, fake.thumbnail(int(match.group(1))), 'image/jpeg')
+            return
+        match = _HLS_PATH.match(parts.path)
+        if match:
+            video_no = int(match.group(1))
+            if match.group(3) is None:
+                fake.count('playlist')
+                self._send(200, build_playlist(video_no).encode(), 'application/vnd.apple.mpegurl')
+            elif int(match.group(3)) < HLS_SEGMENTS:
+                fake.count('segment')
+                self._send(200, build_segment(video_no, int(match.group(3))), 'video/mp2t')
+            else:
+                self._send(404, b'', 'text/plain')
+            return
+        self._send(404, b'{"code":404}', 'application/json')
+
+    def _channel(self, channel_id, videos, query):
+        fake = self.fake
+        channel = fake.channel(channel_id)
+        if videos:
+            fake.count('videos')
+            page = int(query.get('page', ['0'])[0])
+            size = int(query.get('size', ['30'])[0])
+            content = {
+                'page': page,
+                'size': size,
+                'totalCount': channel.vod_count,
+                'totalPages': (channel.vod_count + size - 1) // size,
+                'data': fake.vod_page(channel_id, page, size),
+            }
+        else:
+            fake.count('channel')
+            content = {
+                'channelId': channel_id,
+                'channelName': f'테스트 채널 {channel.base_video_no // VIDEO_NO_STRIDE}',
+                'channelImageUrl': f'{fake.url}/thumbnails/{channel.base_video_no}.jpg',
+                'followerCount': channel.vod_count * 10,
+                'openLive': False,
+            }
+        body = json.dumps({'code': 200, 'message': None, 'content': content}, ensure_ascii=False).encode('utf-8')
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag:
+            fake.count('not_modified')
+            self._send(304, b'', None, {'ETag': etag})
+            return
+        self._send(200, body, 'application/json; charset=utf-8', {'ETag': etag})
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 치지직 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--vods', type=int, default=DEFAULT_VOD_COUNT, help='채널당 VOD 수')
+    parser.add_argument('--latency', type=float, default=0, metavar='MS', help='요청마다 더할 지연')
+    parser.add_argument('--jitter', type=float, default=0, metavar='MS', help='지연에 더할 무작위 범위')
+    parser.add_argument('--error-rate', type=float, default=0, help='500 응답 비율 (0~1)')
+    parser.add_argument('--throttle-rate', type=float, default=0, help='429 응답 비율 (0~1)')
+    args = parser.parse_args()
+
+    server = FakeChzzkServer(
+        args.host, args.port,
+        default_vod_count=args.vods,
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate
+    )
+    print(f"가짜 치지직 서버: {server.url}")
+    print(f"  API: CHZZK_API_BASE_URL={server.api_base_url}")
+    print(f"  채널 예: https://chzzk.naver.com/{make_channel_id(1)}")
+    print(f"  HLS 예: {server.url}/hls/{VIDEO_NO_STRIDE + 1}/index.m3u8")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"요청 통계: {server.stats}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
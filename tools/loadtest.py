@@ -0,0 +1,281 @@
+"""
+목록/검색/썸네일 부하 측정
+가짜 치지직 서버를 띄우고 VOD 100/1,000/10,000개 채널에서 다운로드 외 경로의 시간을 측정
+
+    python tools/loadtest.py
+    python tools/loadtest.py --sizes 100 1000 --latency 30 --json result.json
+    python tools/loadtest.py --baseline result.json   # 기준보다 느려진 항목이 있으면 종료 코드 1
+
+측정 항목 (모두 밀리초, 작을수록 좋음):
+    first_page      빈 캐시에서 첫 페이지 로드
+    crawl           채널 전체 수집 (페이지 단위 요청 + 인덱스 저장)
+    resync          수집 후 다시 동기화 (새 VOD 없음, 서버에 조건부 요청)
+    resync_new      새 VOD가 올라온 뒤 동기화 (모두 찾았는지 확인)
+    index_search    로컬 인덱스 검색 (키워드별 p50/p95)
+    local_search    불러온 목록 초성/부분 일치 필터 (p50/p95)
+    thumbnail       썸네일 1개당 시간 (받기+축소+디스크 저장 / 디스크 캐시)
+    render          VODListFrame.display_vods (화면이 없으면 건너뜀)
+    scroll          VODListFrame 스크롤 한 번 (행 재바인딩)
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+# 저장소 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.chzzk_api import ChzzkAPI
+from core.rate_limiter import rate_limiter
+from core.vod_filter import LocalVODSearch
+from tools.fake_chzzk_server import FakeChzzkServer, make_channel_id
+
+
+DEFAULT_SIZES = (100, 1000, 10000)
+PAGE_SIZE = 50
+SEARCH_KEYWORDS = ['합방', 'ㅎㅂ', '랭크 게임', 'ㄹㅋ ㄱㅇ', '마인크래프트', '#12', '없는검색어']
+THUMBNAIL_SAMPLE = 200
+THUMBNAIL_WORKERS = 4
+SCROLL_STEPS = 50
+# 수집과 재동기화 사이에 올릴 새 VOD 수
+NEW_VODS = 5
+# 기준 대비 이보다 적게 느려진 것은 측정 오차로 봄 (밀리초)
+REGRESSION_FLOOR_MS = 5.0
+
+
+def elapsed_ms(start):
+    return (time.perf_counter() - start) * 1000
+
+
+def percentile(values, fraction):
+    """정렬한 값에서 비율 위치의 값"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def bench_list_load(api, server, channel_id):
+    """
+    목록 로드 시간
+
+    Raises:
+        RuntimeError: 재동기화가 새 VOD를 모두 찾지 못함
+    """
+    metrics = {}
+    start = time.perf_counter()
+    api.get_vod_page(channel_id, page=0, size=PAGE_SIZE)
+    metrics['first_page'] = elapsed_ms(start)
+
+    start = time.perf_counter()
+    api.crawl_channel(channel_id, size=PAGE_SIZE)
+    metrics['crawl'] = elapsed_ms(start)
+
+    requests = server.stats.get('videos', 0)
+    start = time.perf_counter()
+    api.sync_channel(channel_id, size=PAGE_SIZE)
+    metrics['resync'] = elapsed_ms(start)
+    if server.stats.get('videos', 0) == requests:
+        raise RuntimeError("재동기화가 서버에 요청하지 않음 (캐시만 사용)")
+
+    server.add_vods(channel_id, NEW_VODS)
+    start = time.perf_counter()
+    new_vods = api.sync_channel(channel_id, size=PAGE_SIZE)
+    metrics['resync_new'] = elapsed_ms(start)
+    if len(new_vods) != NEW_VODS:
+        raise RuntimeError(f"재동기화가 새 VOD {NEW_VODS}개 중 {len(new_vods)}개만 찾음")
+    return metrics
+
+
+def bench_search(api, channel_id, vods, repeat):
+    """인덱스 검색과 불러온 목록 필터링 지연"""
+    index_times = []
+    local_times = []
+    local_search = LocalVODSearch()
+    local_search.set_vods(vods)
+    for _ in range(repeat):
+        for keyword in SEARCH_KEYWORDS:
+            start = time.perf_counter()
+            api.search_vods(channel_id, keyword, size=PAGE_SIZE)
+            index_times.append(elapsed_ms(start))
+
+            start = time.perf_counter()
+            local_search.search(keyword)
+            local_times.append(elapsed_ms(start))
+
+    return {
+        'index_search_p50': statistics.median(index_times),
+        'index_search_p95': percentile(index_times, 0.95),
+        'local_search_p50': statistics.median(local_times),
+        'local_search_p95': percentile(local_times, 0.95),
+    }
+
+
+def bench_thumbnails(vods, cache_dir):
+    """썸네일 1개당 처리 시간 (작업자 수만큼 병렬)"""
+    from gui.thumbnail_service import ThumbnailService
+
+    # 작업자 스레드 없이 로드 경로만 사용
+    service = ThumbnailService(None, cache_dir=cache_dir, max_workers=0)
+    urls = [vod['thumbnailImageUrl'] for vod in vods[:THUMBNAIL_SAMPLE]]
+    metrics = {}
+    for name in ('thumbnail_cold', 'thumbnail_cached'):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS) as executor:
+            list(executor.map(service._load, urls))
+        metrics[name] = elapsed_ms(start) / len(urls)
+    return metrics
+
+
+def open_render_window(cache_dir):
+    """VODListFrame을 띄운 창 (화면이 없으면 None)"""
+    import tkinter
+    try:
+        import customtkinter as ctk
+        root = ctk.CTk()
+    except (ImportError, tkinter.TclError) as e:
+        print(f"렌더링 측정 건너뜀: {e}")
+        return None, None
+
+    from gui.thumbnail_service import ThumbnailService
+    from gui.vod_list_frame import VODListFrame
+
+    root.geometry("900x700")
+    frame = VODListFrame(root, download_callback=lambda vod: None)
+    # 사용자 썸네일 캐시를 건드리지 않도록 임시 캐시 사용 (행 위젯을 만들기 전에 교체)
+    frame.thumbnail_service = ThumbnailService(frame, cache_dir=cache_dir)
+    frame.pack(fill="both", expand=True)
+    root.update()
+    return root, frame
+
+
+def bench_render(root, frame, vods):
+    """목록 표시와 스크롤 시간"""
+    frame.clear()
+    root.update()
+
+    start = time.perf_counter()
+    frame.display_vods(vods, keep_position=False)
+    root.update_idletasks()
+    metrics = {'render': elapsed_ms(start)}
+
+    times = []
+    for step in range(SCROLL_STEPS):
+        start = time.perf_counter()
+        frame.canvas.yview_moveto(step / SCROLL_STEPS)
+        frame._refresh_rows()
+        root.update_idletasks()
+        times.append(elapsed_ms(start))
+    metrics['scroll_p50'] = statistics.median(times)
+    metrics['scroll_p95'] = percentile(times, 0.95)
+    return metrics
+
+
+def compare(results, baseline, tolerance):
+    """
+    기준 결과와 비교
+
+    Returns:
+        list: 느려진 항목 설명
+    """
+    regressions = []
+    for size, metrics in results.items():
+        for name, value in metrics.items():
+            base = baseline.get(size, {}).get(name)
+            if base is None:
+                continue
+            if value > base * (1 + tolerance) and value - base > REGRESSION_FLOOR_MS:
+                regressions.append(f"{size}개 {name}: {base:.1f}ms -> {value:.1f}ms")
+    return regressions
+
+
+def print_table(results):
+    names = []
+    for metrics in results.values():
+        for name in metrics:
+            if name not in names:
+                names.append(name)
+    sizes = list(results)
+    print(f"{'항목':<20}" + ''.join(f"{size + '개':>12}" for size in sizes))
+    for name in names:
+        row = ''.join(
+            f"{results[size][name]:>12.2f}" if name in results[size] else f"{'-':>12}"
+            for size in sizes
+        )
+        print(f"{name:<20}{row}")
+
+
+def run(args):
+    workdir = tempfile.mkdtemp(prefix='chzzk_loadtest_')
+    channels = {make_channel_id(size): size for size in args.sizes}
+    server = FakeChzzkServer(vod_counts=channels, latency=args.latency / 1000).start()
+    # 측정 대상은 앱 코드이므로 가짜 서버에는 요청 속도 제한을 두지 않음
+    rate_limiter.configure(urlsplit(server.url).netloc, rate=1e9, burst=10 ** 9)
+
+    root = frame = None
+    if not args.no_render:
+        root, frame = open_render_window(os.path.join(workdir, 'render_thumbnails'))
+
+    results = {}
+    try:
+        for channel_id, size in channels.items():
+            cache_dir = os.path.join(workdir, str(size))
+            api = ChzzkAPI(cache_dir=cache_dir, base_url=server.api_base_url)
+            metrics = bench_list_load(api, server, channel_id)
+            vods = api.get_stored_vods(channel_id, page=0, size=size + NEW_VODS)
+            metrics.update(bench_search(api, channel_id, vods, args.repeat))
+            metrics.update(bench_thumbnails(vods, os.path.join(cache_dir, 'thumbnails')))
+            if frame is not None:
+                metrics.update(bench_render(root, frame, vods))
+            api.vod_index.close()
+            results[str(size)] = metrics
+            print(f"{size}개 완료")
+    finally:
+        if root is not None:
+            root.destroy()
+        server.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print()
+    print_table(results)
+    print(f"\n가짜 서버 요청: {server.stats}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록/검색/썸네일 부하 측정")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help='채널별 VOD 수')
+    parser.add_argument('--latency', type=float, default=0, metavar='MS', help='가짜 서버 응답 지연')
+    parser.add_argument('--repeat', type=int, default=10, help='검색 키워드별 반복 횟수')
+    parser.add_argument('--no-render', action='store_true', help='VODListFrame 렌더링 측정 생략')
+    parser.add_argument('--json', metavar='FILE', help='결과를 JSON으로 저장')
+    parser.add_argument('--baseline', metavar='FILE', help='기준 결과 JSON (느려진 항목이 있으면 종료 코드 1)')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='허용하는 느려짐 비율 (기본 0.25)')
+    args = parser.parse_args()
+
+    results = run(args)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+        print(f"결과 저장: {args.json}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\n기준보다 느려진 항목:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\n기준 대비 느려진 항목 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+한글 유틸리티
+초성 검색용 정규식 생성
+"""
+import re
+
+
+# 초성 (유니코드 호환 자모) 순서
+CHOSUNG_LIST = [
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ',
+    'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'
+]
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+# 초성 하나에 해당하는 음절 수 (중성 21 x 종성 28)
+SYLLABLES_PER_CHOSUNG = 21 * 28
+
+_CHOSUNG_INDEX = {ch: i for i, ch in enumerate(CHOSUNG_LIST)}
+
+
+def is_chosung(ch):
+    """초성 자모인지 확인"""
+    return ch in _CHOSUNG_INDEX
+
+
+def get_chosung(text):
+    """
+    문자열의 초성 추출
+
+    한글 음절은 초성으로 바꾸고, 나머지 문자는 그대로 둔다.
+    예: '마인크래프트' -> 'ㅁㅇㅋㄹㅍㅌ'
+    """
+    result = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            result.append(CHOSUNG_LIST[(code - HANGUL_BASE) // SYLLABLES_PER_CHOSUNG])
+        else:
+            result.append(ch)
+    return ''.join(result)
+
+
+def build_search_pattern(keyword):
+    """
+    검색어를 정규식으로 변환
+
+    초성 자모는 그 초성으로 시작하는 모든 음절과 일치하므로
+    'ㅁㅋ', '마ㅋ', '마크'가 모두 '마크 건축'과 일치한다.
+    대소문자는 구분하지 않는다.
+
+    Returns:
+        re.Pattern: 컴파일된 정규식
+    """
+    parts = []
+    for ch in keyword.lower():
+        index = _CHOSUNG_INDEX.get(ch)
+        if index is None:
+            parts.append(re.escape(ch))
+            continue
+        start = HANGUL_BASE + index * SYLLABLES_PER_CHOSUNG
+        end = start + SYLLABLES_PER_CHOSUNG - 1
+        parts.append(f'[{ch}{chr(start)}-{chr(end)}]')
+    return re.compile(''.join(parts))
@@ -1,12 +1,179 @@
 """
 로깅 유틸리티
+
+모든 스레드는 큐에 로그 레코드만 넣고, 실제 출력(콘솔/파일)은
+백그라운드 리스너 스레드 하나가 담당한다. 다운로드 진행률 콜백이나
+UI 스레드가 디스크 쓰기 때문에 멈추지 않는다.
 """
+import atexit
+import gzip
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import shutil
+import threading
+import time
 from datetime import datetime
 
 
-def setup_logger(name='chzzk_downloader', log_dir='logs'):
+LOGGER_NAME = 'chzzk_downloader'
+
+# 파일 로그 회전 (크기 또는 날짜가 바뀌면 회전, 이전 파일은 gzip 압축)
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 10
+
+# 샘플링된 로그 (extra={'sample': 키})는 키마다 이 간격에 한 번만 기록
+SAMPLE_INTERVAL = 5.0
+
+# 환경 변수
+# CHZZK_LOG_FORMAT=json                  파일 로그를 JSON Lines로 기록
+# CHZZK_LOG_LEVELS=core.downloader=WARNING,gui=DEBUG  모듈별 레벨
+ENV_LOG_FORMAT = 'CHZZK_LOG_FORMAT'
+ENV_LOG_LEVELS = 'CHZZK_LOG_LEVELS'
+
+_TEXT_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
+class JsonFormatter(logging.Formatter):
+    """JSON Lines 포맷터 (한 줄에 레코드 하나)"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if getattr(record, 'sample', None) is not None:
+            entry['sample'] = str(record.sample)
+            entry['suppressed'] = getattr(record, 'suppressed', 0)
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    반복 로그 샘플링 필터
+
+    extra={'sample': 키}가 붙은 레코드는 키마다 interval초에 한 번만 통과시키고,
+    그 사이 버려진 개수를 record.suppressed에 담는다. 키가 없는 레코드는 그대로 통과.
+    """
+
+    def __init__(self, interval=SAMPLE_INTERVAL, clock=time.monotonic):
+        super().__init__()
+        self.interval = interval
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._last = {}  # 키 -> (마지막 통과 시각, 버린 개수)
+
+    def filter(self, record):
+        key = getattr(record, 'sample', None)
+        if key is None:
+            return True
+
+        now = self.clock()
+        with self._lock:
+            last, suppressed = self._last.get(key, (None, 0))
+            if last is not None and now - last < self.interval:
+                self._last[key] = (last, suppressed + 1)
+                return False
+            self._last[key] = (now, 0)
+            # 오래된 키 정리
+            if len(self._last) > 1000:
+                cutoff = now - self.interval
+                self._last = {k: v for k, v in self._last.items() if v[0] >= cutoff}
+
+        record.suppressed = suppressed
+        return True
+
+
+class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """크기 또는 날짜 변경 시 회전하고 이전 파일을 gzip으로 압축하는 핸들러"""
+
+    def __init__(self, filename, max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT):
+        super().__init__(
+            filename,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding='utf-8'
+        )
+        self.namer = lambda name: f'{name}.gz'
+        self.rotator = self._compress
+        self._day = self._today()
+
+    def shouldRollover(self, record):
+        if self._today() != self._day:
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        self._day = self._today()
+        super().doRollover()
+
+    def _today(self):
+        return datetime.now().strftime('%Y%m%d')
+
+    @staticmethod
+    def _compress(source, dest):
+        with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+
+
+def parse_levels(text):
+    """'모듈=레벨,모듈=레벨' 형식을 딕셔너리로 변환"""
+    levels = {}
+    for item in text.split(','):
+        if '=' not in item:
+            continue
+        module, level = item.split('=', 1)
+        levels[module.strip()] = level.strip().upper()
+    return levels
+
+
+def set_levels(levels):
+    """
+    모듈별 로그 레벨 설정
+
+    Args:
+        levels: {모듈 이름: 레벨} (예: {'core.downloader': 'WARNING'})
+    """
+    for module, level in levels.items():
+        name = LOGGER_NAME if module in ('', LOGGER_NAME) else f'{LOGGER_NAME}.{module}'
+        try:
+            logging.getLogger(name).setLevel(level)
+        except (ValueError, TypeError):
+            logging.getLogger(LOGGER_NAME).warning(f"잘못된 로그 레벨 무시: {module}={level}")
+
+
+def set_file_format(fmt):
+    """파일 로그 형식 변경 ('text' 또는 'json')"""
+    formatter = JsonFormatter() if fmt == 'json' else _TEXT_FORMATTER
+    for handler in _file_handlers:
+        handler.setFormatter(formatter)
+
+
+def get_logger(module):
+    """
+    모듈별 로거 반환 (전역 로거의 하위 로거라 같은 핸들러로 출력)
+
+    Args:
+        module: 모듈 이름 (보통 __name__)
+    """
+    return logging.getLogger(f'{LOGGER_NAME}.{module}')
+
+
+_file_handlers = []
+
+
+def setup_logger(name=LOGGER_NAME, log_dir='logs'):
     """로거 설정"""
     # 로그 디렉토리 생성
     if not os.path.exists(log_dir):
@@ -20,28 +187,35 @@ def setup_logger(name='chzzk_downloader', log_dir='logs'):
     if logger.handlers:
         return logger
 
-    # 포맷터 생성
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-
     # 콘솔 핸들러
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(_TEXT_FORMATTER)
 
     # 파일 핸들러
-    log_filename = os.path.join(
-        log_dir,
-        f'chzzk_{datetime.now().strftime("%Y%m%d")}.log'
-    )
-    file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+    file_handler = CompressedRotatingFileHandler(os.path.join(log_dir, 'chzzk.log'))
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    _file_handlers.append(file_handler)
+    set_file_format(os.environ.get(ENV_LOG_FORMAT, 'text').lower())
+
+    # 호출한 스레드는 큐에 넣기만 하고, 출력은 리스너 스레드가 담당
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter())
+    logger.addHandler(queue_handler)
+    logger.propagate = False
+
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    # 종료 시 큐에 남은 로그까지 기록
+    atexit.register(listener.stop)
 
+    set_levels(parse_levels(os.environ.get(ENV_LOG_LEVELS, '')))
     return logger
 
 
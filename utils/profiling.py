@@ -0,0 +1,261 @@
+"""
+실행 중 프로파일링
+일정 시간 동안 cProfile/tracemalloc을 켜고, 다운로드 워커 스레드의 스택을 표본 수집하여
+logs 폴더에 결과 저장 (디버그 버튼, SIGUSR1, --profile 옵션으로 사용)
+"""
+import cProfile
+import io
+import os
+import pstats
+import signal
+import sys
+import threading
+import time
+import traceback
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# 기본 측정 시간 (초)
+DEFAULT_WINDOW_SECONDS = 30
+# 스택 표본 수집 간격 (초)
+STACK_SAMPLE_INTERVAL = 0.05
+# 보고서에 남길 항목 수
+TOP_FUNCTIONS = 50
+TOP_ALLOCATIONS = 30
+TOP_STACKS = 30
+# tracemalloc이 보관할 호출 깊이
+TRACEMALLOC_FRAMES = 10
+
+
+def dump_thread_stacks(thread_prefix=None):
+    """
+    현재 스레드 스택을 문자열로 변환
+
+    Args:
+        thread_prefix: 이 이름으로 시작하는 스레드만 (None이면 전체)
+    """
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    lines = []
+    for ident, frame in sys._current_frames().items():
+        name = names.get(ident, f'Thread-{ident}')
+        if thread_prefix and not name.startswith(thread_prefix):
+            continue
+        lines.append(f'--- {name} ({ident}) ---')
+        lines.extend(line.rstrip() for line in traceback.format_stack(frame))
+        lines.append('')
+    return '\n'.join(lines)
+
+
+class StackSampler:
+    """지정한 스레드들의 스택을 주기적으로 수집하여 자주 보이는 스택 집계"""
+
+    def __init__(self, thread_prefix, interval=STACK_SAMPLE_INTERVAL):
+        self.thread_prefix = thread_prefix
+        self.interval = interval
+        self.samples = 0
+        self.stacks = Counter()  # (함수 경로) -> 표본 수
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """수집 시작"""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="StackSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """수집 중지"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if not names.get(ident, '').startswith(self.thread_prefix):
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f'{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}')
+                    frame = frame.f_back
+                self.stacks[';'.join(reversed(stack))] += 1
+            self.samples += 1
+
+    def report(self):
+        """집계 결과 (호출 경로별 표본 비율)"""
+        lines = [f'표본 {self.samples}회 (간격 {self.interval * 1000:.0f}ms, 스레드 {self.thread_prefix}*)', '']
+        total = sum(self.stacks.values()) or 1
+        for stack, count in self.stacks.most_common(TOP_STACKS):
+            lines.append(f'{count:6d} ({count / total * 100:5.1f}%)  {stack}')
+        return '\n'.join(lines)
+
+
+class ProfilingSession:
+    """
+    프로파일링 세션
+
+    cProfile은 start()를 호출한 스레드(GUI에서는 UI 스레드)만 측정하므로
+    stop()도 같은 스레드에서 호출해야 한다. 워커 스레드는 스택 표본으로 측정한다.
+    """
+
+    def __init__(self, output_dir='logs', thread_prefix='Downloader'):
+        self.output_dir = output_dir
+        self.thread_prefix = thread_prefix
+        self.listeners = []  # 상태가 바뀌면 호출 (인자: 측정 중 여부)
+
+        self._profiler = None
+        self._sampler = None
+        self._snapshot = None
+        self._started_tracemalloc = False
+        self._deadline = None
+        self._timer_job = None
+        self._schedule_cancel = None
+        self._label = ''
+
+    @property
+    def is_active(self):
+        return self._profiler is not None
+
+    def start(self, seconds=DEFAULT_WINDOW_SECONDS, schedule=None, cancel=None):
+        """
+        측정 시작
+
+        Args:
+            seconds: 측정 시간 (None이면 stop() 호출까지)
+            schedule: (밀리초, 함수)로 나중에 실행할 함수 (Tk의 after). 없으면 poll()로 종료
+            cancel: schedule이 돌려준 작업을 취소하는 함수 (Tk의 after_cancel)
+        """
+        if self.is_active:
+            return
+
+        self._label = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._started_tracemalloc = True
+        self._snapshot = tracemalloc.take_snapshot()
+
+        self._sampler = StackSampler(self.thread_prefix)
+        self._sampler.start()
+
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+        self._deadline = time.monotonic() + seconds if seconds else None
+        if seconds and schedule:
+            self._timer_job = schedule(int(seconds * 1000), self.stop)
+            self._schedule_cancel = cancel
+
+        logger.info(f"프로파일링 시작 ({seconds or '수동 종료'}초)")
+        self._notify()
+
+    def stop(self):
+        """
+        측정 종료 후 결과 저장
+
+        Returns:
+            list: 저장한 파일 경로
+        """
+        if not self.is_active:
+            return []
+
+        self._profiler.disable()
+        profiler, self._profiler = self._profiler, None
+        if self._timer_job is not None and self._schedule_cancel:
+            self._schedule_cancel(self._timer_job)
+        self._timer_job = None
+        self._deadline = None
+
+        self._sampler.stop()
+        current = tracemalloc.take_snapshot()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+        if not os.path.exists(self.output_dir):
+            os.makedirs(self.output_dir)
+        base = os.path.join(self.output_dir, f'profile_{self._label}')
+        paths = []
+        try:
+            profiler.dump_stats(f'{base}.pstats')
+            paths.append(f'{base}.pstats')
+            paths.append(self._write(f'{base}_cpu.txt', self._cpu_report(profiler)))
+            paths.append(self._write(f'{base}_alloc.txt', self._alloc_report(current)))
+            stacks = self._sampler.report() + '\n\n현재 스택\n\n' + dump_thread_stacks(self.thread_prefix)
+            paths.append(self._write(f'{base}_stacks.txt', stacks))
+            logger.info(f"프로파일링 결과 저장: {', '.join(paths)}")
+        except OSError as e:
+            logger.error(f"프로파일링 결과 저장 실패: {e}")
+
+        self._sampler = None
+        self._snapshot = None
+        self._notify()
+        return paths
+
+    def toggle(self, seconds=DEFAULT_WINDOW_SECONDS, schedule=None, cancel=None):
+        """측정 중이면 종료, 아니면 시작"""
+        if self.is_active:
+            self.stop()
+        else:
+            self.start(seconds, schedule, cancel)
+
+    def poll(self):
+        """측정 시간이 지났으면 종료 (schedule 없이 시작한 경우 주기적으로 호출)"""
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            self.stop()
+
+    def _notify(self):
+        for listener in self.listeners:
+            try:
+                listener(self.is_active)
+            except Exception as e:
+                logger.error(f"프로파일링 상태 알림 오류: {e}")
+
+    def _cpu_report(self, profiler):
+        stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stream)
+        stats.sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+        return stream.getvalue()
+
+    def _alloc_report(self, current):
+        lines = ['측정 구간 동안 늘어난 메모리 (파일:줄 기준)', '']
+        for stat in current.compare_to(self._snapshot, 'lineno')[:TOP_ALLOCATIONS]:
+            lines.append(str(stat))
+        lines.extend(['', '현재 메모리 사용 상위', ''])
+        for stat in current.statistics('lineno')[:TOP_ALLOCATIONS]:
+            lines.append(str(stat))
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _write(path, text):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+
+def install_signal_handler(session, seconds=DEFAULT_WINDOW_SECONDS, schedule=None, cancel=None):
+    """
+    SIGUSR1로 프로파일링 켜고 끄기 (SIGUSR1이 없는 Windows에서는 무시)
+
+    Returns:
+        bool: 설치 여부
+    """
+    if not hasattr(signal, 'SIGUSR1'):
+        return False
+
+    def handler(signum, frame):
+        session.toggle(seconds, schedule, cancel)
+
+    signal.signal(signal.SIGUSR1, handler)
+    logger.info(f"프로파일링 신호 대기: kill -USR1 {os.getpid()}")
+    return True
+
+
+# 전역 프로파일링 세션
+profiling_session = ProfilingSession()
@@ -0,0 +1,74 @@
+"""
+시작 시간 측정 유틸리티
+--profile-startup 옵션으로 import/초기화 단계별 시간 기록
+"""
+import time
+from contextlib import contextmanager
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# 창이 뜨기까지 목표 시간 (밀리초)
+DEFAULT_BUDGET_MS = 1500
+
+
+class StartupProfiler:
+    """시작 단계별 시간 측정 클래스"""
+
+    def __init__(self):
+        self.enabled = False
+        self.budget_ms = DEFAULT_BUDGET_MS
+        self.start_time = time.perf_counter()
+        self.records = []  # (이름, 시작 ms, 소요 ms)
+
+    def enable(self, budget_ms=DEFAULT_BUDGET_MS):
+        """측정 시작"""
+        self.enabled = True
+        self.budget_ms = budget_ms
+
+    @contextmanager
+    def measure(self, name):
+        """구간 시간 측정"""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            ended = time.perf_counter()
+            self.records.append((
+                name,
+                (started - self.start_time) * 1000,
+                (ended - started) * 1000
+            ))
+
+    def mark(self, name):
+        """시점 기록"""
+        if not self.enabled:
+            return
+        now = (time.perf_counter() - self.start_time) * 1000
+        self.records.append((name, now, 0.0))
+
+    def report(self):
+        """측정 결과를 로그로 출력"""
+        if not self.enabled:
+            return
+
+        total = (time.perf_counter() - self.start_time) * 1000
+        logger.info("시작 시간 측정 결과:")
+        for name, at, elapsed in self.records:
+            if elapsed:
+                logger.info(f"  {at:8.1f}ms  +{elapsed:7.1f}ms  {name}")
+            else:
+                logger.info(f"  {at:8.1f}ms  {'':9}  {name}")
+
+        if total > self.budget_ms:
+            logger.warning(f"시작 시간 {total:.0f}ms (목표 {self.budget_ms}ms 초과)")
+        else:
+            logger.info(f"시작 시간 {total:.0f}ms (목표 {self.budget_ms}ms 이내)")
+
+
+# 전역 인스턴스
+startup_profiler = StartupProfiler()
@@ -0,0 +1,191 @@
+"""
+실행 추적
+다운로드/API 단계별 구간을 기록하여 Chrome trace-event JSON으로 저장
+(chrome://tracing 또는 https://ui.perfetto.dev 에서 열기)
+
+꺼져 있을 때는 span()이 공용 no-op 객체를 돌려주므로 비용이 거의 없다.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# 메모리에 보관할 최대 이벤트 수 (넘으면 오래된 것부터 버림)
+MAX_EVENTS = 200000
+
+
+class _NullSpan:
+    """추적이 꺼져 있을 때 사용하는 구간"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """완료 이벤트('X') 하나를 기록하는 구간"""
+
+    __slots__ = ('tracer', 'name', 'cat', 'args', 'start')
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer.complete(self.name, self.start, time.perf_counter(), self.cat, **self.args)
+        return False
+
+    def set(self, **args):
+        """구간이 끝나기 전에 인자 추가"""
+        self.args.update(args)
+
+
+class Tracer:
+    """추적 이벤트 수집 클래스"""
+
+    def __init__(self, max_events=MAX_EVENTS):
+        self.enabled = False
+        self._events = deque(maxlen=max_events)
+        self._thread_names = {}  # tid -> 스레드 이름
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+
+    def enable(self):
+        """추적 시작"""
+        self._origin = time.perf_counter()
+        self.enabled = True
+        logger.info("실행 추적 시작")
+
+    def disable(self):
+        """추적 중지 (수집한 이벤트는 유지)"""
+        self.enabled = False
+
+    def now(self):
+        """현재 시각 (complete()에 넘길 값)"""
+        return time.perf_counter()
+
+    def span(self, name, cat='app', **args):
+        """
+        구간 기록
+
+        사용 예:
+            with tracer.span('extract_info', cat='download', url=url):
+                ...
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat, args)
+
+    def complete(self, name, start, end, cat='app', **args):
+        """이미 끝난 구간 기록 (now()로 잰 시작/끝 시각)"""
+        if not self.enabled:
+            return
+        self._append({
+            'name': name, 'cat': cat, 'ph': 'X',
+            'ts': self._micros(start), 'dur': max(0.0, (end - start) * 1e6),
+            'args': args,
+        })
+
+    def async_begin(self, name, span_id, cat='task', **args):
+        """여러 스레드에 걸친 구간 시작 (같은 span_id끼리 한 줄에 표시)"""
+        if not self.enabled:
+            return
+        self._append({
+            'name': name, 'cat': cat, 'ph': 'b', 'id': span_id,
+            'ts': self._micros(time.perf_counter()), 'args': args,
+        })
+
+    def async_end(self, name, span_id, cat='task', **args):
+        """여러 스레드에 걸친 구간 종료"""
+        if not self.enabled:
+            return
+        self._append({
+            'name': name, 'cat': cat, 'ph': 'e', 'id': span_id,
+            'ts': self._micros(time.perf_counter()), 'args': args,
+        })
+
+    def instant(self, name, cat='app', **args):
+        """시점 기록"""
+        if not self.enabled:
+            return
+        self._append({
+            'name': name, 'cat': cat, 'ph': 'i', 's': 't',
+            'ts': self._micros(time.perf_counter()), 'args': args,
+        })
+
+    def export(self, path):
+        """
+        Chrome trace-event JSON으로 저장
+
+        Returns:
+            int: 저장한 이벤트 수
+        """
+        events = list(self._events)
+        metadata = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': tid, 'args': {'name': name}}
+            for tid, name in list(self._thread_names.items())
+        ]
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        logger.info(f"실행 추적 저장: {path} (이벤트 {len(events)}개)")
+        return len(events)
+
+    def clear(self):
+        """수집한 이벤트 삭제"""
+        self._events.clear()
+
+    def _micros(self, timestamp):
+        return (timestamp - self._origin) * 1e6
+
+    def _append(self, event):
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        event['pid'] = self._pid
+        event['tid'] = tid
+        self._events.append(event)
+
+
+# 전역 추적기 (--trace 옵션으로 켜짐)
+tracer = Tracer()
+
+
+def traced(name, cat='app'):
+    """함수 전체를 구간으로 기록하는 데코레이터 (꺼져 있으면 바로 호출)"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return fn(*args, **kwargs)
+            with tracer.span(name, cat):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -73,3 +73,40 @@ def extract_video_id(url):
     if match:
         return match.group(1)
     return None
+
+
+# 채널 ID가 아닌 치지직 경로
+RESERVED_PATHS = {'video', 'videos', 'live', 'lives', 'search', 'category', 'clips', 'following'}
+
+_CHZZK_URL_PATTERN = re.compile(
+    r'https?://(?:www\.|m\.)?chzzk\.naver\.com/(?:(video|live)/)?([a-zA-Z0-9_-]+)/?(?:[?#].*)?$'
+)
+
+
+def normalize_chzzk_url(url):
+    """
+    치지직 URL 정규화
+
+    앞뒤 공백/따옴표, 프로토콜 생략, www./m. 접두사, 쿼리 문자열을 정리하여
+    같은 VOD/채널은 항상 같은 URL이 되도록 한다.
+
+    Returns:
+        tuple: ('video', 비디오 ID, URL) 또는 ('channel', 채널 ID, URL)
+        None: 치지직 VOD/채널 URL이 아닌 경우
+    """
+    url = url.strip().strip('<>"\'')
+    if not url:
+        return None
+    if not re.match(r'https?://', url, re.IGNORECASE):
+        url = f'https://{url}'
+
+    match = _CHZZK_URL_PATTERN.match(url)
+    if not match:
+        return None
+
+    kind, item_id = match.groups()
+    if kind == 'video':
+        return 'video', item_id, f'https://chzzk.naver.com/video/{item_id}'
+    if kind is None and item_id in RESERVED_PATHS:
+        return None
+    return 'channel', item_id, f'https://chzzk.naver.com/{item_id}'
@@ -4,9 +4,11 @@ GitHub Releases를 통한 업데이트 확인
 """
 import requests
 from packaging import version
-from utils.logger import logger
+from utils.logger import get_logger
 
 
+logger = get_logger(__name__)
+
 # 현재 버전
 CURRENT_VERSION = "1.0.0"
 